@@ -2,7 +2,6 @@
 Şifre Doğrulama Sistemi
 Google Sheets'ten şifre okur ve doğrular
 """
-import requests
 import csv
 from io import StringIO
 from utils import Colors, print_success, print_error, print_warning, print_info
@@ -23,6 +22,9 @@ def get_password_from_sheet():
     Returns:
         str or None: Şifre veya None (hata durumunda)
     """
+    # requests giriş ekranı çizildikten sonra yüklenir (açılış süresi)
+    import requests
+    
     try:
         response = requests.get(CSV_URL, timeout=10)
         
@@ -0,0 +1,188 @@
+"""
+Tarayıcı Profili A/B Benchmark
+Bershka ve H&M arama sayfalarını önce standart Chrome ayarlarıyla, sonra hafif profille
+(görseller kapalı + CDP ile engellenen görsel/yazı tipi/medya/analitik istekleri) açar ve
+sayfa başına süre, indirilen kaynak, JS heap ve Chrome bellek kullanımını karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_browser_profile.py [--bershka 2104644040 ...] [--hm 1296051002 ...]
+                                               [--profiles standard lean] [--output sonuc.json]
+
+Canlı sitelere bağlanır; ChromeDriver gerekir. Chrome bellek ölçümü için psutil kuruluysa
+kullanılır, yoksa yalnızca JS heap raporlanır. Her profil yeni bir tarayıcıyla başlar ve ilk
+sayfa (ısınma) ayrı raporlanır; kalıcı profil kullanılmaz. Barkodun bulunup bulunmaması önemli değildir - ölçülen
+sayfa yüküdür.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from scrapers import bershka_scraper, hm_scraper, page_readiness
+from scrapers.browser_watchdog import chrome_rss_mb
+from scrapers.driver_manager import DriverManager
+
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+DEFAULT_BERSHKA = ["2104644040", "2104644041", "0369498800", "5201318440", "1304450800"]
+DEFAULT_HM = ["1296051002", "1188865002", "1201234001", "1231555001", "1174525002"]
+PROFILES = {'standard': False, 'lean': True}
+
+# Sayfanın indirdiği kaynaklar ve JS heap (Resource Timing + Chrome'a özel performance.memory)
+PAGE_METRICS_JS = """
+const resources = performance.getEntriesByType('resource');
+let bytes = 0;
+for (const r of resources) bytes += r.transferSize || 0;
+const nav = performance.getEntriesByType('navigation')[0];
+if (nav) bytes += nav.transferSize || 0;
+return {
+    resources: resources.length,
+    bytes: bytes,
+    heap: performance.memory ? performance.memory.usedJSHeapSize : 0
+};
+"""
+
+
+def load_pages(driver_manager, brand, barcodes):
+    """
+    Barkodların arama sayfalarını sırayla açar ve sayfa başına ölçümleri toplar
+    
+    Returns:
+        list: Her sayfa için {barcode, seconds, found, resources, kb, heap_mb}
+    """
+    samples = []
+    for barcode in barcodes:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            try:
+                if brand == 'BERSHKA':
+                    url, _ = bershka_scraper.process_barcode(barcode)
+                    name = bershka_scraper.get_product_name_selenium(driver_manager, url)
+                else:
+                    name = hm_scraper.get_product_name_selenium(driver_manager, barcode)
+            except page_readiness.PageNotReadyError:
+                name = None
+        seconds = time.perf_counter() - start
+        
+        metrics = driver_manager.get_driver().execute_script(PAGE_METRICS_JS) or {}
+        samples.append({
+            "barcode": barcode,
+            "seconds": round(seconds, 3),
+            "found": name is not None,
+            "resources": metrics.get("resources", 0),
+            "kb": round(metrics.get("bytes", 0) / 1024, 1),
+            "heap_mb": round(metrics.get("heap", 0) / (1024 * 1024), 1),
+        })
+    return samples
+
+
+def summarize(profile, brand, samples, rss_mb):
+    """İlk sayfa hariç sayfa başına ortalama ve yüzdelik değerleri çıkarır"""
+    warm = samples[1:] or samples
+    seconds = sorted(sample["seconds"] for sample in warm)
+    return {
+        "profile": profile,
+        "brand": brand,
+        "pages": len(samples),
+        "first_page_s": samples[0]["seconds"],
+        "p50_s": round(statistics.median(seconds), 3),
+        "p95_s": round(page_readiness.percentile(seconds, 95), 3),
+        "resources_per_page": round(statistics.mean(sample["resources"] for sample in warm), 1),
+        "kb_per_page": round(statistics.mean(sample["kb"] for sample in warm), 1),
+        "heap_mb": max(sample["heap_mb"] for sample in samples),
+        "chrome_rss_mb": None if rss_mb is None else round(rss_mb, 1),
+        "samples": samples,
+    }
+
+
+def run_profile(profile, inputs):
+    """Tek bir profil için yeni tarayıcı açar ve iki markayı ölçer"""
+    driver_manager = DriverManager(lean=PROFILES[profile], persistent=False)
+    driver_manager.get_driver()
+    results = []
+    try:
+        for brand, barcodes in inputs.items():
+            samples = load_pages(driver_manager, brand, barcodes)
+            results.append(summarize(profile, brand, samples, chrome_rss_mb(driver_manager.get_driver())))
+    finally:
+        driver_manager.quit()
+    return results
+
+
+def change(before, after):
+    """Yüzde değişim metni (-%45 gibi)"""
+    if not before or after is None:
+        return "-"
+    return f"{(after - before) / before * 100:+.0f}%"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tarayıcı profili A/B benchmark")
+    parser.add_argument("--bershka", nargs="*", default=DEFAULT_BERSHKA, help="Bershka barkodları (10 hane)")
+    parser.add_argument("--hm", nargs="*", default=DEFAULT_HM, help="H&M barkodları (10 karakter)")
+    parser.add_argument("--profiles", nargs="+", choices=list(PROFILES), default=list(PROFILES),
+                        help="Ölçülecek profiller (sırayla)")
+    parser.add_argument("--output", help="JSON çıktı dosyası (varsayılan: benchmarks/results/browser_profile_<zaman>.json)")
+    args = parser.parse_args()
+    
+    inputs = {}
+    if args.bershka:
+        inputs['BERSHKA'] = args.bershka
+    if args.hm:
+        inputs['H&M'] = args.hm
+    
+    # Hazır olma süreleri gerçek log dosyasına karışmasın
+    page_readiness.get_readiness_recorder().log_file = os.path.join(
+        RESULTS_DIR, "bench_readiness_times.jsonl"
+    )
+    
+    results = []
+    for profile in args.profiles:
+        print(f"▶ {profile} profili ölçülüyor...")
+        try:
+            results.extend(run_profile(profile, inputs))
+        except Exception as e:
+            reason = str(e).strip().splitlines()[0] if str(e).strip() else type(e).__name__
+            print(f"❌ Tarayıcı başlatılamadı: {reason}")
+            sys.exit(1)
+    
+    print(f"\n{'Profil':<10}{'Marka':<9}{'İlk':>8}{'p50':>8}{'p95':>8}{'Kaynak':>8}{'KB':>9}{'Heap':>8}{'RSS':>9}")
+    print("─" * 77)
+    for entry in results:
+        rss = "-" if entry["chrome_rss_mb"] is None else f"{entry['chrome_rss_mb']:.0f}MB"
+        print(f"{entry['profile']:<10}{entry['brand']:<9}{entry['first_page_s']:>7.2f}s"
+              f"{entry['p50_s']:>7.2f}s{entry['p95_s']:>7.2f}s{entry['resources_per_page']:>8.0f}"
+              f"{entry['kb_per_page']:>9.0f}{entry['heap_mb']:>6.0f}MB{rss:>9}")
+    
+    # Hafif profilin standart profile göre değişimi
+    by_key = {(entry["profile"], entry["brand"]): entry for entry in results}
+    for brand in inputs:
+        before = by_key.get(('standard', brand))
+        after = by_key.get(('lean', brand))
+        if before and after:
+            print(f"\n{brand}: p50 {change(before['p50_s'], after['p50_s'])}, "
+                  f"KB/sayfa {change(before['kb_per_page'], after['kb_per_page'])}, "
+                  f"kaynak/sayfa {change(before['resources_per_page'], after['resources_per_page'])}, "
+                  f"RSS {change(before['chrome_rss_mb'], after['chrome_rss_mb'])}")
+    
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"browser_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({"time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "results": results},
+                  f, ensure_ascii=False, indent=2)
+    print(f"\n💾 Sonuçlar: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Excel Kayıt Benchmark
+Eski yöntem (tüm xlsx'i openpyxl ile okuyup xlsxwriter ile baştan yazma) ile
+excel_manager.py'deki satır dosyasına ekleme + arka planda constant_memory xlsx üretimini karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_excel.py [--rows 1000 10000 100000] [--batch 20]
+
+Her boyut için günün dosyasında o kadar satır varken bir toplu aramanın (--batch satır)
+kaydedilmesi ölçülür. Ölçümler geçici bir klasörde yapılır, outputs/ klasörüne dokunulmaz.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import xlsxwriter
+import excel_manager
+from excel_manager import ExcelManager, export_rows_to_excel, wait_for_export
+
+
+def make_rows(count, start=0):
+    """Sahte (barkod, ürün_adı) satırları üretir"""
+    return [(f"{4813858700 + i}", f"Keten Gömlek Regular Fit {i}") for i in range(start, start + count)]
+
+
+def legacy_save(manager, new_rows):
+    """Eski yöntem: mevcut dosyayı oku, tüm satırları baştan yaz"""
+    existing = (manager._read_existing_excel() or []) if os.path.exists(manager.filename) else []
+    all_products = existing + [{'barkod': b, 'urun_adi': n, 'brand': 'ZARA'} for b, n in new_rows]
+    
+    workbook = xlsxwriter.Workbook(manager.filename)
+    worksheet = workbook.add_worksheet('Ürünler')
+    worksheet.write(0, 0, 'Barkod')
+    worksheet.write(0, 1, 'Ürün Adı')
+    for row, product in enumerate(all_products, start=1):
+        worksheet.write(row, 0, product['barkod'])
+        worksheet.write(row, 1, f"{product['brand']} {product['urun_adi']}")
+    workbook.close()
+
+
+def seed_day(manager, count):
+    """Günün dosyalarını verilen satır sayısıyla hazırlar"""
+    manager.add_products(make_rows(count), 'ZARA')
+    manager._append_rows()
+    export_rows_to_excel(manager.rows_file, manager.filename)
+
+
+def measure(label, func):
+    """Fonksiyonun süresini ve Python bellek tepesini ölçer"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"label": label, "seconds": elapsed, "peak_mb": peak / 1024 / 1024}
+
+
+def run_size(count, batch):
+    """Tek bir gün boyutu için eski ve yeni kayıt yolunu ölçer"""
+    new_rows = make_rows(batch, start=count)
+    results = []
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            manager = ExcelManager()
+            seed_day(manager, count)
+            results.append(measure("eski (oku + yeniden yaz)", lambda: legacy_save(manager, new_rows)))
+            
+            os.remove(manager.filename)
+            os.remove(manager.rows_file)
+            manager = ExcelManager()
+            seed_day(manager, count)
+            
+            def incremental_save():
+                manager.add_products(new_rows, 'ZARA')
+                manager.save_to_excel()
+            
+            results.append(measure("yeni (ön plan: ekleme)", incremental_save))
+            results.append(measure("yeni (arka plan: xlsx)", wait_for_export))
+            results.append(measure("yeni (tam xlsx üretimi)",
+                                   lambda: export_rows_to_excel(manager.rows_file, manager.filename)))
+        finally:
+            os.chdir(cwd)
+    
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Excel kayıt benchmark")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Günün dosyasındaki mevcut satır sayıları")
+    parser.add_argument("--batch", type=int, default=20, help="Kaydedilen yeni satır sayısı")
+    args = parser.parse_args()
+    
+    print(f"\n{'Satır':>8}  {'Yöntem':<28}{'Süre':>12}{'Python tepe':>16}")
+    print("─" * 66)
+    for count in args.rows:
+        for entry in run_size(count, args.batch):
+            print(f"{count:>8}  {entry['label']:<28}{entry['seconds'] * 1000:>9.1f} ms{entry['peak_mb']:>13.1f} MB")
+        print()
+    
+    print("Not: 'arka plan' satırı, ön plan kaydından sonra kalan xlsx üretiminin beklenme süresidir;")
+    print("     kullanıcı bu süreyi sadece Excel dosyasını açarken veya çıkışta bekler.")
+    if excel_manager._last_export_error:
+        print(f"⚠️  Arka plan hatası: {excel_manager._last_export_error}")
+
+
+if __name__ == "__main__":
+    main()
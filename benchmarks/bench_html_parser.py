@@ -0,0 +1,163 @@
+"""
+HTML Ayrıştırıcı Mikro Benchmark
+Kaydedilmiş Mango/Mavi sayfaları üzerinde eski tam BeautifulSoup ayrıştırması ile
+scrapers/html_parser.py arka uçlarını (lxml, soup) karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_html_parser.py [sayfa.html | klasör ...] [--repeat 20]
+
+Sayfa verilmezse benchmarks/pages/ klasörü, o da yoksa sentetik büyük sayfalar kullanılır.
+"""
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from scrapers.html_parser import parse_html, HAS_LXML
+from scrapers.mango_scraper import extract_product_name_from_product_page, extract_product_name_from_search_page
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+DEFAULT_PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pages")
+
+
+def build_synthetic_pages():
+    """Gerçek sayfa boyutlarına yakın sentetik ürün ve arama sayfaları üretir"""
+    filler = "".join(
+        f'<div class="grid-item c{i}"><span class="price">{i},99 TL</span>'
+        f'<img src="/img/{i}.jpg" alt="ürün {i}"><p class="desc">Açıklama metni {i}</p></div>'
+        for i in range(6000)
+    )
+    script = "<script>window.__STATE__=" + json.dumps({"items": list(range(40000))}) + "</script>"
+    head = ('<head><meta charset="utf-8"><meta property="og:title" content="Keten Gömlek Regular Fit">'
+            '<meta itemprop="name" content="Keten Gömlek Regular Fit"><title>Mango</title></head>')
+    
+    product = f'<html>{head}<body>{script}<h1 class="ProductDetail_title__x1">Keten Gömlek Regular Fit</h1>{filler}</body></html>'
+    search = (f'<html>{head}<body>{script}{filler}'
+              '<p class="ProductTitle_productTitle__abc">Keten Gömlek Regular Fit</p>'
+              '<a class="product-card-info" title="Jake Slim Fit Jean" href="/p/1">x</a></body></html>')
+    return {"synthetic_product.html": product, "synthetic_search.html": search}
+
+
+def load_pages(paths):
+    """Dosya/klasör yollarından HTML sayfalarını okur"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, "*.html"))))
+        elif os.path.isfile(path):
+            files.append(path)
+    
+    pages = {}
+    for file_path in files:
+        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+            pages[os.path.basename(file_path)] = f.read()
+    return pages
+
+
+def extract_legacy(html):
+    """Eski yöntem: tam BeautifulSoup ağacı + get_text()"""
+    soup = BeautifulSoup(html, 'html.parser')
+    h1 = soup.find('h1')
+    title = h1.get_text().strip() if h1 else None
+    no_results = 'Sonuç bulunamadı' in soup.get_text()
+    product_title = soup.find('p', class_=lambda x: x and 'ProductTitle_productTitle' in x)
+    link = soup.find('a', class_='product-card-info')
+    og_title = soup.find('meta', property='og:title')
+    return title, no_results, product_title is not None, link.get('title') if link else None, og_title is not None
+
+
+def extract_with_backend(html, backend):
+    """Yeni katman: scraper'ların kullandığı sorguların aynısı"""
+    doc = parse_html(html, backend=backend)
+    return (
+        extract_product_name_from_product_page(doc),
+        extract_product_name_from_search_page(doc, "https://shop.mango.com/tr/tr/search/kadin", True),
+        doc.find_attr('a', 'title', class_name='product-card-info'),
+    )
+
+
+def run_backend(backend, pages, repeat):
+    """Bir arka ucu tüm sayfalarda ölçer (ayrı süreçte çalışır)"""
+    extract = extract_legacy if backend == 'legacy' else (lambda html: extract_with_backend(html, backend))
+    results = {}
+    
+    for name, html in pages.items():
+        extract(html)  # ısınma
+        
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            extract(html)
+            timings.append(time.perf_counter() - start)
+        
+        tracemalloc.start()
+        extract(html)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        results[name] = {
+            "median_ms": statistics.median(timings) * 1000,
+            "python_peak_kb": peak / 1024,
+        }
+    
+    max_rss_kb = None
+    if resource is not None:
+        max_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            max_rss_kb /= 1024
+    return results, max_rss_kb
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML ayrıştırıcı mikro benchmark")
+    parser.add_argument("paths", nargs="*", help="Kaydedilmiş HTML dosyaları veya klasörler")
+    parser.add_argument("--repeat", type=int, default=20, help="Sayfa başına tekrar sayısı")
+    args = parser.parse_args()
+    
+    pages = load_pages(args.paths or [DEFAULT_PAGES_DIR])
+    if not pages:
+        print("ℹ️  Kaydedilmiş sayfa bulunamadı, sentetik sayfalar kullanılıyor.")
+        pages = build_synthetic_pages()
+    
+    backends = ['legacy', 'soup'] + (['lxml'] if HAS_LXML else [])
+    
+    # Her arka uç kendi sürecinde ölçülür ki bellek tepe değerleri birbirini etkilemesin
+    measurements = {}
+    for backend in backends:
+        with multiprocessing.Pool(1) as pool:
+            measurements[backend] = pool.apply(run_backend, (backend, pages, args.repeat))
+    
+    print(f"\n{'Sayfa':<28}{'Arka uç':<10}{'Medyan':>12}{'Python tepe':>16}{'Hızlanma':>11}")
+    print("─" * 77)
+    for name, html in pages.items():
+        legacy_ms = measurements['legacy'][0][name]["median_ms"]
+        for backend in backends:
+            entry = measurements[backend][0][name]
+            speedup = legacy_ms / entry["median_ms"] if entry["median_ms"] else 0
+            print(f"{name[:27]:<28}{backend:<10}{entry['median_ms']:>9.2f} ms"
+                  f"{entry['python_peak_kb']:>13.0f} KB{speedup:>10.1f}x")
+        print(f"{'':<28}({len(html) / 1024:.0f} KB HTML)")
+    
+    rss = {backend: measurements[backend][1] for backend in backends}
+    if all(value is not None for value in rss.values()):
+        print("\nSüreç tepe RSS (lxml'in C belleği dahil):")
+        for backend, value in rss.items():
+            print(f"  {backend:<8}: {value / 1024:.1f} MB")
+    print("\nNot: 'Python tepe' sadece Python nesnelerini ölçer; lxml ağacı C tarafında tutulur.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,476 @@
+"""
+Çevrimdışı Tekrar Oynatma Benchmark
+Kaydedilmiş yanıtları (benchmarks/fixtures/) yerel bir HTTP sunucusundan sunar ve
+marka modüllerini canlı sitelere gitmeden ölçer:
+
+- Ağ yolları: Zara API, Bershka API (BERSHKA_API bayrağından bağımsız), Mango (paralel aday
+  URL'ler), Mavi (senkron + async) her biri farklı eşzamanlılık seviyelerinde - barkod başına
+  gecikme ve saniyedeki barkod
+- Tarayıcı yolları: Bershka/H&M işlenmiş sayfaları (tek sekme ve sekme havuzu - ChromeDriver
+  varsa, tek tarayıcı)
+- Saf fonksiyonlar: barkod işleme, giriş algılama, HTML çıkarma, satır ayrıştırma
+
+Sonuçlar JSON olarak yazılır; --baseline ile önceki bir sonuçla karşılaştırılıp
+gerileme varsa çıkış kodu 1 döner.
+
+Kullanım:
+    python benchmarks/bench_replay.py [--count 40] [--concurrency 1 4 8] [--latency-ms 40]
+                                      [--tabs 3] [--output sonuc.json] [--baseline onceki.json]
+
+Fixture dosyalarındaki {barcode} ifadesi istekteki barkodla değiştirilir. Son hanesi çift
+olan barkodlar "bulundu", tek olanlar "bulunamadı" yanıtı alır.
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, unquote
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+import excel_manager
+import lookup_timings
+from scrapers import bershka_scraper, hm_scraper, mango_scraper, mavi_scraper, zara_scraper
+from scrapers import cookie_store, mixed_scraper, page_readiness, tab_pool
+from scrapers.host_limiter import get_limiter_states
+from scrapers.html_parser import parse_html, PARSER_BACKEND
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+DEFAULT_COUNT = 40
+DEFAULT_CONCURRENCY = [1, 4, 8]
+DEFAULT_LATENCY_MS = 40
+REGRESSION_THRESHOLD = 0.20     # %20'den fazla yavaşlama gerileme sayılır
+
+
+def load_fixture(name, barcode):
+    """Fixture dosyasını okur ve {barcode} yer tutucusunu doldurur"""
+    with open(os.path.join(FIXTURES_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read().replace("{barcode}", barcode)
+
+
+def is_found(key):
+    """Son hanesi çift olan barkodlar için ürün vardır"""
+    digits = [c for c in key if c.isdigit()]
+    return bool(digits) and int(digits[-1]) % 2 == 0
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """Marka URL'lerini fixture yanıtlarıyla karşılayan istek işleyici"""
+    
+    latency = DEFAULT_LATENCY_MS / 1000
+    
+    def do_GET(self):
+        time.sleep(self.latency)
+        
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        parts = parsed.path.strip('/').split('/')
+        brand = parts[0]
+        
+        if brand in ('zara', 'bershka-api'):
+            key = query.get('reference', [''])[0]
+            prefix = 'zara' if brand == 'zara' else 'bershka'
+            name = f"{prefix}_found.json" if is_found(key) else f"{prefix}_not_found.json"
+            return self._send(200, load_fixture(name, key), "application/json")
+        
+        if brand == 'mango' and len(parts) >= 4 and parts[1] == 'p':
+            category, key = parts[2], parts[3]
+            # Ürün sadece kadın kategorisinde var - diğer kategoriler 404
+            if category == 'kadin' and is_found(key):
+                return self._send(200, load_fixture("mango_product.html", key))
+            return self._send(404, "<html><body>404</body></html>")
+        
+        if brand == 'mango' and len(parts) >= 3 and parts[1] == 'search':
+            category, key = parts[2], query.get('q', [''])[0]
+            name = "mango_search.html" if category == 'kadin' and is_found(key) else "mango_search_empty.html"
+            return self._send(200, load_fixture(name, key))
+        
+        if brand == 'mavi':
+            key = query.get('text', [''])[0]
+            name = "mavi_search.html" if is_found(key) else "mavi_search_empty.html"
+            return self._send(200, load_fixture(name, key))
+        
+        if brand == 'hm':
+            key = query.get('q', [''])[0]
+            name = "hm_search.html" if is_found(key) else "hm_search_empty.html"
+            return self._send(200, load_fixture(name, key))
+        
+        if brand == 'bershka' and len(parts) >= 3:
+            key = unquote(parts[2]).replace("/", "")
+            name = "bershka_search.html" if is_found(key) else "bershka_search_empty.html"
+            return self._send(200, load_fixture(name, key))
+        
+        return self._send(404, "not found", "text/plain")
+    
+    def _send(self, status, body, content_type="text/html; charset=utf-8"):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class ReplayServer(ThreadingHTTPServer):
+    # Mango barkod başına 10 bağlantı açar - varsayılan 5'lik kuyruk taşarsa
+    # bağlantılar 1 sn'lik SYN tekrarına düşer ve ölçümü bozar
+    request_queue_size = 256
+    daemon_threads = True
+
+
+def start_server(latency_ms):
+    """Yerel tekrar oynatma sunucusunu arka planda başlatır"""
+    ReplayHandler.latency = latency_ms / 1000
+    server = ReplayServer(("127.0.0.1", 0), ReplayHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def point_modules_to(base_url):
+    """Marka modüllerinin URL sabitlerini yerel sunucuya yönlendirir"""
+    zara_scraper.ZARA_API_URL = f"{base_url}/zara/itxrest/1/search/store/11766/reference"
+    bershka_scraper.BERSHKA_API_URL = f"{base_url}/bershka-api/itxrest/1/search/store/{{store_id}}/reference"
+    bershka_scraper.BERSHKA_SEARCH_URL = f"{base_url}/bershka/q/{{part1}}%2F{{part2}}%2F{{part3}}"
+    hm_scraper.HM_SEARCH_URL = f"{base_url}/hm/search-results.html?q={{barcode}}"
+    mango_scraper.MANGO_BASE_URL = f"{base_url}/mango"
+    mavi_scraper.MAVI_SEARCH_URL = f"{base_url}/mavi/search/?text={{search_value}}"
+
+
+
+def isolate_outputs():
+    """
+    Yerel sunucuya giden aramaların süreleri, hazır olma logu ve çerezleri geçici klasöre yazılır
+    (operatörün outputs/ klasörüne ve ana menü panosuna 127.0.0.1 ölçümleri karışmasın)
+    
+    Returns:
+        str: Geçici klasör
+    """
+    output_dir = tempfile.mkdtemp(prefix="bench_replay_")
+    lookup_timings.TIMINGS_DIR = os.path.join(output_dir, "timings")
+    page_readiness.get_readiness_recorder().log_file = os.path.join(output_dir, "readiness_times.jsonl")
+    cookie_store.COOKIES_DIR = os.path.join(output_dir, "cookies")
+    return output_dir
+
+
+def build_inputs(count):
+    """Her marka için işlenmiş barkod listeleri üretir"""
+    return {
+        'ZARA': [f"{4813858700 + i}" for i in range(count)],
+        'BERSHKA': [f"2104/644/{i:03d}" for i in range(count)],
+        'MANGO': [f"{17034100 + i}" for i in range(count)],
+        'MAVİ': [f"{8682067592600 + i}" for i in range(count)],
+    }
+
+
+def lookup_zara(barcode):
+    product_name, _ = zara_scraper.get_product_name(barcode)
+    return product_name
+
+
+def lookup_bershka_api(processed):
+    product_name, _ = bershka_scraper.get_product_name_api(processed)
+    return product_name
+
+
+def lookup_mango(barcode):
+    product_name, _ = mango_scraper.get_mango_product_name(barcode)
+    return product_name
+
+
+def lookup_mavi(value):
+    product_name, _ = mavi_scraper.get_product_name(value)
+    return product_name
+
+
+NETWORK_PATHS = [
+    ('ZARA', 'api', lookup_zara),
+    ('BERSHKA', 'api', lookup_bershka_api),
+    ('MANGO', 'html', lookup_mango),
+    ('MAVİ', 'html', lookup_mavi),
+]
+
+
+def summarize(brand, path, concurrency, latencies, found, expected, wall):
+    """Tek bir ölçüm serisini sonuç kaydına çevirir"""
+    return {
+        "brand": brand,
+        "path": path,
+        "concurrency": concurrency,
+        "count": len(latencies),
+        "found": found,
+        "expected_found": expected,
+        "correct": found == expected,
+        "p50_ms": round(page_readiness.percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(page_readiness.percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(page_readiness.percentile(latencies, 99) * 1000, 2),
+        "mean_ms": round(statistics.mean(latencies) * 1000, 2) if latencies else 0.0,
+        "wall_s": round(wall, 3),
+        "throughput_per_s": round(len(latencies) / wall, 2) if wall > 0 else 0.0,
+    }
+
+
+def run_network_path(brand, path, lookup, inputs, concurrency):
+    """Bir arama fonksiyonunu verilen eşzamanlılıkla tüm girişlerde ölçer"""
+    def timed(value):
+        start = time.perf_counter()
+        try:
+            product_name = lookup(value)
+        except page_readiness.PageNotReadyError:
+            product_name = None
+        return time.perf_counter() - start, product_name is not None
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(timed, inputs))
+    wall = time.perf_counter() - start
+    
+    latencies = [elapsed for elapsed, _ in results]
+    found = sum(1 for _, hit in results if hit)
+    expected = sum(1 for value in inputs if is_found(value))
+    return summarize(brand, path, concurrency, latencies, found, expected, wall)
+
+
+def run_mavi_async(inputs, concurrency):
+    """Mavi toplu aramasının async yolunu ölçer"""
+    started = {}
+    latencies = []
+    
+    def on_result(value, product_name, error):
+        latencies.append(time.perf_counter() - started['at'])
+    
+    started['at'] = time.perf_counter()
+    results = asyncio.run(mavi_scraper.get_product_names_async(inputs, max_concurrency=concurrency,
+                                                              on_result=on_result))
+    wall = time.perf_counter() - started['at']
+    
+    found = sum(1 for product_name, _ in results.values() if product_name)
+    expected = sum(1 for value in inputs if is_found(value))
+    # Async yolda istekler aynı anda başlar - gecikme, sonucun toplu başlangıca göre süresidir
+    return summarize('MAVİ', 'async', concurrency, latencies, found, expected, wall)
+
+
+def run_browser_paths(inputs, skipped):
+    """Bershka/H&M işlenmiş sayfalarını tarayıcıda ölçer (ChromeDriver yoksa atlanır)"""
+    from scrapers.driver_manager import DriverManager
+    
+    driver_manager = DriverManager(persistent=False)
+    try:
+        driver_manager.get_driver()
+    except Exception as e:
+        reason = str(e).strip().splitlines()[0] if str(e).strip() else type(e).__name__
+        skipped.append({"name": "BERSHKA/H&M selenium", "reason": reason})
+        return []
+    
+    results = []
+    tab_count = tab_pool.TAB_COUNT
+    try:
+        hm_inputs = [f"{1296051000 + i}" for i in range(len(inputs))]
+        bershka_urls = {}
+        for processed in inputs:
+            part1, part2, part3 = processed.split("/")
+            bershka_urls[processed] = bershka_scraper.BERSHKA_SEARCH_URL.format(
+                part1=part1, part2=part2, part3=part3
+            )
+        page_paths = [
+            ('H&M', lambda barcode: hm_scraper.get_product_name_selenium(driver_manager, barcode), hm_inputs),
+            ('BERSHKA',
+             lambda processed: bershka_scraper.get_product_name_selenium(driver_manager, bershka_urls[processed]),
+             inputs),
+        ]
+        
+        # Önce tek sekme (sayfalar sırayla), sonra sekme havuzu (sekme sayısı kadar eşzamanlı arama)
+        for path, tabs, concurrency in (('selenium', 1, 1), ('tabs', tab_count, tab_count)):
+            if path == 'tabs' and tabs < 2:
+                continue
+            tab_pool.TAB_COUNT = tabs
+            for brand, lookup, brand_inputs in page_paths:
+                commands_before = driver_manager.commands
+                entry = run_network_path(brand, path, lookup, brand_inputs, concurrency)
+                entry["commands_per_page"] = round((driver_manager.commands - commands_before) / len(brand_inputs), 1)
+                results.append(entry)
+        tab_pool.TAB_COUNT = tab_count
+    finally:
+        driver_manager.quit()
+    return results
+
+
+def bench_pure_functions():
+    """Saf fonksiyonların çağrı başına süresini ölçer"""
+    mango_product_html = load_fixture("mango_product.html", "17034102")
+    mavi_search_html = load_fixture("mavi_search.html", "8682067592600")
+    mango_qr = "https://shop.mango.com/tr/tr/p/kadin/gomlek/keten-gomlek_17034103?c=99&s=qr.17034103.99"
+    
+    functions = [
+        ("bershka.process_barcode", lambda: bershka_scraper.process_barcode("07369498800046")),
+        ("hm.process_barcode", lambda: hm_scraper.process_barcode("101188865002009202410877220ID")),
+        ("zara.validate_and_process_barcode", lambda: zara_scraper.validate_and_process_barcode("04813858712034")),
+        ("mango.detect_input_type[barcode]", lambda: mango_scraper.detect_input_type("17034103")),
+        ("mango.detect_input_type[qr]", lambda: mango_scraper.detect_input_type(mango_qr)),
+        ("mavi.detect_input_type", lambda: mavi_scraper.detect_input_type("06580929743")),
+        ("mixed.classify_input", lambda: mixed_scraper.classify_input("2104644040")),
+        ("mango.extract_product_name_from_product_page[parse+extract]",
+         lambda: mango_scraper.extract_product_name_from_product_page(parse_html(mango_product_html))),
+        ("mavi.parse_product_name", lambda: mavi_scraper.parse_product_name(mavi_search_html)),
+        ("excel_manager.parse_product_line",
+         lambda: excel_manager.parse_product_line("4813858712 ZARA Keten Karışımlı Gömlek", "ZARA")),
+    ]
+    
+    results = []
+    for name, func in functions:
+        timer = timeit.Timer(func)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=5, number=number)) / number
+        results.append({"name": name, "ns_per_call": round(best * 1e9, 1)})
+    return results
+
+
+def compare_with_baseline(report, baseline, threshold=REGRESSION_THRESHOLD):
+    """
+    Sonuçları önceki bir raporla karşılaştırır
+    
+    Returns:
+        list: Gerileme açıklamaları
+    """
+    regressions = []
+    
+    previous = {(e["brand"], e["path"], e["concurrency"]): e for e in baseline.get("network", [])}
+    for entry in report["network"]:
+        key = (entry["brand"], entry["path"], entry["concurrency"])
+        old = previous.get(key)
+        if old is None:
+            continue
+        if old.get("correct") and not entry["correct"]:
+            regressions.append(f"{key}: bulunan sayısı değişti ({old['found']} → {entry['found']})")
+        if old["p50_ms"] and entry["p50_ms"] > old["p50_ms"] * (1 + threshold):
+            regressions.append(f"{key}: p50 {old['p50_ms']} → {entry['p50_ms']} ms")
+        if old["throughput_per_s"] and entry["throughput_per_s"] < old["throughput_per_s"] * (1 - threshold):
+            regressions.append(f"{key}: verim {old['throughput_per_s']} → {entry['throughput_per_s']} barkod/sn")
+        if old.get("commands_per_page") and entry.get("commands_per_page", 0) > old["commands_per_page"] * (1 + threshold):
+            regressions.append(f"{key}: WebDriver komutu/sayfa {old['commands_per_page']} → {entry['commands_per_page']}")
+    
+    previous_pure = {e["name"]: e for e in baseline.get("pure", [])}
+    for entry in report["pure"]:
+        old = previous_pure.get(entry["name"])
+        if old and old["ns_per_call"] and entry["ns_per_call"] > old["ns_per_call"] * (1 + threshold):
+            regressions.append(f"{entry['name']}: {old['ns_per_call']} → {entry['ns_per_call']} ns")
+    
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Çevrimdışı tekrar oynatma benchmark")
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT, help="Marka başına barkod sayısı")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=DEFAULT_CONCURRENCY,
+                        help="Denenecek eşzamanlılık seviyeleri")
+    parser.add_argument("--latency-ms", type=float, default=DEFAULT_LATENCY_MS,
+                        help="Sunucunun yanıt başına eklediği gecikme (ağ benzetimi)")
+    parser.add_argument("--output", help="JSON çıktı dosyası (varsayılan: benchmarks/results/replay_<zaman>.json)")
+    parser.add_argument("--baseline", help="Karşılaştırılacak önceki JSON sonucu")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="Gerileme eşiği (0.20 = %%20)")
+    parser.add_argument("--skip-browser", action="store_true", help="Tarayıcı yollarını ölçme")
+    parser.add_argument("--tabs", type=int, default=tab_pool.TAB_COUNT,
+                        help="Sekme havuzu yolunda açılacak sekme sayısı")
+    args = parser.parse_args()
+    
+    server = start_server(args.latency_ms)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    isolate_outputs()
+    point_modules_to(base_url)
+    tab_pool.TAB_COUNT = args.tabs
+    
+    inputs = build_inputs(args.count)
+    report = {
+        "meta": {
+            "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "parser_backend": PARSER_BACKEND,
+            "latency_ms": args.latency_ms,
+            "count": args.count,
+        },
+        "network": [],
+        "pure": [],
+        "skipped": [],
+    }
+    
+    # Scraper'ların ara çıktıları ölçüm tablosunu bozmasın
+    with contextlib.redirect_stdout(io.StringIO()):
+        for brand, path, lookup in NETWORK_PATHS:
+            for concurrency in args.concurrency:
+                report["network"].append(run_network_path(brand, path, lookup, inputs[brand], concurrency))
+        for concurrency in args.concurrency:
+            report["network"].append(run_mavi_async(inputs['MAVİ'], concurrency))
+        
+        if args.skip_browser:
+            report["skipped"].append({"name": "BERSHKA/H&M selenium", "reason": "--skip-browser"})
+        else:
+            report["network"].extend(run_browser_paths(inputs['BERSHKA'][:min(args.count, 10)], report["skipped"]))
+    
+    report["pure"] = bench_pure_functions()
+    report["hosts"] = get_limiter_states()
+    server.shutdown()
+    
+    print(f"\n{'Marka':<9}{'Yol':<10}{'Eşz.':>5}{'p50':>10}{'p95':>10}{'Verim':>14}  Doğru")
+    print("─" * 66)
+    for entry in report["network"]:
+        print(f"{entry['brand']:<9}{entry['path']:<10}{entry['concurrency']:>5}"
+              f"{entry['p50_ms']:>7.1f} ms{entry['p95_ms']:>7.1f} ms"
+              f"{entry['throughput_per_s']:>8.1f} bk/sn  {'✓' if entry['correct'] else '✗'}")
+        if "commands_per_page" in entry:
+            print(f"{'':<24}WebDriver komutu/sayfa: {entry['commands_per_page']}")
+    for entry in report["skipped"]:
+        print(f"⏭  {entry['name']} atlandı: {entry['reason']}")
+    
+    print(f"\n{'Saf fonksiyon':<58}{'ns/çağrı':>12}")
+    print("─" * 70)
+    for entry in report["pure"]:
+        print(f"{entry['name']:<58}{entry['ns_per_call']:>12.1f}")
+    
+    output = args.output or os.path.join(RESULTS_DIR, f"replay_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 Sonuçlar: {output}")
+    
+    exit_code = 0
+    if not all(entry["correct"] for entry in report["network"]):
+        print("❌ Bazı yollar beklenen sayıda ürün bulamadı!")
+        exit_code = 1
+    
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(report, baseline, args.threshold)
+        if regressions:
+            print(f"❌ {len(regressions)} gerileme (eşik %{args.threshold * 100:.0f}):")
+            for line in regressions:
+                print(f"   • {line}")
+            exit_code = 1
+        else:
+            print(f"✅ Gerileme yok (eşik %{args.threshold * 100:.0f})")
+    
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,24 @@
 """
 Excel Manager - Ürün sonuçlarını Excel dosyasına kaydeder
+
+Günün asıl kaydı outputs/excel/rows/ altındaki satır dosyasıdır (JSON Lines, sadece ekleme).
+Her kayıtta sadece yeni satırlar bu dosyanın sonuna eklenir; xlsx dosyası bu kayıttan
+xlsxwriter'ın constant_memory moduyla arka planda yeniden üretilir.
 """
 import os
+import json
+import threading
 from datetime import datetime
-import xlsxwriter
+
+
+KNOWN_BRANDS = ["BERSHKA", "H&M", "ZARA", "MANGO", "MAVİ"]
+
+# Arka plan xlsx üretimi durumu
+_export_lock = threading.Lock()
+_export_done = threading.Condition(_export_lock)
+_export_thread = None
+_export_job = None
+_last_export_error = None
 
 
 class ExcelManager:
@@ -12,20 +27,21 @@ class ExcelManager:
     def __init__(self):
         """Excel manager başlatır"""
         self.excel_dir = os.path.join("outputs", "excel")
+        self.rows_dir = os.path.join(self.excel_dir, "rows")
         self.ensure_directory()
         
         # Bugünkü tarih ile dosya adı
         today = datetime.now().strftime("%Y-%m-%d")
         self.filename = os.path.join(self.excel_dir, f"tum_urunler_{today}.xlsx")
+        self.rows_file = os.path.join(self.rows_dir, f"tum_urunler_{today}.jsonl")
         
-        # Eğer dosya zaten varsa, ona append edeceğiz
-        # xlsxwriter append desteklemiyor, openpyxl kullanmalıyız
+        # Henüz satır dosyasına yazılmamış ürünler
         self.products = []
-        
+    
     def ensure_directory(self):
-        """Excel klasörünü oluşturur"""
-        if not os.path.exists(self.excel_dir):
-            os.makedirs(self.excel_dir)
+        """Excel klasörlerini oluşturur"""
+        if not os.path.exists(self.rows_dir):
+            os.makedirs(self.rows_dir)
     
     def add_products(self, products_list, brand_name):
         """
@@ -44,60 +60,85 @@ class ExcelManager:
     
     def save_to_excel(self):
         """
-        Tüm ürünleri Excel dosyasına kaydeder
+        Yeni ürünleri satır kaydına ekler ve xlsx'in arka planda güncellenmesini başlatır
+        
+        Satırlar Excel dosyası açık olsa bile kaydedilir; bu durumda sadece xlsx
+        güncellemesi ertelenir ve tekrar denendiğinde satırlar ikinci kez eklenmez.
         
         Returns:
             tuple: (başarılı_mı, hata_mesajı)
         """
         try:
-            # Dosya açık mı kontrol et
-            if self._is_file_open():
-                return False, "Excel dosyası açık! Lütfen kapatıp tekrar deneyin."
-            
-            # Eğer dosya varsa, mevcut verileri oku
-            existing_products = []
-            if os.path.exists(self.filename):
-                existing_products = self._read_existing_excel()
-            
-            # Mevcut + yeni verileri birleştir
-            all_products = existing_products + self.products
-            
-            # Yeni Excel dosyası oluştur
-            workbook = xlsxwriter.Workbook(self.filename)
-            worksheet = workbook.add_worksheet('Ürünler')
-            
-            # Başlık formatı
-            header_format = workbook.add_format({
-                'bold': True,
-                'bg_color': '#4472C4',
-                'font_color': 'white',
-                'border': 1
-            })
-            
-            # Başlıkları yaz
-            worksheet.write('A1', 'Barkod', header_format)
-            worksheet.write('B1', 'Ürün Adı', header_format)
-            
-            # Sütun genişlikleri
-            worksheet.set_column('A:A', 20)
-            worksheet.set_column('B:B', 60)
-            
-            # Verileri yaz
-            for i, product in enumerate(all_products, start=2):
-                worksheet.write(f'A{i}', product['barkod'])
-                # Marka adını ürün adının başına ekle
-                full_product_name = f"{product['brand']} {product['urun_adi']}"
-                worksheet.write(f'B{i}', full_product_name)
-            
-            workbook.close()
-            
-            # Listeyi temizle
-            self.products = []
-            
-            return True, None
-            
+            self._append_rows()
         except Exception as e:
             return False, f"Excel yazma hatası: {e}"
+        
+        # Dosya açık mı kontrol et
+        if self._is_file_open():
+            return False, "Excel dosyası açık! Lütfen kapatıp tekrar deneyin."
+        
+        schedule_export(self.rows_file, self.filename)
+        return True, None
+    
+    def export_now(self):
+        """
+        xlsx dosyasını hemen (ön planda) üretir - bekleyen arka plan işi varsa onu bekler
+        
+        Returns:
+            tuple: (başarılı_mı, hata_mesajı)
+        """
+        try:
+            self._append_rows()
+        except Exception as e:
+            return False, f"Excel yazma hatası: {e}"
+        if self._is_file_open():
+            return False, "Excel dosyası açık! Lütfen kapatıp tekrar deneyin."
+        
+        schedule_export(self.rows_file, self.filename)
+        return wait_for_export()
+    
+    def has_pending_rows(self):
+        """Satır dosyasına henüz yazılamamış ürün var mı"""
+        return bool(self.products)
+    
+    def _append_rows(self):
+        """Bekleyen ürünleri satır dosyasının sonuna ekler"""
+        self._migrate_existing_excel()
+        
+        if not self.products:
+            return
+        
+        with open(self.rows_file, 'a', encoding='utf-8') as f:
+            for product in self.products:
+                f.write(json.dumps(product, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        
+        # Listeyi temizle
+        self.products = []
+    
+    def _migrate_existing_excel(self):
+        """
+        Satır dosyası olmayan ama xlsx'i olan gün için (eski sürümden kalma)
+        mevcut satırları bir kez satır dosyasına aktarır
+        
+        xlsx okunamazsa satır dosyası oluşturulmaz - boş bir satır dosyası sonraki
+        dışa aktarımda mevcut satırların silinmesine yol açardı.
+        
+        Raises:
+            IOError: Mevcut Excel okunamadığında (aktarım sonraki kayıtta tekrar denenir)
+        """
+        if os.path.exists(self.rows_file) or not os.path.exists(self.filename):
+            return
+        
+        existing_products = self._read_existing_excel()
+        if existing_products is None:
+            raise IOError("Mevcut Excel okunamadı - dosya açıksa kapatıp tekrar deneyin")
+        tmp_file = self.rows_file + ".tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            for product in existing_products:
+                f.write(json.dumps(product, ensure_ascii=False) + "\n")
+        os.replace(tmp_file, self.rows_file)
     
     def _is_file_open(self):
         """
@@ -119,15 +160,15 @@ class ExcelManager:
     
     def _read_existing_excel(self):
         """
-        Mevcut Excel dosyasını okur (openpyxl ile)
+        Mevcut Excel dosyasını okur (openpyxl read-only ile)
         
         Returns:
-            list: Mevcut ürünler listesi
+            list or None: Mevcut ürünler listesi - dosya okunamazsa None
         """
         try:
             from openpyxl import load_workbook
             
-            workbook = load_workbook(self.filename)
+            workbook = load_workbook(self.filename, read_only=True)
             worksheet = workbook.active
             
             products = []
@@ -140,7 +181,7 @@ class ExcelManager:
                     brand = "BİLİNMEYEN"  # Varsayılan
                     
                     # Marka adlarını kontrol et
-                    for possible_brand in ["BERSHKA", "H&M", "ZARA", "MANGO", "MAVİ"]:
+                    for possible_brand in KNOWN_BRANDS:
                         if product_name.startswith(possible_brand + " "):
                             brand = possible_brand
                             product_name = product_name[len(possible_brand)+1:]  # Marka adını çıkar
@@ -154,10 +195,115 @@ class ExcelManager:
             
             workbook.close()
             return products
-            
+        
         except Exception as e:
             print(f"⚠️  Mevcut Excel okunamadı: {e}")
-            return []
+            return None
+
+
+def export_rows_to_excel(rows_file, filename):
+    """
+    Satır dosyasını akış halinde okuyup xlsx üretir (constant_memory)
+    Önce geçici dosyaya yazılır, bitince asıl dosyanın yerine taşınır.
+    
+    Args:
+        rows_file (str): JSON Lines satır dosyası
+        filename (str): Üretilecek xlsx dosyası
+    """
+    import xlsxwriter
+    
+    tmp_file = os.path.join(os.path.dirname(filename), f"~{os.path.basename(filename)}")
+    
+    workbook = xlsxwriter.Workbook(tmp_file, {'constant_memory': True})
+    worksheet = workbook.add_worksheet('Ürünler')
+    
+    # Başlık formatı
+    header_format = workbook.add_format({
+        'bold': True,
+        'bg_color': '#4472C4',
+        'font_color': 'white',
+        'border': 1
+    })
+    
+    # Sütun genişlikleri
+    worksheet.set_column('A:A', 20)
+    worksheet.set_column('B:B', 60)
+    
+    # Başlıkları yaz
+    worksheet.write_string(0, 0, 'Barkod', header_format)
+    worksheet.write_string(0, 1, 'Ürün Adı', header_format)
+    
+    # Verileri yaz (constant_memory modunda satırlar sırayla yazılmalı)
+    row_index = 1
+    if os.path.exists(rows_file):
+        with open(rows_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                product = json.loads(line)
+                worksheet.write_string(row_index, 0, product['barkod'])
+                # Marka adını ürün adının başına ekle
+                worksheet.write_string(row_index, 1, f"{product['brand']} {product['urun_adi']}")
+                row_index += 1
+    
+    workbook.close()
+    os.replace(tmp_file, filename)
+
+
+def schedule_export(rows_file, filename):
+    """
+    xlsx üretimini arka planda başlatır
+    Üretim sürerken gelen yeni istekler birleştirilir - en fazla bir iş daha kuyrukta bekler.
+    """
+    global _export_thread, _export_job
+    
+    with _export_lock:
+        _export_job = (rows_file, filename)
+        if _export_thread is None:
+            _export_thread = threading.Thread(target=_export_worker, name="excel-export")
+            _export_thread.start()
+
+
+def _export_worker():
+    """Kuyruktaki xlsx üretim işlerini sırayla çalıştırır"""
+    global _export_thread, _export_job, _last_export_error
+    
+    while True:
+        with _export_lock:
+            job = _export_job
+            _export_job = None
+            if job is None:
+                _export_thread = None
+                _export_done.notify_all()
+                return
+        
+        try:
+            export_rows_to_excel(*job)
+            error = None
+        except Exception as e:
+            error = f"Excel yazma hatası: {e}"
+        
+        with _export_lock:
+            _last_export_error = error
+
+
+def wait_for_export(timeout=None):
+    """
+    Arka plandaki xlsx üretiminin bitmesini bekler
+    
+    Args:
+        timeout (float): En fazla bekleme süresi (saniye) - None ise sınırsız
+    
+    Returns:
+        tuple: (başarılı_mı, hata_mesajı)
+    """
+    with _export_lock:
+        finished = _export_done.wait_for(lambda: _export_thread is None, timeout=timeout)
+        if not finished:
+            return False, "Excel dosyası hâlâ hazırlanıyor"
+        if _last_export_error:
+            return False, _last_export_error
+        return True, None
 
 
 def parse_product_line(line, brand_name):
@@ -177,4 +323,3 @@ def parse_product_line(line, brand_name):
         urun_adi = parts[1].strip()
         return (barkod, urun_adi)
     return None
-
@@ -0,0 +1,179 @@
+"""
+Kalıcı Arama Önbelleği
+Marka + işlenmiş barkod bazında çözülen ürün adlarını SQLite'ta saklar
+"""
+import os
+import sqlite3
+import threading
+import time
+from utils import Colors
+
+
+# Önbellek ayarları
+CACHE_FILE = os.path.join("outputs", "lookup_cache.sqlite3")
+CACHE_TTL_SECONDS = 30 * 24 * 3600          # Bulunan ürünler: 30 gün
+NEGATIVE_TTL_SECONDS = 12 * 3600            # "Ürün Bulunamadı" sonuçları: 12 saat
+CACHE_MAX_ENTRIES = 200000                  # Bu sayı aşılınca en eski kayıtlar silinir
+EVICTION_CHECK_EVERY = 500                  # Kaç yazmada bir boyut kontrolü yapılacak
+
+
+class LookupCache:
+    """Marka ve işlenmiş barkoda göre arama sonuçlarını saklayan disk önbelleği"""
+    
+    def __init__(self, db_path=CACHE_FILE, ttl=CACHE_TTL_SECONDS,
+                 negative_ttl=NEGATIVE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES):
+        """
+        Önbelleği açar (yoksa oluşturur)
+        
+        Args:
+            db_path (str): SQLite dosya yolu
+            ttl (int): Bulunan ürünlerin geçerlilik süresi (saniye)
+            negative_ttl (int): Bulunamayan sonuçların geçerlilik süresi (saniye)
+            max_entries (int): En fazla kayıt sayısı
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        
+        # Bu oturumdaki sayaçlar
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        
+        self._writes = 0
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        # Toplu aramalarda birden fazla thread aynı bağlantıyı kullanır
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS lookups (
+                brand TEXT NOT NULL,
+                barcode TEXT NOT NULL,
+                product_name TEXT,
+                found INTEGER NOT NULL,
+                source TEXT,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (brand, barcode)
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_lookups_created ON lookups (created_at)")
+        self._conn.commit()
+    
+    def get(self, brand, barcode):
+        """
+        Önbellekte geçerli bir kayıt arar
+        
+        Args:
+            brand (str): Marka adı (ZARA, MAVİ, vb.)
+            barcode (str): İşlenmiş barkod
+        
+        Returns:
+            tuple: (bulundu_mu, ürün_adı)
+                   Kayıt yoksa (False, None)
+                   Bulunamadı kaydı varsa (True, None)
+                   Ürün kaydı varsa (True, ürün_adı)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT product_name, found, created_at FROM lookups WHERE brand = ? AND barcode = ?",
+                (brand, barcode)
+            ).fetchone()
+            
+            if row is not None:
+                product_name, found, created_at = row
+                ttl = self.ttl if found else self.negative_ttl
+                if time.time() - created_at <= ttl:
+                    if found:
+                        self.hits += 1
+                        return True, product_name
+                    self.negative_hits += 1
+                    return True, None
+            
+            self.misses += 1
+            return False, None
+    
+    def put(self, brand, barcode, product_name, source):
+        """
+        Arama sonucunu önbelleğe yazar
+        
+        Args:
+            brand (str): Marka adı
+            barcode (str): İşlenmiş barkod
+            product_name (str or None): Ürün adı - None ise "Ürün Bulunamadı" olarak saklanır
+            source (str): Sonucun kaynağı (api, selenium, html, vb.)
+        """
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO lookups (brand, barcode, product_name, found, source, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (brand, barcode, product_name, 1 if product_name else 0, source, time.time())
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"⚠️  Önbellek yazılamadı: {e}")
+                return
+            
+            self._writes += 1
+            if self._writes % EVICTION_CHECK_EVERY == 0:
+                self._evict()
+    
+    def _evict(self):
+        """Süresi dolan kayıtları ve sınırı aşan en eski kayıtları siler"""
+        now = time.time()
+        self._conn.execute(
+            "DELETE FROM lookups WHERE (found = 1 AND created_at < ?) OR (found = 0 AND created_at < ?)",
+            (now - self.ttl, now - self.negative_ttl)
+        )
+        
+        count = self._conn.execute("SELECT COUNT(*) FROM lookups").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM lookups WHERE rowid IN "
+                "(SELECT rowid FROM lookups ORDER BY created_at ASC LIMIT ?)",
+                (overflow,)
+            )
+        self._conn.commit()
+    
+    def print_summary(self):
+        """Bu oturumdaki önbellek isabet/kaçırma sayılarını yazdırır"""
+        total = self.hits + self.negative_hits + self.misses
+        if total == 0:
+            return
+        
+        hit_rate = (self.hits + self.negative_hits) / total * 100
+        text = f"{self.hits} isabet, {self.negative_hits} bulunamadı, {self.misses} kaçırma (%{hit_rate:.0f})"
+        print(f"{Colors.INFO}┌{'─' * 68}┐{Colors.RESET}")
+        print(f"{Colors.INFO}│  • Önbellek        : {text}{' ' * max(0, 46 - len(text))}│{Colors.RESET}")
+        print(f"{Colors.INFO}└{'─' * 68}┘{Colors.RESET}")
+    
+    def close(self):
+        """Veritabanı bağlantısını kapatır"""
+        with self._lock:
+            self._conn.close()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_lookup_cache():
+    """
+    Tüm scraper'ların paylaştığı önbellek nesnesini döndürür
+    
+    Returns:
+        LookupCache: Paylaşılan önbellek
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LookupCache()
+        return _cache
@@ -0,0 +1,386 @@
+"""
+Arama Süre Ölçümü
+Her aramanın aşamalarını (doğrulama, önbellek, ağ, sayfa, ayrıştırma, kayıt) marka ve
+strateji bazında ölçer, günlük gecikme histogramlarında toplar ve p50/p95/p99 hesaplar
+"""
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from utils import Colors, get_brand_color
+from scrapers.host_limiter import get_limiter_states
+
+
+TIMINGS_DIR = os.path.join("outputs", "timings")
+SAVE_EVERY = 20                 # Kaç aramada bir günlük dosya yeniden yazılır
+
+# Aşamalar (ölçüm sırasıyla) - "total" aramanın baştan sona süresidir
+STAGES = ['validate', 'cache', 'network', 'render', 'parse', 'persist']
+STAGE_LABELS = {
+    'validate': 'doğrulama',
+    'cache': 'önbellek',
+    'network': 'ağ',
+    'render': 'sayfa',
+    'parse': 'ayrıştırma',
+    'persist': 'kayıt',
+}
+TOTAL = 'total'
+
+# Markanın programdaki ilk (önbellek dışı) araması, kayıtlı tarayıcı profili / çerezlerle
+# başladıysa "warm", sıfırdan başladıysa "cold" olarak ayrıca ölçülür
+START_STATES = ['cold', 'warm']
+START_STATE_LABELS = {'cold': 'sıfırdan', 'warm': 'kayıtlı durum'}
+SKIP_FIRST_STRATEGIES = {'cache', 'invalid'}
+
+# Histogram kutuları: 1 ms'den başlayıp %25 büyüyen üst sınırlar (~9 dakikaya kadar)
+BUCKET_GROWTH = 1.25
+BUCKET_COUNT = 60
+BUCKET_BOUNDS_MS = [BUCKET_GROWTH ** i for i in range(BUCKET_COUNT)]
+
+_local = threading.local()
+_start_states = {}
+
+
+def bucket_index(ms):
+    """Süreyi (ms) histogram kutusu sırasına çevirir"""
+    if ms <= 1:
+        return 0
+    return min(BUCKET_COUNT - 1, math.ceil(math.log(ms, BUCKET_GROWTH)))
+
+
+class LatencyHistogram:
+    """Sabit boyutlu, birleştirilebilir gecikme histogramı"""
+    
+    def __init__(self, counts=None, count=0, total_ms=0.0, max_ms=0.0):
+        self.counts = counts or {}
+        self.count = count
+        self.total_ms = total_ms
+        self.max_ms = max_ms
+    
+    def add(self, ms):
+        """Tek bir ölçümü ekler"""
+        index = bucket_index(ms)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+    
+    def merge(self, other):
+        """Başka bir histogramın sayılarını bu histograma ekler"""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+    
+    def percentile(self, pct):
+        """
+        Yüzdelik değeri kutunun üst sınırı olarak döndürür (en fazla %25 sapma)
+        
+        Returns:
+            float: Süre (ms)
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100 * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(BUCKET_BOUNDS_MS[index], self.max_ms)
+        return self.max_ms
+    
+    def to_dict(self):
+        return {
+            "counts": {str(index): count for index, count in sorted(self.counts.items())},
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            counts={int(index): count for index, count in data.get("counts", {}).items()},
+            count=data.get("count", 0),
+            total_ms=data.get("total_ms", 0.0),
+            max_ms=data.get("max_ms", 0.0),
+        )
+
+
+class TimingRecorder:
+    """Arama sürelerini marka / strateji / aşama bazında günlük histogramlara yazar"""
+    
+    def __init__(self, timings_dir=None):
+        # Klasör oluşturma anında okunur - benchmark'lar TIMINGS_DIR'i geçici klasöre çevirebilir
+        self.timings_dir = timings_dir or TIMINGS_DIR
+        self.today = datetime.now().strftime("%Y-%m-%d")
+        self.histograms, self.first_lookups = self._load()
+        self._first_done = set()
+        self._unsaved = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def day_file(self):
+        return os.path.join(self.timings_dir, f"timings_{self.today}.json")
+    
+    def _load(self):
+        """
+        Bugünün histogramlarını dosyadan okur (program gün içinde yeniden açılmış olabilir)
+        
+        Returns:
+            tuple: (seriler, ilk_arama_serileri)
+        """
+        if not os.path.exists(self.day_file):
+            return {}, {}
+        try:
+            with open(self.day_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}, {}
+        series = {key: LatencyHistogram.from_dict(value) for key, value in data.get("series", {}).items()}
+        first_lookups = {key: LatencyHistogram.from_dict(value) for key, value in data.get("first_lookup", {}).items()}
+        return series, first_lookups
+    
+    def record(self, brand, strategy, stages, total_seconds):
+        """
+        Tamamlanan bir aramanın sürelerini ekler
+        
+        Args:
+            brand (str): Marka adı
+            strategy (str): Arama yolu (api, selenium, cache, direct_url, vb.)
+            stages (dict): {aşama: saniye}
+            total_seconds (float): Aramanın toplam süresi
+        """
+        with self._lock:
+            # Gece yarısını geçen oturumlar yeni günün dosyasına yazılır
+            today = datetime.now().strftime("%Y-%m-%d")
+            if today != self.today:
+                self._save()
+                self.today = today
+                self.histograms = {}
+                self.first_lookups = {}
+            
+            for stage, seconds in list(stages.items()) + [(TOTAL, total_seconds)]:
+                key = f"{brand}|{strategy}|{stage}"
+                self.histograms.setdefault(key, LatencyHistogram()).add(seconds * 1000)
+            
+            if brand not in self._first_done and strategy not in SKIP_FIRST_STRATEGIES:
+                self._first_done.add(brand)
+                key = f"{brand}|{_start_states.get(brand, 'cold')}"
+                self.first_lookups.setdefault(key, LatencyHistogram()).add(total_seconds * 1000)
+            
+            self._unsaved += 1
+            if self._unsaved >= SAVE_EVERY:
+                self._save()
+    
+    def flush(self):
+        """Kaydedilmemiş ölçümleri günlük dosyaya yazar"""
+        with self._lock:
+            if self._unsaved:
+                self._save()
+    
+    def _save(self):
+        """Günlük dosyayı geçici dosya üzerinden yeniden yazar (kilit altında çağrılır)"""
+        data = {
+            "date": self.today,
+            "series": {key: histogram.to_dict() for key, histogram in sorted(self.histograms.items())},
+            "first_lookup": {key: histogram.to_dict() for key, histogram in sorted(self.first_lookups.items())},
+            "hosts": get_limiter_states(),
+        }
+        temp_file = self.day_file + ".tmp"
+        try:
+            os.makedirs(self.timings_dir, exist_ok=True)
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_file, self.day_file)
+            self._unsaved = 0
+        except OSError as e:
+            print(f"⚠️  Süre ölçümleri kaydedilemedi: {e}")
+    
+    def brand_summary(self):
+        """
+        Bugünün marka bazında toplam süre histogramını ve en çok süre alan aşamasını çıkarır
+        
+        Returns:
+            dict: {marka: (toplam_histogram, {strateji: sayı}, en_yavaş_aşama)}
+        """
+        with self._lock:
+            totals = {}
+            strategies = {}
+            stage_ms = {}
+            for key, histogram in self.histograms.items():
+                brand, strategy, stage = key.split("|")
+                if stage == TOTAL:
+                    totals.setdefault(brand, LatencyHistogram()).merge(histogram)
+                    strategies.setdefault(brand, {})[strategy] = histogram.count
+                else:
+                    brand_stages = stage_ms.setdefault(brand, {})
+                    brand_stages[stage] = brand_stages.get(stage, 0.0) + histogram.total_ms
+        
+        summary = {}
+        for brand, histogram in totals.items():
+            brand_stages = stage_ms.get(brand, {})
+            slowest = max(brand_stages, key=brand_stages.get) if brand_stages else None
+            summary[brand] = (histogram, strategies[brand], slowest)
+        return summary
+    
+    def print_summary(self):
+        """Ana menü için bugünkü marka bazında p50/p95/p99 panelini yazdırır"""
+        summary = self.brand_summary()
+        if not summary:
+            return
+        
+        print(f"{Colors.INFO}┌{'─' * 68}┐{Colors.RESET}")
+        print(f"{Colors.INFO}│{' ' * 21}⏱  ARAMA SÜRELERİ (BUGÜN){' ' * 21}│{Colors.RESET}")
+        print(f"{Colors.INFO}├{'─' * 68}┤{Colors.RESET}")
+        for brand, (histogram, strategies, slowest) in summary.items():
+            color = get_brand_color(brand)
+            text = (f"{histogram.count:>4} arama  "
+                    f"p50 {format_ms(histogram.percentile(50))} "
+                    f"p95 {format_ms(histogram.percentile(95))} "
+                    f"p99 {format_ms(histogram.percentile(99))}")
+            if slowest:
+                text += f"  ▸{STAGE_LABELS[slowest]}"
+            print(f"{Colors.INFO}│  • {color}{brand:<8}{Colors.INFO}{text}{' ' * max(0, 56 - len(text))}│{Colors.RESET}")
+        
+        # Programdaki ilk arama: sıfırdan başlangıç ile kayıtlı profil / çerezle başlangıç
+        with self._lock:
+            first_lookups = dict(self.first_lookups)
+        first_brands = [brand for brand in summary
+                        if any(f"{brand}|{state}" in first_lookups for state in START_STATES)]
+        if first_brands:
+            print(f"{Colors.INFO}├{'─' * 68}┤{Colors.RESET}")
+            for brand in first_brands:
+                parts = []
+                for state in START_STATES:
+                    histogram = first_lookups.get(f"{brand}|{state}")
+                    if histogram is not None:
+                        parts.append(f"{START_STATE_LABELS[state]} {format_ms(histogram.percentile(50))} ({histogram.count})")
+                text = "ilk arama: " + " / ".join(parts)
+                color = get_brand_color(brand)
+                print(f"{Colors.INFO}│  • {color}{brand:<8}{Colors.INFO}{text}{' ' * max(0, 56 - len(text))}│{Colors.RESET}")
+        
+        # Site bazlı eşzamanlılık sınırları (bu oturumda istek yapılan siteler)
+        states = get_limiter_states()
+        if states:
+            print(f"{Colors.INFO}├{'─' * 68}┤{Colors.RESET}")
+            for state in states:
+                text = (f"{state['host']:<16} sınır {state['limit']:>2}/{state['peak_limit']:<2} "
+                        f"engel {state['throttled']} zaman aşımı {state['timeouts']}")
+                if state['backoff_seconds']:
+                    text += f" bekleme {state['backoff_seconds']}sn"
+                print(f"{Colors.INFO}│  • {text}{' ' * max(0, 64 - len(text))}│{Colors.RESET}")
+        print(f"{Colors.INFO}└{'─' * 68}┘{Colors.RESET}")
+
+
+def format_ms(ms):
+    """Süreyi kısa biçimde yazar (850ms, 2.4s)"""
+    if ms < 1000:
+        return f"{ms:.0f}ms"
+    return f"{ms / 1000:.1f}s"
+
+
+class LookupTimer:
+    """Tek bir aramanın aşama sürelerini toplar - with bloğu bitince kaydedilir"""
+    
+    def __init__(self, recorder, brand, strategy):
+        self.recorder = recorder
+        self.brand = brand
+        self.strategy = strategy
+        self.stages = {}
+        self._start = None
+        self._lock = threading.Lock()
+    
+    def __enter__(self):
+        self._start = time.perf_counter()
+        _local.timer = self
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        _local.timer = None
+        self.recorder.record(self.brand, self.strategy, self.stages, time.perf_counter() - self._start)
+        return False
+    
+    def add(self, stage, seconds):
+        """Aşamaya süre ekler (paralel adaylardan da çağrılabilir)"""
+        with self._lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+    
+    @contextmanager
+    def stage(self, name):
+        """Bloğun süresini verilen aşamaya ekler"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+
+def start_lookup(brand, strategy):
+    """
+    Yeni bir arama ölçümü başlatır (with bloğu içinde kullanılır)
+    
+    Args:
+        brand (str): Marka adı
+        strategy (str): Varsayılan arama yolu - arama sırasında set_strategy ile değişebilir
+    
+    Returns:
+        LookupTimer: Bu thread'in aktif ölçümü
+    """
+    return LookupTimer(get_timing_recorder(), brand, strategy)
+
+
+def current_timer():
+    """Bu thread'de süren arama ölçümünü döndürür (yoksa None)"""
+    return getattr(_local, 'timer', None)
+
+
+@contextmanager
+def stage(name):
+    """Aktif arama ölçümü varsa bloğun süresini aşamaya ekler, yoksa hiçbir şey yapmaz"""
+    timer = current_timer()
+    if timer is None:
+        yield
+        return
+    with timer.stage(name):
+        yield
+
+
+def set_start_state(brand, state):
+    """
+    Markanın bu çalıştırmada nasıl başladığını bildirir (ilk arama süresi bu etiketle ölçülür)
+    
+    Args:
+        brand (str): Marka adı
+        state (str): "warm" (kayıtlı tarayıcı profili / çerezler geri yüklendi) veya "cold"
+    """
+    _start_states[brand] = state
+
+
+def set_strategy(strategy):
+    """Aktif ölçümün strateji etiketini değiştirir (örn. önbellekten dönüldüğünde)"""
+    timer = current_timer()
+    if timer is not None:
+        timer.strategy = strategy
+
+
+_recorder = None
+_recorder_lock = threading.Lock()
+
+
+def get_timing_recorder():
+    """
+    Tüm scraper'ların paylaştığı süre kaydedicisini döndürür
+    
+    Returns:
+        TimingRecorder: Paylaşılan kaydedici
+    """
+    global _recorder
+    with _recorder_lock:
+        if _recorder is None:
+            _recorder = TimingRecorder()
+        return _recorder
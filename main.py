@@ -2,50 +2,41 @@
 GİYİM BARKOD ARAMA SİSTEMİ
 Ana Menü ve Sistem Yöneticisi
 """
+import startup_profile
+startup_profile.install()
+
 import os
 import sys
-import tempfile
-import shutil
 from datetime import datetime
-from excel_manager import ExcelManager, parse_product_line
+from excel_manager import ExcelManager, KNOWN_BRANDS, parse_product_line, wait_for_export
 from utils import (
     Colors, print_success, print_error, print_warning, print_info, 
     print_highlight, print_brand_header, Statistics, handle_error, 
     clear_screen, print_loading
 )
 from auth import verify_password, show_login_failed_screen
+from lookup_cache import get_lookup_cache
+from lookup_timings import get_timing_recorder
+from result_journal import (
+    open_session, resume_session, end_session, find_unfinished_sessions,
+    SINK_TXT, SINK_EXCEL, SINK_STATS, SAVE_SINKS
+)
+from scrapers.driver_manager import DriverManager
+from prewarm import Prewarmer
 
 # PyInstaller için stdin kontrolü
 if not hasattr(sys, 'stdin') or sys.stdin is None:
     import io
     sys.stdin = io.StringIO()
-    
-# PyInstaller için chromedriver yolu
-def get_chromedriver_path():
-    """ChromeDriver'ın doğru yolunu döndürür"""
-    if getattr(sys, 'frozen', False):
-        # EXE modunda - geçici klasöre çıkar
-        if hasattr(sys, '_MEIPASS'):
-            # PyInstaller'ın geçici klasörü
-            chromedriver_bundled = os.path.join(sys._MEIPASS, 'chromedriver.exe')
-            
-            # Geçici klasöre kopyala (yazılabilir olması için)
-            temp_dir = tempfile.gettempdir()
-            chromedriver_temp = os.path.join(temp_dir, 'chromedriver.exe')
-            
-            if not os.path.exists(chromedriver_temp):
-                shutil.copy2(chromedriver_bundled, chromedriver_temp)
-            
-            return chromedriver_temp
-        else:
-            # Eski PyInstaller veya farklı paketleyici
-            return os.path.join(os.path.dirname(sys.executable), 'chromedriver.exe')
-    else:
-        # Normal Python modunda
-        return os.path.join(os.path.dirname(__file__), 'chromedriver.exe')
 
-# Global değişken olarak kaydet
-CHROMEDRIVER_PATH = get_chromedriver_path()
+# Menü seçimi -> (marka, modül, fonksiyon, tarayıcı kullanıyor mu)
+BRAND_SCRAPERS = {
+    '1': ('BERSHKA', 'scrapers.bershka_scraper', 'run_bershka', True),
+    '2': ('H&M', 'scrapers.hm_scraper', 'run_hm', True),
+    '3': ('ZARA', 'scrapers.zara_scraper', 'run_zara', False),
+    '4': ('MANGO', 'scrapers.mango_scraper', 'run_mango', False),
+    '5': ('MAVİ', 'scrapers.mavi_scraper', 'run_mavi', False),
+}
 
 
 def ensure_directories():
@@ -76,6 +67,8 @@ def show_main_menu(stats):
     
     # İstatistik paneli
     stats.print_daily_summary()
+    get_lookup_cache().print_summary()
+    get_timing_recorder().print_summary()
     
     # Markalar - 70 karakter genişlik
     print(f"\n{Colors.INFO}┌{'─' * 68}┐{Colors.RESET}")
@@ -86,6 +79,8 @@ def show_main_menu(stats):
     print(f"{Colors.INFO}│  3. {Colors.ZARA}👗  Zara{Colors.INFO}{' ' * 53}│{Colors.RESET}")
     print(f"{Colors.INFO}│  4. {Colors.MANGO}🧥  Mango{Colors.INFO}{' ' * 52}│{Colors.RESET}")
     print(f"{Colors.INFO}│  5. {Colors.MAVI}👖  Mavi{Colors.INFO}{' ' * 53}│{Colors.RESET}")
+    print(f"{Colors.INFO}├{'─' * 68}┤{Colors.RESET}")
+    print(f"{Colors.INFO}│  9. {Colors.HIGHLIGHT}🔀  Karışık Koli (Otomatik Marka){Colors.INFO}{' ' * 28}│{Colors.RESET}")
     print(f"{Colors.INFO}└{'─' * 68}┘{Colors.RESET}")
     
     # Araçlar - 70 karakter genişlik
@@ -217,6 +212,9 @@ def save_to_excel(found_products, not_found_products, brand_name):
         found_products (list): Bulunan ürünler
         not_found_products (list): Bulunamayan ürünler
         brand_name (str): Marka adı (BÜYÜK HARF)
+    
+    Returns:
+        bool: Satırlar günün satır kaydına yazıldıysa True (xlsx güncellemesi ertelenmiş olabilir)
     """
     try:
         excel_manager = ExcelManager()
@@ -246,99 +244,66 @@ def save_to_excel(found_products, not_found_products, brand_name):
                 while True:
                     retry = input(f"{Colors.WARNING}Excel dosyasını kapattıktan sonra 'e' ile yeniden deneyin (veya 'h' ile iptal): {Colors.RESET}").strip().lower()
                     if retry == 'e':
-                        return save_to_excel(found_products, not_found_products, brand_name)
+                        # Satırlar zaten kaydedildi - sadece Excel dosyasını yeniden üret
+                        success, error = excel_manager.export_now()
+                        if success:
+                            print_success(f"Excel dosyasına kaydedildi: {excel_manager.filename}")
+                            return True
+                        print_error(f"Excel kayıt hatası: {error}")
                     elif retry == 'h':
-                        print_info("Excel kaydı iptal edildi.")
-                        return False
+                        print_info("Excel kaydı iptal edildi. Satırlar saklandı, Excel dosyası bir sonraki kayıtta güncellenecek.")
+                        return True
                     else:
                         print_error("Geçersiz seçim! Lütfen 'e' (tekrar dene) veya 'h' (iptal) girin.")
-            return False
+            # Satırlar kaydedildiyse sadece xlsx güncellemesi başarısız oldu - tekrar eklenmemeli
+            return not excel_manager.has_pending_rows()
     except Exception as e:
         handle_error(e, "Excel kayıt")
         return False
 
 
-def run_brand_scraper(brand_choice, stats):
+def run_brand_scraper(brand_choice, stats, driver_manager=None, journal=None):
     """
     Seçilen marka scraper'ını çalıştırır
     
     Args:
         brand_choice (str): Marka seçimi (1-5)
         stats (Statistics): İstatistik objesi
+        driver_manager (DriverManager): Selenium markalarının paylaştığı tarayıcı
+        journal (ResultJournal): Devam edilecek yarım kalan oturum - None ise yeni oturum açılır
     
     Returns:
         bool: Başarılı ise True
     """
-    brand_map = {
-        '1': ('BERSHKA', 'scrapers.bershka_scraper', 'run_bershka'),
-        '2': ('H&M', 'scrapers.hm_scraper', 'run_hm'),
-        '3': ('ZARA', 'scrapers.zara_scraper', 'run_zara'),
-        '4': ('MANGO', 'scrapers.mango_scraper', 'run_mango'),
-        '5': ('MAVİ', 'scrapers.mavi_scraper', 'run_mavi'),
-    }
-    
-    if brand_choice not in brand_map:
+    if brand_choice not in BRAND_SCRAPERS:
         print_error("Geçersiz seçim!")
         return False
     
-    brand_name, module_name, function_name = brand_map[brand_choice]
+    brand_name, module_name, function_name, uses_browser = BRAND_SCRAPERS[brand_choice]
     
     try:
         # Modülü import et
         module = __import__(module_name, fromlist=[function_name])
         scraper_function = getattr(module, function_name)
         
-        # Scraper'ı çalıştır
-        print_loading(f"{brand_name} scraper başlatılıyor")
-        found_products, not_found_products = scraper_function()
-        
-        # Manuel düzenleme modu
-        if not_found_products:
-            print(f"\n{Colors.WARNING}{'═' * 70}{Colors.RESET}")
-            print(f"{Colors.WARNING}║{' ' * 68}║{Colors.RESET}")
-            print_warning(f"{len(not_found_products)} ürün bulunamadı!")
-            print(f"{Colors.WARNING}║{' ' * 68}║{Colors.RESET}")
-            print(f"{Colors.WARNING}{'═' * 70}{Colors.RESET}")
-            
-            while True:
-                edit_choice = input(f"{Colors.INFO}Manuel düzenleme yapmak ister misiniz? (e/h): {Colors.RESET}").strip().lower()
-                
-                if edit_choice == 'e':
-                    edited, remaining = manual_edit_mode(not_found_products, brand_name)
-                    found_products.extend(edited)
-                    not_found_products = remaining
-                    break
-                elif edit_choice == 'h':
-                    print_info("Manuel düzenleme atlandı.")
-                    break
-                else:
-                    print_error("Geçersiz seçim! Lütfen 'e' (evet) veya 'h' (hayır) girin.")
-        
-        # Sonuçları kaydet
-        total = len(found_products) + len(not_found_products)
-        if total > 0:
-            print(f"\n{Colors.INFO}{'═' * 70}{Colors.RESET}")
-            print_loading("Sonuçlar kaydediliyor")
-            print(f"{Colors.INFO}{'═' * 70}{Colors.RESET}\n")
-            
-            # TXT'ye kaydet
-            txt_success = save_to_txt(found_products, not_found_products, brand_name)
-            
-            # Excel'e kaydet
-            excel_success = save_to_excel(found_products, not_found_products, brand_name)
-            
-            # İstatistikleri güncelle
-            stats.add_search(brand_name, len(found_products), len(not_found_products))
-            
-            print(f"\n{Colors.SUCCESS}{'═' * 70}{Colors.RESET}")
-            print(f"{Colors.SUCCESS}║{' ' * 30}📊 ÖZET{' ' * 32}║{Colors.RESET}")
-            print(f"{Colors.SUCCESS}{'═' * 70}{Colors.RESET}")
-            print_success(f"Bulunan       : {len(found_products)} ürün")
-            print_error(f"Bulunamayan   : {len(not_found_products)} ürün")
-            print_info(f"Toplam        : {total} barkod")
-            print(f"{Colors.SUCCESS}{'═' * 70}{Colors.RESET}\n")
+        # Scraper'ı çalıştır - her sonuç bulunduğu anda oturum günlüğüne yazılır
+        print_info(f"{brand_name} scraper başlatılıyor...")
+        start_session(brand_name, journal)
+        try:
+            if uses_browser:
+                scraper_function(driver_manager=driver_manager)
+            else:
+                scraper_function()
+        finally:
+            # Hata olursa günlük diskte kalır ve sonraki açılışta kurtarılır
+            journal = end_session()
+        
+        # Kayıt günlükten üretilir
+        found_products, not_found_products = journal.results().get(brand_name, ([], []))
+        if process_brand_results(found_products, not_found_products, brand_name, stats, journal):
+            journal.discard()
         else:
-            print_info("Hiç ürün aranmadı.")
+            print_warning("Kayıt tamamlanamadı - eksik adımlar sonraki açılışta tekrar denenecek.")
         
         input(f"\n{Colors.SUCCESS}Ana menüye dönmek için Enter'a basın...{Colors.RESET}")
         return True
@@ -353,11 +318,235 @@ def run_brand_scraper(brand_choice, stats):
         return False
 
 
+def run_mixed_scraper(stats, driver_manager=None, journal=None):
+    """
+    Karışık koli modunu çalıştırır ve sonuçları marka bazında kaydeder
+    
+    Args:
+        stats (Statistics): İstatistik objesi
+        driver_manager (DriverManager): Bershka ve H&M aramalarının paylaştığı tarayıcı
+        journal (ResultJournal): Devam edilecek yarım kalan oturum - None ise yeni oturum açılır
+    
+    Returns:
+        bool: Başarılı ise True
+    """
+    try:
+        from scrapers.mixed_scraper import run_mixed
+        
+        print_loading("Karışık koli modu başlatılıyor")
+        start_session("MIXED", journal)
+        try:
+            run_mixed(driver_manager=driver_manager)
+        finally:
+            journal = end_session()
+        
+        # Kayıt günlükten marka bazında üretilir
+        brand_results = journal.results()
+        if not brand_results:
+            print_info("Hiç ürün aranmadı.")
+        
+        if save_brand_results(brand_results, stats, journal):
+            journal.discard()
+        else:
+            print_warning("Kayıt tamamlanamadı - eksik adımlar sonraki açılışta tekrar denenecek.")
+        
+        input(f"\n{Colors.SUCCESS}Ana menüye dönmek için Enter'a basın...{Colors.RESET}")
+        return True
+        
+    except Exception as e:
+        handle_error(e, "Karışık koli modu")
+        input(f"\n{Colors.INFO}Devam etmek için Enter'a basın...{Colors.RESET}")
+        return False
+
+
+def start_session(mode, journal=None):
+    """
+    Yeni oturum günlüğü açar veya yarım kalan oturuma devam eder
+    
+    Args:
+        mode (str): Marka adı veya MIXED
+        journal (ResultJournal): Devam edilecek yarım kalan oturum
+    """
+    if journal is None:
+        open_session(mode)
+        return
+    resume_session(journal)
+    print_info(f"Yarım kalan oturuma devam ediliyor ({journal.count()} sonuç) - yeni sonuçlar bu oturuma eklenecek.")
+
+
+def save_brand_results(brand_results, stats, journal=None):
+    """
+    Birden fazla markanın sonuçlarını marka sırasıyla kaydeder
+    
+    Args:
+        brand_results (dict): {marka: (found_products, not_found_products)}
+        stats (Statistics): İstatistik objesi
+        journal (ResultJournal): Sonuçların alındığı oturum günlüğü (tamamlanan adımlar işaretlenir)
+    
+    Returns:
+        bool: Tüm markalar kaydedildiyse True
+    """
+    success = True
+    for brand_name in sorted(brand_results, key=KNOWN_BRANDS.index):
+        found_products, not_found_products = brand_results[brand_name]
+        print(f"\n{Colors.HIGHLIGHT}{'─' * 70}{Colors.RESET}")
+        print_highlight(f"{brand_name} sonuçları")
+        if not process_brand_results(found_products, not_found_products, brand_name, stats, journal):
+            success = False
+    return success
+
+
+def recover_unfinished_sessions(stats, driver_manager=None):
+    """
+    Önceki çalıştırmada kaydedilemeden kalan oturumları bulur; sonuçlar kaydedilir, silinir
+    veya aynı oturumda taramaya devam edilir (hiçbir barkod yeniden sorgulanmaz)
+    
+    Kaydına başlanmış oturumlara devam edilemez - sadece eksik kayıt adımları tamamlanır.
+    
+    Args:
+        stats (Statistics): İstatistik objesi
+        driver_manager (DriverManager): Devam edilen oturumda kullanılacak tarayıcı
+    """
+    brand_choices = {brand_name: choice for choice, (brand_name, *_) in BRAND_SCRAPERS.items()}
+    
+    for journal in find_unfinished_sessions():
+        brand_results = journal.results()
+        if not brand_results:
+            journal.discard()
+            continue
+        
+        total = journal.count()
+        print(f"\n{Colors.WARNING}{'═' * 70}{Colors.RESET}")
+        print_warning(f"Yarım kalan oturum bulundu: {journal.mode} ({journal.started}) - {total} sonuç")
+        print(f"{Colors.WARNING}{'═' * 70}{Colors.RESET}")
+        
+        resumable = not journal.save_started() and (journal.mode == "MIXED" or journal.mode in brand_choices)
+        if resumable:
+            prompt, choices = "Sonuçlar kaydedilsin mi? (e: kaydet / d: taramaya devam et / h: sil): ", ('e', 'd', 'h')
+        else:
+            prompt, choices = "Sonuçlar kaydedilsin mi? (e: kaydet / h: sil): ", ('e', 'h')
+        
+        while True:
+            choice = input(f"{Colors.INFO}{prompt}{Colors.RESET}").strip().lower()
+            if choice in choices:
+                break
+            print_error(f"Geçersiz seçim! Lütfen {' / '.join(repr(c) for c in choices)} girin.")
+        
+        if choice == 'd':
+            # Taramaya devam - kayıt ve günlüğün silinmesi oturum sonunda yapılır
+            if journal.mode == "MIXED":
+                run_mixed_scraper(stats, driver_manager, journal)
+            else:
+                run_brand_scraper(brand_choices[journal.mode], stats, driver_manager, journal)
+            continue
+        
+        if choice == 'e':
+            if not save_brand_results(brand_results, stats, journal):
+                print_warning("Kayıt tamamlanamadı - eksik adımlar sonraki açılışta tekrar denenecek.")
+                continue
+        else:
+            print_info("Yarım kalan oturum silindi.")
+        journal.discard()
+
+
+def process_brand_results(found_products, not_found_products, brand_name, stats, journal=None):
+    """
+    Bir markanın sonuçları için manuel düzenleme, kayıt ve özet adımlarını çalıştırır
+    
+    Günlük verilirse her kayıt adımı (TXT, Excel satırları, istatistik) tamamlandıkça
+    günlüğe işaretlenir; yarıda kalan kayıt tekrarlandığında tamamlanmış adımlar atlanır
+    ve manuel düzenleme tekrar sorulmaz.
+    
+    Args:
+        found_products (list): Bulunan ürünler
+        not_found_products (list): Bulunamayan ürünler
+        brand_name (str): Marka adı (BÜYÜK HARF)
+        stats (Statistics): İstatistik objesi
+        journal (ResultJournal): Sonuçların alındığı oturum günlüğü
+    
+    Returns:
+        bool: Tüm kayıt adımları tamamlandıysa (veya kaydedilecek sonuç yoksa) True
+    """
+    done = journal.saved_sinks(brand_name) if journal is not None else set()
+    resuming = journal is not None and brand_name in journal.final
+    
+    # Manuel düzenleme modu (yarıda kalan kayıtta düzenlenmiş listeler günlükten gelir)
+    if not_found_products and not resuming:
+        print(f"\n{Colors.WARNING}{'═' * 70}{Colors.RESET}")
+        print(f"{Colors.WARNING}║{' ' * 68}║{Colors.RESET}")
+        print_warning(f"{len(not_found_products)} ürün bulunamadı!")
+        print(f"{Colors.WARNING}║{' ' * 68}║{Colors.RESET}")
+        print(f"{Colors.WARNING}{'═' * 70}{Colors.RESET}")
+        
+        while True:
+            edit_choice = input(f"{Colors.INFO}Manuel düzenleme yapmak ister misiniz? (e/h): {Colors.RESET}").strip().lower()
+            
+            if edit_choice == 'e':
+                edited, remaining = manual_edit_mode(not_found_products, brand_name)
+                found_products.extend(edited)
+                not_found_products = remaining
+                break
+            elif edit_choice == 'h':
+                print_info("Manuel düzenleme atlandı.")
+                break
+            else:
+                print_error("Geçersiz seçim! Lütfen 'e' (evet) veya 'h' (hayır) girin.")
+    
+    # Sonuçları kaydet
+    total = len(found_products) + len(not_found_products)
+    if total > 0:
+        print(f"\n{Colors.INFO}{'═' * 70}{Colors.RESET}")
+        print_loading("Sonuçlar kaydediliyor")
+        print(f"{Colors.INFO}{'═' * 70}{Colors.RESET}\n")
+        
+        if journal is not None and not resuming:
+            journal.set_final(brand_name, found_products, not_found_products)
+        if done:
+            labels = {SINK_TXT: "TXT", SINK_EXCEL: "Excel", SINK_STATS: "İstatistik"}
+            print_info(f"Önceki kayıtta tamamlanan adımlar atlandı: {', '.join(labels[sink] for sink in SAVE_SINKS if sink in done)}")
+        
+        def mark_saved(sink):
+            done.add(sink)
+            if journal is not None:
+                journal.mark_saved(brand_name, sink)
+        
+        # TXT'ye kaydet
+        if SINK_TXT not in done and save_to_txt(found_products, not_found_products, brand_name):
+            mark_saved(SINK_TXT)
+        
+        # Excel'e kaydet (satır kaydına yazıldıysa xlsx sonraki kayıtta güncellenir)
+        if SINK_EXCEL not in done and save_to_excel(found_products, not_found_products, brand_name):
+            mark_saved(SINK_EXCEL)
+        
+        # İstatistikleri güncelle
+        if SINK_STATS not in done:
+            stats.add_search(brand_name, len(found_products), len(not_found_products))
+            mark_saved(SINK_STATS)
+        get_timing_recorder().flush()
+        
+        print(f"\n{Colors.SUCCESS}{'═' * 70}{Colors.RESET}")
+        print(f"{Colors.SUCCESS}║{' ' * 30}📊 ÖZET{' ' * 32}║{Colors.RESET}")
+        print(f"{Colors.SUCCESS}{'═' * 70}{Colors.RESET}")
+        print_success(f"Bulunan       : {len(found_products)} ürün")
+        print_error(f"Bulunamayan   : {len(not_found_products)} ürün")
+        print_info(f"Toplam        : {total} barkod")
+        print(f"{Colors.SUCCESS}{'═' * 70}{Colors.RESET}\n")
+        return done >= set(SAVE_SINKS)
+    else:
+        print_info("Hiç ürün aranmadı.")
+        return True
+
+
 def open_excel_file():
     """Bugünkü Excel dosyasını açar"""
     today = datetime.now().strftime("%Y-%m-%d")
     excel_file = os.path.join("outputs", "excel", f"tum_urunler_{today}.xlsx")
     
+    # Arka planda güncellenen Excel dosyasının bitmesini bekle
+    success, error = wait_for_export()
+    if not success:
+        print_error(f"Excel kayıt hatası: {error}")
+    
     if not os.path.exists(excel_file):
         print_error(f"Bugünkü Excel dosyası bulunamadı: {excel_file}")
         input(f"\n{Colors.INFO}Devam etmek için Enter'a basın...{Colors.RESET}")
@@ -392,8 +581,18 @@ def open_outputs_folder():
 
 def main():
     """Ana program döngüsü"""
+    # Açılış profili: giriş ekranına kadar geçen süreyi raporla ve çık
+    if startup_profile.is_enabled():
+        sys.exit(0 if startup_profile.report() else 1)
+    
+    # Tarayıcı, site bağlantıları ve scraper modülleri giriş ekranında beklenirken hazırlanır
+    driver_manager = DriverManager()
+    prewarmer = Prewarmer(driver_manager)
+    prewarmer.start()
+    
     # Şifre kontrolü
     if not verify_password():
+        driver_manager.quit()
         show_login_failed_screen()
         input(f"{Colors.ERROR}Çıkmak için Enter'a basın...{Colors.RESET}")
         sys.exit(1)
@@ -404,20 +603,49 @@ def main():
     # İstatistik objesi oluştur
     stats = Statistics()
     
+    # Önceki çalıştırmada kaydedilemeyen sonuçları kurtar
+    recover_unfinished_sessions(stats, driver_manager)
+    
+    # Tarayıcı menüye dönünce kapanmaz, sonraki Selenium markası aynı tarayıcıyı kullanır
+    try:
+        run_main_loop(stats, driver_manager, prewarmer)
+    finally:
+        driver_manager.quit()
+        get_timing_recorder().flush()
+        # Çıkmadan önce Excel dosyasının son hâlinin yazılmasını bekle
+        wait_for_export()
+
+
+def run_main_loop(stats, driver_manager, prewarmer=None):
+    """
+    Menü döngüsünü çalıştırır
+    
+    Args:
+        stats (Statistics): İstatistik objesi
+        driver_manager (DriverManager): Paylaşılan tarayıcı yöneticisi
+        prewarmer (Prewarmer): Menüde beklenirken tarayıcıyı ve bağlantıları tazeleyen hazırlayıcı
+    """
     while True:
+        if prewarmer is not None:
+            prewarmer.refresh()
+        
         # Ana menüyü göster
         show_main_menu(stats)
         
         # Kullanıcı seçimi
         try:
-            choice = input(f"{Colors.HIGHLIGHT}Seçiminiz (1-8): {Colors.RESET}").strip()
+            choice = input(f"{Colors.HIGHLIGHT}Seçiminiz (1-9): {Colors.RESET}").strip()
         except (EOFError, RuntimeError):
             print_error("Input hatası! Program sonlandırılıyor...")
             sys.exit(1)
         
         if choice in ['1', '2', '3', '4', '5']:
             # Marka scraper'ını çalıştır
-            run_brand_scraper(choice, stats)
+            run_brand_scraper(choice, stats, driver_manager)
+        
+        elif choice == '9':
+            # Karışık koli - marka otomatik algılanır
+            run_mixed_scraper(stats, driver_manager)
         
         elif choice == '6':
             # Excel'i aç
@@ -434,7 +662,7 @@ def main():
             sys.exit(0)
         
         else:
-            print_error("Geçersiz seçim! Lütfen 1-8 arasında bir sayı girin.")
+            print_error("Geçersiz seçim! Lütfen 1-9 arasında bir sayı girin.")
             input(f"\n{Colors.INFO}Devam etmek için Enter'a basın...{Colors.RESET}")
 
 
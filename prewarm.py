@@ -0,0 +1,131 @@
+"""
+Arka Plan Hazırlığı
+Giriş ekranında ve menüde beklenirken scraper modüllerini yükler, Selenium markaları için
+Chrome'u açar ve API/HTML sitelerine DNS/TCP/TLS bağlantılarını kurar. Marka seçildiğinde
+hazır olan her şey beklemeden kullanılır; hazır olmayan kısım normal yoldan açılır.
+"""
+import importlib
+import threading
+import time
+from urllib.parse import urlparse
+
+
+# Marka bazında hazırlık - False yapılan marka için hiçbir şey önceden açılmaz
+PREWARM_BRANDS = {
+    'BERSHKA': True,
+    'H&M': True,
+    'ZARA': True,
+    'MANGO': True,
+    'MAVİ': True,
+}
+BRAND_MODULES = {
+    'BERSHKA': 'scrapers.bershka_scraper',
+    'H&M': 'scrapers.hm_scraper',
+    'ZARA': 'scrapers.zara_scraper',
+    'MANGO': 'scrapers.mango_scraper',
+    'MAVİ': 'scrapers.mavi_scraper',
+}
+SELENIUM_BRANDS = {'BERSHKA', 'H&M'}
+PRECONNECT_TIMEOUT = 5          # Ön bağlantı isteğinin üst sınırı (saniye)
+PRECONNECT_REFRESH = 60         # Menüye dönüldüğünde bundan eski bağlantılar yenilenir (saniye)
+
+# Ön bağlantı: markanın kendi oturumu ve adresi - bağlantı o oturumun havuzunda kalır
+PRECONNECT_TARGETS = {
+    'ZARA': lambda module: (module.get_client().session, module.ZARA_API_URL),
+    'BERSHKA': lambda module: (module.get_api_session(), module.BERSHKA_API_URL) if module.is_api_enabled() else None,
+    'MANGO': lambda module: (module.get_session(), module.MANGO_BASE_URL),
+    'MAVİ': lambda module: (module.get_session(), module.MAVI_SEARCH_URL),
+}
+
+# Görev durumları
+STATUS_RUNNING = "running"
+STATUS_READY = "ready"
+STATUS_FAILED = "failed"
+
+
+class Prewarmer:
+    """Hazırlık görevlerini arka plan thread'lerinde çalıştırır (hiçbir şey yazdırmaz)"""
+    
+    def __init__(self, driver_manager, brands=None):
+        """
+        Hazırlayıcıyı oluşturur (görevler start ile başlar)
+        
+        Args:
+            driver_manager (DriverManager): Selenium markalarının paylaştığı tarayıcı
+            brands (dict): {marka: açık mı} - verilmezse PREWARM_BRANDS
+        """
+        self.driver_manager = driver_manager
+        self.brands = [brand for brand, enabled in (brands or PREWARM_BRANDS).items() if enabled]
+        self.status = {}
+        self._last_preconnect = None
+        self._threads = {}
+        self._lock = threading.Lock()
+    
+    def start(self):
+        """Tüm hazırlık görevlerini başlatır (beklemeden döner)"""
+        self._spawn("modules", self._import_modules)
+        if SELENIUM_BRANDS.intersection(self.brands):
+            self._spawn("browser", self._start_browser)
+        self.refresh_connections()
+    
+    def refresh(self):
+        """Menüye dönüldüğünde kapanmış tarayıcıyı ve eskimiş bağlantıları yeniden hazırlar"""
+        # Açılamayan tarayıcı (örn. ChromeDriver yok) her menüde yeniden denenmez
+        browser_failed = self.status.get("browser") == STATUS_FAILED
+        if SELENIUM_BRANDS.intersection(self.brands) and not browser_failed and not self.driver_manager.is_running():
+            self._spawn("browser", self._start_browser)
+        self.refresh_connections()
+    
+    def refresh_connections(self):
+        """Son ön bağlantıdan PRECONNECT_REFRESH geçtiyse sitelere yeniden bağlanır"""
+        now = time.monotonic()
+        if self._last_preconnect is not None and now - self._last_preconnect < PRECONNECT_REFRESH:
+            return
+        self._last_preconnect = now
+        for brand in self.brands:
+            if brand in PRECONNECT_TARGETS:
+                self._spawn(f"preconnect:{brand}", lambda brand=brand: self._preconnect(brand))
+    
+    def is_ready(self, task):
+        """Görev tamamlandı mı (örn. "browser", "preconnect:ZARA")"""
+        return self.status.get(task) == STATUS_READY
+    
+    def _spawn(self, task, target):
+        """Görevi arka planda başlatır - aynı görev hâlâ sürüyorsa yenisi açılmaz"""
+        with self._lock:
+            thread = self._threads.get(task)
+            if thread is not None and thread.is_alive():
+                return
+            self.status[task] = STATUS_RUNNING
+            thread = threading.Thread(target=self._run, args=(task, target), name=f"prewarm-{task}", daemon=True)
+            self._threads[task] = thread
+            thread.start()
+    
+    def _run(self, task, target):
+        """Görevi çalıştırır ve durumunu kaydeder"""
+        try:
+            target()
+            self.status[task] = STATUS_READY
+        except Exception:
+            # Hazırlık yalnızca hız için - hata, marka seçildiğinde normal yoldan tekrar denenir
+            self.status[task] = STATUS_FAILED
+    
+    def _import_modules(self):
+        """Marka modüllerini (ve selenium, bs4, curl_cffi gibi bağımlılıklarını) yükler"""
+        for brand in self.brands:
+            importlib.import_module(BRAND_MODULES[brand])
+    
+    def _start_browser(self):
+        """Chrome'u açar - run_brand_scraper aynı DriverManager'dan hazır sürücüyü alır"""
+        self.driver_manager.get_driver()
+    
+    def _preconnect(self, brand):
+        """Markanın oturumu üzerinden siteye HEAD isteği atar (DNS, TCP, TLS ve çerezler hazır olur)"""
+        module = importlib.import_module(BRAND_MODULES[brand])
+        target = PRECONNECT_TARGETS[brand](module)
+        if target is None:
+            # Markanın ağ yolu kapalı - aramalar yalnızca tarayıcıdan gider
+            return
+        session, url = target
+        parsed = urlparse(url)
+        session.head(f"{parsed.scheme}://{parsed.netloc}/", timeout=PRECONNECT_TIMEOUT, allow_redirects=False)
@@ -0,0 +1,354 @@
+"""
+Sonuç Günlüğü (Write-Ahead Journal)
+Her arama sonucu bulunduğu anda diske eklenir; TXT/Excel çıktısı oturum sonunda bu
+günlükten üretilir. Program kapanır veya çökerse yarım kalan oturum bir sonraki
+açılışta hiçbir barkod yeniden sorgulanmadan kaydedilir veya taramaya devam edilir.
+Kayıt adımları (TXT, Excel satırları, istatistik) tamamlandıkça günlüğe işaretlenir;
+yarıda kalan kayıt tekrarlanırken sadece tamamlanmamış adımlar çalışır.
+"""
+import json
+import os
+import threading
+from datetime import datetime
+
+
+JOURNAL_DIR = os.path.join("outputs", "journal")
+FSYNC_BATCH = 20                # Bu kadar kayıt birikince hemen diske zorlanır
+FSYNC_INTERVAL = 1.0            # Birikmiş kayıtlar en geç bu kadar saniyede diske zorlanır
+
+# Oturum sonunda her marka için çalışan kayıt adımları
+SINK_TXT = "txt"
+SINK_EXCEL = "excel"
+SINK_STATS = "stats"
+SAVE_SINKS = (SINK_TXT, SINK_EXCEL, SINK_STATS)
+
+
+class ResultJournal:
+    """Bir tarama oturumunun sonuçlarını satır satır diske yazan günlük"""
+    
+    def __init__(self, path, mode=None):
+        """
+        Günlüğü açar - mode verilirse yeni oturum başlatılır, verilmezse mevcut dosya okunur
+        
+        Args:
+            path (str): Günlük dosyası
+            mode (str): Oturum türü (marka adı veya MIXED)
+        """
+        self.path = path
+        self.mode = mode
+        self.started = None
+        self.records = []
+        # Marka -> tamamlanan kayıt adımları / manuel düzenleme sonrası kesin listeler
+        self.saved = {}
+        self.final = {}
+        
+        self._file = None
+        self._unsynced = 0
+        self._next_order = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._flusher = None
+        
+        if mode is None:
+            self._load()
+            return
+        
+        self.started = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+        self._write({"type": "session", "mode": mode, "started": self.started})
+        self._sync()
+        self._start_flusher()
+    
+    def _start_flusher(self):
+        """Seyrek gelen sonuçları diske zorlayan thread'i başlatır"""
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name="journal-fsync", daemon=True)
+        self._flusher.start()
+    
+    def reopen(self):
+        """Kurtarılan günlüğü taramaya devam etmek için yazmaya açar (yeni sonuçlar mevcut sıranın ardına eklenir)"""
+        with self._lock:
+            self._next_order = max((record["order"] for record in self.records), default=-1) + 1
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._start_flusher()
+    
+    def _load(self):
+        """Mevcut günlük dosyasını okur (yarım kalmış son satır atlanır)"""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get("type") == "session":
+                    self.mode = record.get("mode")
+                    self.started = record.get("started")
+                elif record.get("type") == "result":
+                    self.records.append(record)
+                elif record.get("type") == "saved":
+                    self.saved.setdefault(record.get("brand"), set()).add(record.get("sink"))
+                elif record.get("type") == "final":
+                    self.final[record.get("brand")] = (record.get("found", []), record.get("not_found", []))
+    
+    def reserve(self, count=1):
+        """
+        Okutulan barkodlar ve toplu aramalar için tek bir sıradan yer ayırır
+        
+        Args:
+            count (int): Ayrılacak ardışık sıra sayısı
+        
+        Returns:
+            int: Ayrılan ilk sıra numarası
+        """
+        with self._lock:
+            order = self._next_order
+            self._next_order += count
+            return order
+    
+    def append(self, brand, result_line, found, order=None):
+        """
+        Tek bir sonucu günlüğe ekler
+        
+        Args:
+            brand (str): Marka adı
+            result_line (str): "barkod MARKA Ürün Adı" satırı
+            found (bool): Ürün bulundu mu
+            order (int): reserve() ile ayrılan sıra - None ise sonun sırası verilir
+        """
+        if order is None:
+            order = self.reserve()
+        with self._lock:
+            record = {"type": "result", "brand": brand, "line": result_line,
+                      "found": bool(found), "order": order}
+            self.records.append(record)
+            if self._file is None:
+                return
+            
+            self._write(record)
+            self._unsynced += 1
+            if self._unsynced >= FSYNC_BATCH:
+                self._sync()
+    
+    def results(self):
+        """
+        Günlükteki sonuçları marka bazında, sıralı olarak döndürür
+        
+        Returns:
+            dict: {marka: (found_products, not_found_products)}
+        """
+        with self._lock:
+            records = sorted(self.records, key=lambda record: record["order"])
+        
+        grouped = {}
+        for record in records:
+            found_products, not_found_products = grouped.setdefault(record["brand"], ([], []))
+            (found_products if record["found"] else not_found_products).append(record["line"])
+        
+        # Kayda başlanmış markalarda manuel düzenleme sonrası listeler kullanılır
+        for brand, (found_products, not_found_products) in self.final.items():
+            grouped[brand] = (list(found_products), list(not_found_products))
+        return grouped
+    
+    def saved_sinks(self, brand):
+        """Markanın tamamlanmış kayıt adımları"""
+        return set(self.saved.get(brand, ()))
+    
+    def save_started(self):
+        """Herhangi bir marka için kayda başlandı mı (başlandıysa taramaya devam edilemez)"""
+        return bool(self.saved or self.final)
+    
+    def set_final(self, brand, found_products, not_found_products):
+        """
+        Manuel düzenleme sonrası kaydedilecek listeleri günlüğe yazar
+        (kayıt yarıda kalırsa düzenleme tekrar sorulmaz)
+        """
+        self.final[brand] = (list(found_products), list(not_found_products))
+        self._write_durable({"type": "final", "brand": brand,
+                             "found": list(found_products), "not_found": list(not_found_products)})
+    
+    def mark_saved(self, brand, sink):
+        """
+        Markanın bir kayıt adımının tamamlandığını günlüğe yazar
+        
+        Args:
+            brand (str): Marka adı
+            sink (str): SINK_TXT, SINK_EXCEL veya SINK_STATS
+        """
+        self.saved.setdefault(brand, set()).add(sink)
+        self._write_durable({"type": "saved", "brand": brand, "sink": sink})
+    
+    def is_saved(self, brands):
+        """Verilen markaların tüm kayıt adımları tamamlandı mı"""
+        return all(self.saved_sinks(brand) >= set(SAVE_SINKS) for brand in brands)
+    
+    def count(self):
+        """Günlükteki sonuç sayısı"""
+        with self._lock:
+            return len(self.records)
+    
+    def close(self):
+        """Bekleyen kayıtları diske zorlar ve dosyayı kapatır (dosya diskte kalır)"""
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+                self._file.close()
+                self._file = None
+    
+    def discard(self):
+        """Sonuçlar TXT/Excel'e kaydedildikten sonra günlüğü siler"""
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+    
+    def _write_durable(self, record):
+        """Kaydı hemen diske zorlar - kapalı (kurtarılan) günlükte dosya kısa süreliğine açılır"""
+        with self._lock:
+            if self._file is not None:
+                self._write(record)
+                self._sync()
+                return
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+                try:
+                    os.fsync(f.fileno())
+                except OSError:
+                    pass
+    
+    def _write(self, record):
+        """Kaydı dosyaya yazar (kilit altında çağrılır)"""
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+    
+    def _sync(self):
+        """Yazılan kayıtları diske zorlar (kilit altında çağrılır)"""
+        try:
+            os.fsync(self._file.fileno())
+        except OSError:
+            pass
+        self._unsynced = 0
+    
+    def _flush_loop(self):
+        """Seyrek gelen sonuçlar da FSYNC_INTERVAL içinde diske yazılsın"""
+        while not self._stop.wait(FSYNC_INTERVAL):
+            with self._lock:
+                if self._file is not None and self._unsynced:
+                    self._sync()
+
+
+_active = None
+_active_lock = threading.Lock()
+
+
+def open_session(mode):
+    """
+    Yeni bir tarama oturumu günlüğü başlatır ve aktif günlük yapar
+    
+    Args:
+        mode (str): Marka adı veya karışık mod için MIXED
+    
+    Returns:
+        ResultJournal: Aktif günlük
+    """
+    global _active
+    safe_mode = "".join(c if c.isalnum() else "_" for c in mode)
+    filename = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}_{safe_mode}.jsonl"
+    journal = ResultJournal(os.path.join(JOURNAL_DIR, filename), mode=mode)
+    with _active_lock:
+        _active = journal
+    return journal
+
+
+def resume_session(journal):
+    """
+    Kurtarılan oturumu yeniden aktif günlük yapar - yeni sonuçlar aynı dosyaya eklenir
+    
+    Args:
+        journal (ResultJournal): find_unfinished_sessions() ile bulunan, kaydına başlanmamış günlük
+    
+    Returns:
+        ResultJournal: Aktif günlük
+    """
+    global _active
+    journal.reopen()
+    with _active_lock:
+        _active = journal
+    return journal
+
+
+def get_active_journal():
+    """Süren oturumun günlüğünü döndürür (oturum yoksa None)"""
+    return _active
+
+
+def reserve_order(count=1):
+    """Aktif oturumun sırasından yer ayırır (oturum yoksa None)"""
+    journal = _active
+    if journal is not None:
+        return journal.reserve(count)
+    return None
+
+
+def record_result(brand, result_line, found, order=None):
+    """Aktif oturum varsa tek sonucu günlüğe ekler"""
+    journal = _active
+    if journal is not None:
+        journal.append(brand, result_line, found, order)
+
+
+def reserve_bulk_orders(keys):
+    """
+    Toplu aramadaki her girişe giriş sırasıyla günlükte yer ayırır
+    
+    Args:
+        keys (list): İşlenmiş barkodlar / kodlar (tekrar edebilir)
+    
+    Returns:
+        dict: {anahtar: [sıra, ...]} - oturum yoksa boş
+    """
+    orders = {}
+    first = reserve_order(len(keys))
+    if first is None:
+        return orders
+    for offset, key in enumerate(keys):
+        orders.setdefault(key, []).append(first + offset)
+    return orders
+
+
+def record_bulk_result(brand, result_line, found, orders):
+    """Toplu aramada biten sonucu, girişin listede geçtiği her sıra için günlüğe ekler"""
+    for order in orders:
+        record_result(brand, result_line, found, order)
+
+
+def end_session():
+    """Aktif günlüğü kapatır (dosya, kaydedilene veya silinene kadar diskte kalır)"""
+    global _active
+    with _active_lock:
+        journal, _active = _active, None
+    if journal is not None:
+        journal.close()
+    return journal
+
+
+def find_unfinished_sessions():
+    """
+    Önceki çalıştırmalardan kalan, sonuçları kaydedilmemiş oturumları bulur
+    
+    Returns:
+        list: ResultJournal nesneleri (eskiden yeniye)
+    """
+    if not os.path.isdir(JOURNAL_DIR):
+        return []
+    
+    journals = []
+    for filename in sorted(os.listdir(JOURNAL_DIR)):
+        if filename.startswith("session_") and filename.endswith(".jsonl"):
+            journals.append(ResultJournal(os.path.join(JOURNAL_DIR, filename)))
+    return journals
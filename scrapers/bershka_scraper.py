@@ -1,18 +1,78 @@
 """
 Bershka Barkod Scraper (Selenium)
 """
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 import time
 import os
 import re
 import sys
+import threading
+import uuid
+import requests
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils import Colors, print_success, print_error, print_warning, print_info, print_highlight
+from lookup_cache import get_lookup_cache
+from lookup_timings import start_lookup, stage, set_strategy
+from scrapers.driver_manager import DriverManager
+from scrapers.page_readiness import (
+    get_readiness_recorder, BERSHKA_PROBE_JS, STATE_NO_RESULTS, STATE_TIMEOUT, PageNotReadyError
+)
+from scrapers.tab_pool import TAB_COUNT, load_page, get_tab_pool
+from scrapers.scan_queue import ScanQueue, split_results
+from scrapers.host_limiter import host_slot
+from scrapers.cookie_store import attach_cookie_jar
+
+
+# Ürün adının bulunabileceği seçiciler (öncelik sırasıyla)
+PRODUCT_SELECTORS = [
+    "p.bds-typography-label-s",
+    ".product-text p",
+    ".content-block_info p",
+    "[data-qa-anchor='productItemText'] p",
+    "p[class*='typography']"
+]
+
+# Inditex arama API'si (Zara ile aynı altyapı) - açıksa Selenium'dan önce denenir
+BERSHKA_API_URL = "https://www.bershka.com/itxrest/1/search/store/{store_id}/reference"
+BERSHKA_SEARCH_URL = "https://www.bershka.com/tr/q/{part1}%2F{part2}%2F{part3}"
+# Bershka Türkiye mağaza kimliği canlı API'ye karşı doğrulanmadı - bu yüzden API yolu varsayılan
+# olarak kapalıdır ve aramalar tarayıcıyla yapılır. Doğru kimlik bilinen ortamlarda
+# BERSHKA_API=1 ile açılır, kimlik BERSHKA_STORE_ID ortam değişkeniyle verilir.
+API_ENABLED = os.environ.get("BERSHKA_API") == "1"
+BERSHKA_STORE_ID = os.environ.get("BERSHKA_STORE_ID", "44009506")
+API_TIMEOUT = (3, 5)               # (bağlantı, okuma) saniye
+API_MAX_CONSECUTIVE_ERRORS = 3     # Üst üste bu kadar hata olursa API bu oturumda kapatılır
+SCAN_WORKERS = max(4, TAB_COUNT)   # API aramaları paralel, tam sayfalar sekme havuzunda
+API_NO_RESULT = "API'de sonuç yok"  # API sorunsuz yanıt verdi ama ürün yok
+
+_api_session = None
+_api_session_id = str(uuid.uuid4())
+_api_state = {"consecutive_errors": 0, "disabled": False}
+_api_lock = threading.Lock()
+
+
+class LookupPathStats:
+    """Arama yolu (API / Selenium) bazında isabet oranı ve süre istatistikleri"""
+    
+    def __init__(self):
+        self.paths = {}
+        self._lock = threading.Lock()
+    
+    def record(self, path, hit, seconds):
+        """Tek bir denemeyi kaydeder"""
+        with self._lock:
+            entry = self.paths.setdefault(path, {"attempts": 0, "hits": 0, "seconds": 0.0})
+            entry["attempts"] += 1
+            entry["seconds"] += seconds
+            if hit:
+                entry["hits"] += 1
+    
+    def print_summary(self):
+        """Yol bazında isabet oranı ve ortalama süreyi yazdırır"""
+        for path, entry in self.paths.items():
+            attempts = entry["attempts"]
+            hit_rate = entry["hits"] / attempts * 100
+            avg = entry["seconds"] / attempts
+            print_info(f"{path:<9}: {entry['hits']}/{attempts} isabet (%{hit_rate:.0f}), ortalama {avg:.2f} sn")
 
 
 def process_barcode(barcode):
@@ -28,46 +88,250 @@ def process_barcode(barcode):
     part2 = processed_barcode[4:7]  
     part3 = processed_barcode[7:]
     
-    url = f"https://www.bershka.com/tr/q/{part1}%2F{part2}%2F{part3}"
+    url = BERSHKA_SEARCH_URL.format(part1=part1, part2=part2, part3=part3)
     return url, f"{part1}/{part2}/{part3}"
 
 
-def run_bershka():
+def get_api_session():
+    """API istekleri için paylaşılan keep-alive oturumunu döndürür"""
+    global _api_session
+    with _api_lock:
+        if _api_session is None:
+            _api_session = requests.Session()
+            attach_cookie_jar(_api_session, "bershka_api", "BERSHKA")
+        return _api_session
+
+
+def is_api_enabled():
+    """API yolu açık mı ve bu oturumda hâlâ kullanılabilir mi"""
+    return API_ENABLED and not _api_state["disabled"]
+
+
+def build_api_params(reference):
+    """
+    Inditex arama API'sinin sorgu parametrelerini oluşturur
+    
+    Args:
+        reference (str): Eğik çizgisiz işlenmiş barkod (örn: "2104644040")
+    
+    Returns:
+        dict: Sorgu parametreleri
+    """
+    return {
+        'reference': reference,
+        'locale': 'tr_TR',
+        'session': _api_session_id,
+        'deviceType': 'desktop',
+        'deviceOS': 'Windows',
+        'deviceOSVersion': '10',
+        'scope': 'desktop',
+        'origin': 'search',
+        'ajax': 'true'
+    }
+
+
+def get_product_name_api(processed):
+    """
+    Bershka ürün adını Inditex arama API'sinden (JSON) çeker
+    
+    Args:
+        processed (str): İşlenmiş barkod (örn: "2104/644/040")
+    
+    Returns:
+        tuple: (ürün_adı, hata_mesajı) - Bulunursa (ad, None), bulunamazsa (None, mesaj)
+    """
+    params = build_api_params(processed.replace("/", ""))
+    
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.7390.108 Safari/537.36',
+        'Accept': 'application/json, text/plain, */*',
+        'Accept-Language': 'tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7',
+        'Referer': 'https://www.bershka.com/tr/',
+        'Origin': 'https://www.bershka.com'
+    }
+    
+    url = BERSHKA_API_URL.format(store_id=BERSHKA_STORE_ID)
+    
+    try:
+        with host_slot(url) as slot, stage('network'):
+            response = get_api_session().get(url, params=params, headers=headers, timeout=API_TIMEOUT)
+            slot.observe(response.status_code, response.headers)
+            response.raise_for_status()
+        with stage('parse'):
+            data = response.json()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        with _api_lock:
+            _api_state["consecutive_errors"] += 1
+            if _api_state["consecutive_errors"] >= API_MAX_CONSECUTIVE_ERRORS and not _api_state["disabled"]:
+                _api_state["disabled"] = True
+                print_warning("Bershka API art arda yanıt vermedi, bu oturumda yalnızca tarayıcı kullanılacak. "
+                              f"(Mağaza kimliği: {BERSHKA_STORE_ID} - BERSHKA_STORE_ID ortam değişkeniyle değiştirilebilir)")
+        return None, f"API hatası: {e}"
+    
+    with _api_lock:
+        _api_state["consecutive_errors"] = 0
+    
+    if data.get('status') == 'SUCCESS' and data.get('results'):
+        try:
+            return data['results'][0]['content']['name'], None
+        except (KeyError, IndexError, TypeError):
+            return None, "API yanıtı beklenen formatta değil"
+    
+    return None, API_NO_RESULT
+
+
+def get_product_name_selenium(driver_manager, url, stop_event=None):
+    """
+    Bershka arama sayfasını tarayıcıda (ısınmış tarayıcıda sekme havuzunda) açar ve ürün adını okur
+    
+    Args:
+        driver_manager (DriverManager): Tarayıcı yöneticisi
+        url (str): Arama sayfası URL'si
+        stop_event (threading.Event): İşaretlenmişse sayfa açılmadan vazgeçilir
+    
+    Returns:
+        str or None: Ürün adı, bulunamazsa (veya vazgeçildiyse) None
+    
+    Raises:
+        WebDriverException: Tarayıcı hatalarında
+        PageNotReadyError: Sayfa üst sınır içinde hazır olmadı ve ürün okunamadı
+    """
+    is_first_run = not driver_manager.is_warmed("BERSHKA")
+    
+    if is_first_run:
+        print_info("Sayfa yükleniyor... (İlk açılış, biraz bekleyin)")
+    else:
+        print_info("Sayfa yükleniyor...")
+    
+    with stage('render'):
+        page = load_page(
+            driver_manager, "BERSHKA", url, BERSHKA_PROBE_JS, (PRODUCT_SELECTORS,),
+            is_first=is_first_run, stop_event=stop_event
+        )
+    if page is None:
+        return None
+    state, elapsed, verdict = page
+    
+    if state == STATE_TIMEOUT:
+        print_warning(f"Sayfa {elapsed:.1f} saniyede hazır olmadı, mevcut içerik kontrol ediliyor...")
+    else:
+        print_success(f"Sayfa hazır! ({elapsed:.1f} sn)")
+    
+    if is_first_run:
+        driver_manager.mark_warmed("BERSHKA")
+        print_success("İlk yükleme tamamlandı! Sonraki aramalar daha hızlı olacak.\n")
+    
+    if state == STATE_NO_RESULTS:
+        return None
+    
+    with stage('parse'):
+        # Başlıklar yoklama betiğinde tekilleştirilip tek seferde döndü
+        unique_products = verdict.get('titles') or []
+    
+    if not unique_products:
+        # Süre dolduysa sayfa karar vermedi - "bulunamadı" diye önbelleğe yazılmamalı
+        if state == STATE_TIMEOUT:
+            raise PageNotReadyError(f"Sayfa {elapsed:.0f} sn içinde hazır olmadı")
+        return None
+    
+    if len(unique_products) > 1:
+        print_info(f"{len(unique_products)} ürün bulundu, ilk ürün seçildi.")
+    
+    return unique_products[0]
+
+
+def resolve_barcode(barcode, driver_manager, stop_event=None, path_stats=None):
+    """
+    Barkodu önbellek, JSON API ve gerekirse tam sayfa üzerinden çözer
+    (tarama kuyruğu ve karışık mod için)
+    
+    Args:
+        barcode (str): 10 veya 14 haneli barkod
+        driver_manager (DriverManager): Paylaşılan tarayıcı yöneticisi
+        stop_event (threading.Event): İşaretlenmişse tarayıcı yoluna girilmez
+        path_stats (LookupPathStats): Yol bazında istatistik (isteğe bağlı)
+    
+    Returns:
+        tuple: (işlenmiş_barkod, ürün_adı, hata_mesajı) - ürün yoksa (barkod, None, None)
+    """
+    with start_lookup("BERSHKA", "api"):
+        with stage('validate'):
+            url, processed = process_barcode(barcode.strip())
+        if url is None:
+            set_strategy("invalid")
+            return None, None, "Barkod işlenemedi!"
+        
+        cache = get_lookup_cache()
+        with stage('cache'):
+            cached, cached_name = cache.get("BERSHKA", processed)
+        if cached:
+            set_strategy("cache")
+            return processed, cached_name, None
+        
+        product_name = None
+        source = None
+        
+        # 1. Yol: JSON API (hızlı - yalnızca BERSHKA_API=1 ile açıksa)
+        if is_api_enabled():
+            start = time.perf_counter()
+            product_name, _ = get_product_name_api(processed)
+            if path_stats is not None:
+                path_stats.record("API", product_name is not None, time.perf_counter() - start)
+            if product_name:
+                source = "api"
+                print_info(f"⚡ API ile bulundu ({time.perf_counter() - start:.2f} sn)")
+        
+        # 2. Yol: Tarayıcıda tam sayfa - API'de bulunamayan her barkod arama sayfasında
+        # doğrulanır (yanlış mağaza kimliği gibi durumlar "bulunamadı" olarak önbelleğe yazılmaz)
+        if not product_name:
+            set_strategy("selenium")
+            start = time.perf_counter()
+            try:
+                product_name = get_product_name_selenium(driver_manager, url, stop_event)
+            except Exception as e:
+                if path_stats is not None:
+                    path_stats.record("Selenium", False, time.perf_counter() - start)
+                return processed, None, f"Hata: {e}"
+            # Karışık modda yarışı başka marka kazandıysa sayfa hiç açılmadı - sonuç kaydedilmez
+            if product_name is None and stop_event is not None and stop_event.is_set():
+                return processed, None, None
+            source = "selenium"
+            if path_stats is not None:
+                path_stats.record("Selenium", product_name is not None, time.perf_counter() - start)
+        
+        with stage('persist'):
+            cache.put("BERSHKA", processed, product_name, source)
+        return processed, product_name, None
+
+
+def run_bershka(driver_manager=None):
     """
     Bershka scraper'ı çalıştırır
     
+    Args:
+        driver_manager (DriverManager): Paylaşılan tarayıcı yöneticisi.
+            Verilmezse bu oturum için tarayıcı açılır ve sonunda kapatılır.
+    
     Returns:
         tuple: (found_products, not_found_products)
     """
-    found_products = []
-    not_found_products = []
-    
-    # Chrome ayarları
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
-    options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.7390.108 Safari/537.36")
-    
-    # ChromeDriver yolu (PyInstaller uyumlu)
-    if getattr(sys, 'frozen', False):
-        # EXE modunda
-        import main
-        chromedriver_path = main.CHROMEDRIVER_PATH
-    else:
-        # Normal Python modunda
-        chromedriver_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "chromedriver.exe")
-        if not os.path.exists(chromedriver_path):
-            chromedriver_path = "chromedriver"
+    path_stats = LookupPathStats()
+    
+    # Tarayıcı main.py tarafından yönetiliyorsa oturum sonunda kapatılmaz
+    owns_driver = driver_manager is None
+    if owns_driver:
+        driver_manager = DriverManager()
+    
+    scan_queue = ScanQueue(
+        lambda barcode: resolve_barcode(barcode, driver_manager, path_stats=path_stats),
+        brand="BERSHKA", workers=SCAN_WORKERS
+    )
+    cancelled = False
     
     try:
-        service = Service(chromedriver_path)
-        driver = webdriver.Chrome(service=service, options=options)
-        
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        if driver_manager.is_running():
+            print("♻ Açık tarayıcı kullanılıyor...")
+        driver_manager.get_driver()
         
         print(f"\n{Colors.BERSHKA}")
         print("═" * 70)
@@ -94,8 +358,6 @@ def run_bershka():
         print_success("⚡ Tarayıcı hazır! Barkod girmeye başlayabilirsiniz...")
         print(f"{Colors.INFO}{'─' * 70}{Colors.RESET}\n")
         
-        is_first_run = True
-        
         while True:
             barcode = input("Barkod giriniz: ").strip()
             
@@ -116,115 +378,22 @@ def run_bershka():
                 print_error("Barkod işlenemedi!")
                 continue
             
-            print_info(f"İşlenen: {processed}")
-            
-            try:
-                if is_first_run:
-                    print_info("Sayfa yükleniyor... (İlk açılış, biraz bekleyin)")
-                else:
-                    print_info("Sayfa yükleniyor...")
-                
-                driver.get(url)
-                
-                if is_first_run:
-                    wait_time = 40
-                    extra_wait = 20
-                    print_info(f"JavaScript yükleniyor... ({extra_wait} saniye)")
-                else:
-                    wait_time = 35
-                    extra_wait = 15
-                
-                wait = WebDriverWait(driver, wait_time)
-                
-                try:
-                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "body")))
-                    print_success("Sayfa yüklendi!")
-                except:
-                    print_warning("Sayfa yükleme sorunu...")
-                
-                time.sleep(extra_wait)
-                
-                if is_first_run:
-                    is_first_run = False
-                    print_success("İlk yükleme tamamlandı! Sonraki aramalar daha hızlı olacak.\n")
-                
-                page_source = driver.page_source
-                
-                has_no_results = "Sonuç yok" in page_source
-                
-                if has_no_results:
-                    result_line = f"{processed} BERSHKA Ürün Bulunamadı"
-                    not_found_products.append(result_line)
-                    print_error(f"{result_line}")
-                    print_success("Tamamlandı!\n")
-                    continue
-                
-                selectors_to_try = [
-                    "p.bds-typography-label-s",
-                    ".product-text p",
-                    ".content-block_info p", 
-                    "[data-qa-anchor='productItemText'] p",
-                    "p[class*='typography']"
-                ]
-                
-                elements = []
-                for selector in selectors_to_try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if len(elements) > 0:
-                        break
-                
-                if len(elements) == 0:
-                    result_line = f"{processed} BERSHKA Ürün Bulunamadı"
-                    not_found_products.append(result_line)
-                    print(f"❌ {result_line}")
-                    print("✅ Tamamlandı!\n")
-                    continue
-                
-                if len(elements) > 0:
-                    unique_products = []
-                    seen = set()
-                    
-                    for e in elements:
-                        text = e.text.strip()
-                        if text and len(text) > 2 and text not in seen:
-                            unique_products.append(text)
-                            seen.add(text)
-                    
-                    if len(unique_products) == 1:
-                        product_name = unique_products[0].title()
-                        result_line = f"{processed} BERSHKA {product_name}"
-                        found_products.append(result_line)
-                        print_success(f"{result_line}")
-                    elif len(unique_products) > 1:
-                        product_name = unique_products[0].title()
-                        result_line = f"{processed} BERSHKA {product_name}"
-                        found_products.append(result_line)
-                        print_success(f"İlk ürün seçildi: {result_line}")
-                    else:
-                        result_line = f"{processed} BERSHKA Ürün Bulunamadı"
-                        not_found_products.append(result_line)
-                        print_error(f"{result_line}")
-                else:
-                    result_line = f"{processed} BERSHKA Ürün Bulunamadı"
-                    not_found_products.append(result_line)
-                    print_error(f"{result_line}")
-                
-                print_success("Tamamlandı!\n")
-                
-            except Exception as e:
-                print_error(f"Hata: {e}")
-                result_line = f"{processed} BERSHKA Ürün Bulunamadı (Hata)"
-                not_found_products.append(result_line)
-                print_success("Tamamlandı!\n")
+            # Arama arka planda yapılır - sıradaki barkod hemen okutulabilir
+            print_info(f"İşlenen: {processed} (kuyruğa eklendi)")
+            scan_queue.submit(barcode)
     
     except KeyboardInterrupt:
         print(f"\n\n{Colors.WARNING}⚠ Program kullanıcı tarafından durduruldu!{Colors.RESET}")
+        cancelled = True
     finally:
-        try:
-            driver.quit()
-            print_success("Tarayıcı kapatıldı.")
-        except:
-            pass
+        # Bekleyen aramaları bitir (durdurulduysa başlamamış olanları atla)
+        found_products, not_found_products = split_results(scan_queue.drain(cancel=cancelled))
+        path_stats.print_summary()
+        get_tab_pool(driver_manager).print_summary()
+        driver_manager.watchdog.print_summary()
+        get_readiness_recorder().print_summary("BERSHKA")
+        if owns_driver:
+            driver_manager.quit()
     
     return found_products, not_found_products
 
@@ -0,0 +1,154 @@
+"""
+Tarayıcı Bekçisi
+Uzun Selenium oturumlarında Chrome'un bellek kullanımını ve sayfa sürelerini izler. Sayfa
+sayısı, bellek veya yavaşlama sınırı aşılınca tarayıcı iki sayfa arasında yenilenir; çöken
+sekme / renderer hataları tanınır ve o barkod yeni tarayıcıda tekrar denenir.
+"""
+import statistics
+import threading
+from collections import deque
+
+
+RECYCLE_AFTER_PAGES = 400       # Bu kadar sayfadan sonra tarayıcı yenilenir
+RECYCLE_MEMORY_MB = 1500        # Chrome süreçlerinin toplam RSS sınırı (psutil kuruluysa)
+RECYCLE_HEAP_MB = 300           # psutil yoksa: ölçülen sayfanın JS heap sınırı
+SAMPLE_EVERY_PAGES = 10         # Bellek ölçümü sıklığı (sayfa)
+LATENCY_WINDOW = 20             # Yavaşlama karşılaştırmasında kullanılan sayfa sayısı
+LATENCY_SLOWDOWN = 2.5          # Son sayfaların medyanı ilk sayfalarınkinin bu katına çıkarsa yenilenir
+CRASH_RETRIES = 1               # Renderer çöktüğünde sayfa yeni tarayıcıda kaç kez tekrar açılır
+
+# Renderer veya tarayıcı oturumunun öldüğünü gösteren hata metinleri (küçük harf)
+DEAD_RENDERER_MARKERS = (
+    "tab crashed", "target crashed", "page crash", "session deleted", "invalid session id",
+    "chrome not reachable", "target window already closed", "no such window", "disconnected",
+    "connection refused", "max retries exceeded",
+)
+
+HEAP_JS = "return performance.memory ? performance.memory.usedJSHeapSize : 0;"
+
+
+def is_dead_renderer(error):
+    """Hata, sekmenin / tarayıcının çöktüğünü mü gösteriyor (sayfa yeni tarayıcıda tekrar denenir)"""
+    message = str(error).lower()
+    return any(marker in message for marker in DEAD_RENDERER_MARKERS)
+
+
+def chrome_rss_mb(driver):
+    """chromedriver'ın başlattığı tüm Chrome süreçlerinin toplam RSS'i (psutil yoksa None)"""
+    try:
+        import psutil
+    except ImportError:
+        return None
+    
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = root.children(recursive=True)
+        return sum(process.memory_info().rss for process in processes) / (1024 * 1024)
+    except (psutil.Error, AttributeError):
+        return None
+
+
+class BrowserWatchdog:
+    """Tek bir tarayıcının sayfa sayısını, belleğini ve sayfa sürelerini izler"""
+    
+    def __init__(self, max_pages=RECYCLE_AFTER_PAGES, max_memory_mb=RECYCLE_MEMORY_MB):
+        """
+        Bekçiyi hazırlar
+        
+        Args:
+            max_pages (int): Yenilemeden önce açılacak en fazla sayfa
+            max_memory_mb (float): Chrome süreçlerinin toplam RSS sınırı (MB)
+        """
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        
+        # Gösterge sayaçları (tarayıcı yenilense de korunur)
+        self.total_pages = 0
+        self.recycles = 0
+        self.crashes = 0
+        self.retries = 0
+        self.peak_memory_mb = None
+        
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        """Yeni tarayıcı için ölçümleri sıfırlar"""
+        with self._lock:
+            self.pages = 0
+            self.memory_mb = None
+            self.memory_source = None       # "rss" (psutil) veya "heap" (sayfanın JS heap'i)
+            self._first_latencies = []
+            self._recent_latencies = deque(maxlen=LATENCY_WINDOW)
+            self._reason = None
+    
+    def record_page(self, driver, seconds):
+        """
+        Tamamlanan sayfayı kaydeder ve gerekirse belleği ölçer
+        
+        Args:
+            driver (webdriver.Chrome): Sayfanın açıldığı sürücü
+            seconds (float): Sayfanın hazır olma süresi
+        """
+        with self._lock:
+            self.pages += 1
+            self.total_pages += 1
+            if len(self._first_latencies) < LATENCY_WINDOW:
+                self._first_latencies.append(seconds)
+            self._recent_latencies.append(seconds)
+            sample = self.pages % SAMPLE_EVERY_PAGES == 0
+        
+        if sample:
+            self._sample_memory(driver)
+        with self._lock:
+            self._reason = self._check()
+    
+    def _sample_memory(self, driver):
+        """Chrome RSS'ini (psutil) veya yoksa o anki sayfanın JS heap'ini ölçer"""
+        memory_mb = chrome_rss_mb(driver)
+        source = "rss"
+        if memory_mb is None:
+            try:
+                memory_mb = (driver.execute_script(HEAP_JS) or 0) / (1024 * 1024)
+            except Exception:
+                return
+            source = "heap"
+        
+        with self._lock:
+            self.memory_mb = memory_mb
+            self.memory_source = source
+            if self.peak_memory_mb is None or memory_mb > self.peak_memory_mb[0]:
+                self.peak_memory_mb = (memory_mb, source)
+    
+    def _check(self):
+        """Yenileme nedeni (kilit altında çağrılır) - gerek yoksa None"""
+        if self.pages >= self.max_pages:
+            return f"{self.pages} sayfa açıldı"
+        
+        if self.memory_mb is not None:
+            limit = self.max_memory_mb if self.memory_source == "rss" else RECYCLE_HEAP_MB
+            if self.memory_mb >= limit:
+                return f"bellek {self.memory_mb:.0f} MB"
+        
+        if len(self._first_latencies) >= LATENCY_WINDOW and len(self._recent_latencies) >= LATENCY_WINDOW:
+            baseline = statistics.median(self._first_latencies)
+            recent = statistics.median(self._recent_latencies)
+            if baseline > 0 and recent >= baseline * LATENCY_SLOWDOWN:
+                return f"sayfalar yavaşladı ({baseline:.1f} sn → {recent:.1f} sn)"
+        return None
+    
+    def recycle_reason(self):
+        """Tarayıcı yenilenmeli mi - nedeni veya None"""
+        return self._reason
+    
+    def print_summary(self):
+        """Bekçi özetini yazdırır"""
+        if not self.total_pages:
+            return
+        text = f"🩺 Tarayıcı: {self.total_pages} sayfa, {self.recycles} yenileme"
+        if self.crashes:
+            text += f", {self.crashes} çökme ({self.retries} sayfa tekrar açıldı)"
+        if self.peak_memory_mb is not None:
+            memory_mb, source = self.peak_memory_mb
+            text += f", en yüksek bellek {memory_mb:.0f} MB ({'Chrome' if source == 'rss' else 'JS heap'})"
+        print(text)
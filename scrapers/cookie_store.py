@@ -0,0 +1,135 @@
+"""
+Kalıcı HTTP Çerezleri
+requests / curl_cffi oturumlarının çerezleri program kapanırken diske yazılır ve bir sonraki
+açılışta geri yüklenir - siteler her çalıştırmada çerez ve anti-bot kurulumunu baştan istemez
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from http.cookiejar import Cookie
+from lookup_timings import set_start_state
+
+
+COOKIES_DIR = os.path.join("outputs", "cookies")
+COOKIE_JAR_MAX_AGE = 24 * 60 * 60   # Bundan eski dosyalar hiç yüklenmez (oturum çerezleri dahil)
+
+_attached = {}                      # {dosya_adı: oturum}
+_attached_lock = threading.Lock()
+
+
+def cookie_file(name):
+    """Oturumun çerez dosyası"""
+    return os.path.join(COOKIES_DIR, f"{name}.json")
+
+
+def get_jar(session):
+    """requests (RequestsCookieJar) ve curl_cffi (Cookies.jar) için standart CookieJar"""
+    return getattr(session.cookies, 'jar', session.cookies)
+
+
+def load_cookies(session, name):
+    """
+    Kayıtlı çerezleri oturuma yükler (süresi geçen çerezler ve eski dosyalar atlanır)
+    
+    Args:
+        session: requests veya curl_cffi oturumu
+        name (str): Çerez dosyasının adı
+    
+    Returns:
+        int: Yüklenen çerez sayısı
+    """
+    path = cookie_file(name)
+    try:
+        if time.time() - os.path.getmtime(path) > COOKIE_JAR_MAX_AGE:
+            return 0
+        with open(path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return 0
+    
+    jar = get_jar(session)
+    now = time.time()
+    restored = 0
+    for entry in entries:
+        expires = entry.get("expires")
+        if expires is not None and expires <= now:
+            continue
+        domain = entry.get("domain", "")
+        jar.set_cookie(Cookie(
+            version=0, name=entry["name"], value=entry["value"],
+            port=None, port_specified=False,
+            domain=domain, domain_specified=bool(domain), domain_initial_dot=domain.startswith("."),
+            path=entry.get("path", "/"), path_specified=True,
+            secure=entry.get("secure", False), expires=expires, discard=expires is None,
+            comment=None, comment_url=None, rest={},
+        ))
+        restored += 1
+    return restored
+
+
+def save_cookies(session, name):
+    """
+    Oturumun çerezlerini geçici dosya üzerinden diske yazar
+    
+    Args:
+        session: requests veya curl_cffi oturumu
+        name (str): Çerez dosyasının adı
+    """
+    now = time.time()
+    entries = []
+    for cookie in list(get_jar(session)):
+        if cookie.expires is not None and cookie.expires <= now:
+            continue
+        entries.append({
+            "name": cookie.name,
+            "value": cookie.value,
+            "domain": cookie.domain,
+            "path": cookie.path,
+            "secure": cookie.secure,
+            "expires": cookie.expires,
+        })
+    if not entries:
+        return
+    
+    path = cookie_file(name)
+    temp_file = path + ".tmp"
+    try:
+        os.makedirs(COOKIES_DIR, exist_ok=True)
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, ensure_ascii=False)
+        os.replace(temp_file, path)
+    except OSError:
+        pass
+
+
+def attach_cookie_jar(session, name, brand):
+    """
+    Oturuma kayıtlı çerezleri yükler ve program kapanırken çerezlerin kaydedilmesini sağlar
+    
+    Args:
+        session: requests veya curl_cffi oturumu
+        name (str): Çerez dosyasının adı
+        brand (str): Marka adı (ilk arama süresi "warm" / "cold" olarak etiketlenir)
+    
+    Returns:
+        int: Yüklenen çerez sayısı
+    """
+    restored = load_cookies(session, name)
+    if restored:
+        set_start_state(brand, "warm")
+    
+    with _attached_lock:
+        if not _attached:
+            atexit.register(save_all)
+        _attached[name] = session
+    return restored
+
+
+def save_all():
+    """Bağlı tüm oturumların çerezlerini kaydeder"""
+    with _attached_lock:
+        sessions = list(_attached.items())
+    for name, session in sessions:
+        save_cookies(session, name)
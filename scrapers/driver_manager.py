@@ -0,0 +1,368 @@
+"""
+Chrome WebDriver Yöneticisi
+Tarayıcıyı bir kez başlatır ve marka oturumları arasında sıcak tutar
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from lookup_timings import set_start_state
+from scrapers.browser_watchdog import BrowserWatchdog
+
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.7390.108 Safari/537.36"
+
+# Hafif profil: sayfadan yalnızca ürün adı ve data-articlecode okunduğu için görseller,
+# yazı tipleri, video ve analitik/reklam betikleri hiç indirilmez
+LEAN_PROFILE = True
+LEAN_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+}
+# Kalıcı profil: çerezler, onay ve anti-bot durumu program kapansa da korunur, ilk sayfa
+# yeniden "ilk açılış" gibi beklemez. Aynı anda ikinci bir program açıksa profil kilitli
+# olduğu için geçici profille devam edilir.
+PERSIST_PROFILE = True
+PROFILE_DIR = os.path.join("outputs", "browser_profile")
+BROWSER_STATE_FILE = os.path.join("outputs", "browser_state.json")
+WARM_STATE_TTL = 6 * 60 * 60    # Kayıtlı ısınma bu kadar saniye geçerli sayılır
+HEALTH_CHECK_INTERVAL = 30      # Son başarılı komuttan bu kadar saniye sonra sağlık kontrolü yapılır
+
+# CDP Network.setBlockedURLs desenleri (* joker karakter) - site betikleri ve CSS engellenmez,
+# anti-bot kontrolleri ve ürün listesi bunlara bağlı
+BLOCKED_URL_PATTERNS = [
+    # Görseller (CSS arka planları ve <picture> kaynakları dahil)
+    "*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.avif*", "*.svg*", "*.ico*",
+    # Yazı tipleri
+    "*.woff*", "*.ttf*", "*.otf*",
+    # Video ve ses
+    "*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*",
+    # Analitik, reklam ve oturum kaydı
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googleadservices.com*", "*facebook.net*", "*facebook.com/tr*", "*hotjar*",
+    "*criteo*", "*clarity.ms*", "*tiktok*", "*pinterest*", "*snapchat*",
+    "*bat.bing.com*", "*yandex*", "*quantummetric*", "*contentsquare*",
+    "*glassbox*", "*nr-data.net*", "*newrelic*",
+]
+
+_chromedriver_path = None
+
+
+def get_chromedriver_path():
+    """
+    ChromeDriver yolunu döndürür (PyInstaller uyumlu)
+    İlk Selenium markası başlatılırken bir kez çözülür - program açılışını yavaşlatmaz.
+    
+    Returns:
+        str: chromedriver dosyasının yolu
+    """
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        _chromedriver_path = _resolve_chromedriver_path()
+    return _chromedriver_path
+
+
+def _resolve_chromedriver_path():
+    """ChromeDriver'ın doğru yolunu bulur"""
+    if getattr(sys, 'frozen', False):
+        # EXE modunda - geçici klasöre çıkar
+        if hasattr(sys, '_MEIPASS'):
+            # PyInstaller'ın geçici klasörü
+            chromedriver_bundled = os.path.join(sys._MEIPASS, 'chromedriver.exe')
+            
+            # Geçici klasöre kopyala (yazılabilir olması için)
+            chromedriver_temp = os.path.join(tempfile.gettempdir(), 'chromedriver.exe')
+            if not os.path.exists(chromedriver_temp):
+                shutil.copy2(chromedriver_bundled, chromedriver_temp)
+            
+            return chromedriver_temp
+        # Eski PyInstaller veya farklı paketleyici
+        return os.path.join(os.path.dirname(sys.executable), 'chromedriver.exe')
+    
+    # Normal Python modunda
+    chromedriver_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "chromedriver.exe")
+    if not os.path.exists(chromedriver_path):
+        chromedriver_path = "chromedriver"
+    return chromedriver_path
+
+
+def build_chrome_options(lean=LEAN_PROFILE, profile_dir=None):
+    """
+    Bershka ve H&M için ortak headless Chrome ayarlarını oluşturur
+    
+    Args:
+        lean (bool): Görseller ve medya kapalı hafif profil
+        profile_dir (str): Kalıcı kullanıcı veri klasörü - None ise geçici profil
+    
+    Returns:
+        Options: Chrome ayarları
+    """
+    from selenium.webdriver.chrome.options import Options
+    
+    options = Options()
+    options.page_load_strategy = 'eager'
+    options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    options.add_argument(f"--user-agent={USER_AGENT}")
+    # Sekme havuzunda arka planda kalan sekmelerin zamanlayıcı ve çizimi yavaşlatılmasın
+    options.add_argument("--disable-background-timer-throttling")
+    options.add_argument("--disable-backgrounding-occluded-windows")
+    options.add_argument("--disable-renderer-backgrounding")
+    if lean:
+        options.add_experimental_option("prefs", LEAN_PREFS)
+        # Headless modda prefs her sürümde uygulanmadığı için Blink ayarı da verilir
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--mute-audio")
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={os.path.abspath(profile_dir)}")
+    return options
+
+
+def load_warm_state():
+    """
+    Kalıcı profilde ilk yüklemesi yapılmış markaları okur (süresi geçenler atlanır)
+    
+    Returns:
+        dict: {marka: ısınma_zamanı (epoch)}
+    """
+    try:
+        with open(BROWSER_STATE_FILE, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    now = time.time()
+    return {brand: warmed_at for brand, warmed_at in state.get("warmed", {}).items()
+            if now - warmed_at < WARM_STATE_TTL}
+
+
+def save_warm_state(warmed):
+    """Isınma zamanlarını geçici dosya üzerinden yazar"""
+    temp_file = BROWSER_STATE_FILE + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(BROWSER_STATE_FILE), exist_ok=True)
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({"warmed": warmed}, f, ensure_ascii=False)
+        os.replace(temp_file, BROWSER_STATE_FILE)
+    except OSError:
+        pass
+
+
+def apply_resource_blocking(driver):
+    """
+    Görsel, yazı tipi, medya ve analitik isteklerini CDP ile engeller
+    
+    Args:
+        driver (webdriver.Chrome): Çalışan sürücü
+    """
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        # Engelleme yalnızca hız için - uygulanamazsa sayfalar normal yüklenir
+        print(f"⚠ Kaynak engelleme uygulanamadı: {e}")
+
+
+class DriverManager:
+    """Tek bir Chrome örneğini tembel başlatır, sağlığını kontrol eder ve paylaştırır"""
+    
+    def __init__(self, lean=LEAN_PROFILE, persistent=PERSIST_PROFILE):
+        """
+        Yöneticiyi hazırlar (Chrome ilk get_driver çağrısında açılır)
+        
+        Args:
+            lean (bool): Hafif profil (görsel/medya/analitik engelli) - karşılaştırma için kapatılabilir
+            persistent (bool): Kalıcı profil (çerezler ve ısınma durumu çalıştırmalar arasında korunur)
+        """
+        self.lean = lean
+        self.persistent = persistent
+        # Kalıcı profille açılan tarayıcıda önceki çalıştırmalardan geçerli ısınma kayıtları
+        self._saved_warm = {}
+        self._profile_in_use = False
+        self._driver = None
+        self._lock = threading.RLock()
+        # Tek tarayıcı var - sayfa yükleyen aramalar bu kilitle sıraya girer
+        self.page_lock = threading.Lock()
+        # Bu tarayıcıda ilk yüklemesi (çerez, anti-bot) tamamlanan markalar
+        self._warmed_brands = set()
+        # Gönderilen WebDriver komutu sayısı (her komut tarayıcıya bir gidiş-dönüş)
+        self.commands = 0
+        self._commands_lock = threading.Lock()
+        # Son başarılı komutun zamanı - komut hata verince None (sonraki get_driver kontrol eder)
+        self._last_ok = None
+        # Bellek, sayfa sayısı ve yavaşlamaya göre yenileme kararı
+        self.watchdog = BrowserWatchdog()
+    
+    def get_driver(self):
+        """
+        Canlı sürücüyü döndürür - yoksa başlatır, çökmüşse yenisiyle değiştirir
+        
+        Returns:
+            webdriver.Chrome: Kullanıma hazır sürücü
+        """
+        with self._lock:
+            # Sürücü az önce komut kabul ettiyse canlıdır - her çağrıda gidiş-dönüş yapılmaz
+            if self._driver is not None and self._needs_health_check() and not self.is_alive():
+                print("⚠ Tarayıcı yanıt vermiyor, yeniden başlatılıyor...")
+                self._discard()
+            
+            if self._driver is None:
+                self._driver = self._start()
+            
+            return self._driver
+    
+    def is_alive(self):
+        """
+        Sürücünün hâlâ komut kabul edip etmediğini kontrol eder
+        
+        Returns:
+            bool: Sürücü sağlıklıysa True
+        """
+        with self._lock:
+            if self._driver is None:
+                return False
+            try:
+                self._driver.execute_script("return 1")
+                return True
+            except Exception:
+                return False
+    
+    def _needs_health_check(self):
+        """Son komut hata verdiyse veya HEALTH_CHECK_INTERVAL'dan uzun süredir komut yoksa True"""
+        last_ok = self._last_ok
+        return last_ok is None or time.monotonic() - last_ok > HEALTH_CHECK_INTERVAL
+    
+    def is_running(self):
+        """Tarayıcı başlatılmış mı (sağlık kontrolü yapmadan)"""
+        return self._driver is not None
+    
+    def is_warmed(self, brand):
+        """Marka için ilk yükleme bu tarayıcıda (veya geçerli kayıtlı profilde) yapıldı mı"""
+        return brand in self._warmed_brands or brand in self._saved_warm
+    
+    def mark_warmed(self, brand):
+        """Marka için ilk yüklemenin tamamlandığını işaretler (kalıcı profilde diske de yazılır)"""
+        self._warmed_brands.add(brand)
+        if self._profile_in_use:
+            self._saved_warm[brand] = time.time()
+            save_warm_state(self._saved_warm)
+    
+    def record_page(self, seconds):
+        """
+        Tamamlanan sayfayı bekçiye bildirir (page_lock altında çağrılır)
+        
+        Args:
+            seconds (float): Sayfanın hazır olma süresi
+        """
+        if self._driver is not None:
+            self.watchdog.record_page(self._driver, seconds)
+    
+    def recycle_if_due(self):
+        """
+        Bekçi sınırı aşıldıysa tarayıcıyı kapatır - yenisi sonraki get_driver'da açılır
+        Açık sayfa yokken (page_lock altında, iki sayfa arasında) çağrılır.
+        
+        Returns:
+            bool: Tarayıcı yenilendiyse True
+        """
+        reason = self.watchdog.recycle_reason()
+        if reason is None:
+            return False
+        with self._lock:
+            if self._driver is not None:
+                print(f"♻ Tarayıcı yenileniyor ({reason})...")
+                self._discard()
+                self.watchdog.recycles += 1
+        return True
+    
+    def restart_after_crash(self, driver):
+        """
+        Sekmesi / renderer'ı çöken tarayıcıyı kapatır (yenisi sonraki get_driver'da açılır)
+        
+        Args:
+            driver (webdriver.Chrome): Hatanın alındığı sürücü - zaten yenilendiyse hiçbir şey yapılmaz
+        """
+        with self._lock:
+            if self._driver is not None and self._driver is driver:
+                print("⚠ Tarayıcı sekmesi çöktü, yeniden başlatılıyor...")
+                self._discard()
+                self.watchdog.crashes += 1
+    
+    def quit(self):
+        """Tarayıcıyı kapatır"""
+        with self._lock:
+            if self._driver is not None:
+                self._discard()
+                print("Tarayıcı kapatıldı.")
+    
+    def _start(self):
+        """Yeni bir Chrome örneği başlatır"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        
+        driver = None
+        if self.persistent:
+            try:
+                driver = webdriver.Chrome(
+                    service=Service(get_chromedriver_path()),
+                    options=build_chrome_options(self.lean, PROFILE_DIR)
+                )
+                self._profile_in_use = True
+                self._saved_warm = load_warm_state()
+                for brand in self._saved_warm:
+                    set_start_state(brand, "warm")
+            except Exception as e:
+                # Profil başka bir Chrome tarafından kilitli olabilir (programın ikinci kopyası)
+                if "user data directory" not in str(e).lower():
+                    raise
+                print("⚠ Kalıcı tarayıcı profili kullanımda, geçici profille devam ediliyor...")
+        if driver is None:
+            driver = webdriver.Chrome(
+                service=Service(get_chromedriver_path()),
+                options=build_chrome_options(self.lean)
+            )
+            self._profile_in_use = False
+            self._saved_warm = {}
+        self._count_commands(driver)
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        if self.lean:
+            apply_resource_blocking(driver)
+        return driver
+    
+    def _count_commands(self, driver):
+        """
+        Sürücünün (ve elementlerinin) tüm komutlarının geçtiği execute'u sayaçla sarar
+        (son başarılı komutun zamanı sağlık kontrolünü atlamak için tutulur)
+        """
+        execute = driver.execute
+        
+        def counted_execute(driver_command, params=None):
+            with self._commands_lock:
+                self.commands += 1
+            try:
+                response = execute(driver_command, params)
+            except Exception:
+                self._last_ok = None
+                raise
+            self._last_ok = time.monotonic()
+            return response
+        
+        driver.execute = counted_execute
+    
+    def _discard(self):
+        """Mevcut sürücüyü kapatır ve ısınma durumunu sıfırlar"""
+        try:
+            self._driver.quit()
+        except Exception:
+            pass
+        self._driver = None
+        self._last_ok = None
+        self._warmed_brands.clear()
+        self.watchdog.reset()
@@ -1,15 +1,19 @@
 """
 H&M Barkod Scraper (Selenium)
 """
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
 import os
 import sys
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from lookup_cache import get_lookup_cache
+from lookup_timings import start_lookup, stage, set_strategy
+from scrapers.driver_manager import DriverManager
+from scrapers.page_readiness import get_readiness_recorder, HM_PROBE_JS, STATE_TIMEOUT, PageNotReadyError
+from scrapers.tab_pool import TAB_COUNT, load_page, get_tab_pool
+from scrapers.scan_queue import ScanQueue, split_results
+
+
+HM_SEARCH_URL = "https://www2.hm.com/tr_tr/search-results.html?q={barcode}"
+SCAN_WORKERS = TAB_COUNT        # Tek tarayıcı - sayfalar sekme havuzunda birlikte yüklenir, okutma beklemez
 
 
 def process_barcode(barcode):
@@ -22,42 +26,119 @@ def process_barcode(barcode):
         return barcode
 
 
-def run_hm():
+def get_product_name_selenium(driver_manager, barcode, stop_event=None):
+    """
+    H&M arama sayfasını tarayıcıda (ısınmış tarayıcıda sekme havuzunda) açar ve barkodla
+    eşleşen ürünün adını okur
+    
+    Args:
+        driver_manager (DriverManager): Tarayıcı yöneticisi
+        barcode (str): İşlenmiş barkod (10 karakter)
+        stop_event (threading.Event): İşaretlenmişse sayfa açılmadan vazgeçilir
+    
+    Returns:
+        str or None: Ürün adı, bulunamazsa (veya vazgeçildiyse) None (tarayıcı hatalarında exception fırlatır)
+    
+    Raises:
+        PageNotReadyError: Sayfa üst sınır içinde hazır olmadı ve ürün okunamadı
+    """
+    url = HM_SEARCH_URL.format(barcode=barcode)
+    print(f"URL: {url}")
+    
+    is_first_run = not driver_manager.is_warmed("H&M")
+    
+    print("Sayfa yükleniyor...")
+    with stage('render'):
+        page = load_page(
+            driver_manager, "H&M", url, HM_PROBE_JS, (barcode,),
+            is_first=is_first_run, stop_event=stop_event
+        )
+    if page is None:
+        return None
+    state, elapsed, verdict = page
+    driver_manager.mark_warmed("H&M")
+    
+    if state == STATE_TIMEOUT:
+        print(f"⚠ Ürün bilgileri {elapsed:.1f} saniyede bulunamadı, devam ediliyor...")
+    else:
+        print(f"✓ Sayfa hazır! ({elapsed:.1f} sn)")
+    
+    print("Ürün kontrol ediliyor...")
+    
+    with stage('parse'):
+        # Eşleşen article ve başlığı yoklama betiğinde tek seferde okundu
+        product_name = verdict.get('name')
+        if not product_name:
+            # Süre dolduysa sayfa karar vermedi - "bulunamadı" diye önbelleğe yazılmamalı
+            if state == STATE_TIMEOUT:
+                raise PageNotReadyError(f"Sayfa {elapsed:.0f} sn içinde hazır olmadı")
+            return None
+        print(f"✓ Eşleşen ürün bulundu: {barcode}")
+        return product_name
+
+
+def resolve_barcode(barcode_input, driver_manager, stop_event=None):
+    """
+    Barkodu önbellek ve tarayıcı üzerinden çözer (tarama kuyruğu ve karışık mod için)
+    
+    Args:
+        barcode_input (str): 10 veya 29 karakterlik barkod
+        driver_manager (DriverManager): Paylaşılan tarayıcı yöneticisi
+        stop_event (threading.Event): İşaretlenmişse sayfa açılmadan vazgeçilir
+    
+    Returns:
+        tuple: (işlenmiş_barkod, ürün_adı, hata_mesajı) - ürün yoksa (barkod, None, None)
+    """
+    with start_lookup("H&M", "selenium"):
+        with stage('validate'):
+            barcode = process_barcode(barcode_input.strip())
+        
+        cache = get_lookup_cache()
+        with stage('cache'):
+            cached, cached_name = cache.get("H&M", barcode)
+        if cached:
+            set_strategy("cache")
+            return barcode, cached_name, None
+        
+        try:
+            product_name = get_product_name_selenium(driver_manager, barcode, stop_event)
+        except Exception as e:
+            return barcode, None, f"Hata: {e}"
+        # Karışık modda yarışı başka marka kazandıysa sayfa hiç açılmadı - sonuç kaydedilmez
+        if product_name is None and stop_event is not None and stop_event.is_set():
+            return barcode, None, None
+        
+        with stage('persist'):
+            cache.put("H&M", barcode, product_name, "selenium")
+        return barcode, product_name, None
+
+
+def run_hm(driver_manager=None):
     """
     H&M scraper'ı çalıştırır
     
+    Args:
+        driver_manager (DriverManager): Paylaşılan tarayıcı yöneticisi.
+            Verilmezse bu oturum için tarayıcı açılır ve sonunda kapatılır.
+    
     Returns:
         tuple: (found_products, not_found_products)
     """
-    found_products = []
-    not_found_products = []
-    
-    # Chrome ayarları
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
-    options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.7390.108 Safari/537.36")
-    
-    # ChromeDriver yolu (PyInstaller uyumlu)
-    if getattr(sys, 'frozen', False):
-        # EXE modunda
-        import main
-        chromedriver_path = main.CHROMEDRIVER_PATH
-    else:
-        # Normal Python modunda
-        chromedriver_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "chromedriver.exe")
-        if not os.path.exists(chromedriver_path):
-            chromedriver_path = "chromedriver"
+    # Tarayıcı main.py tarafından yönetiliyorsa oturum sonunda kapatılmaz
+    owns_driver = driver_manager is None
+    if owns_driver:
+        driver_manager = DriverManager()
+    
+    scan_queue = ScanQueue(
+        lambda barcode_input: resolve_barcode(barcode_input, driver_manager),
+        brand="H&M", workers=SCAN_WORKERS
+    )
+    cancelled = False
     
     try:
-        service = Service(chromedriver_path)
-        driver = webdriver.Chrome(service=service, options=options)
-        
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        if driver_manager.is_running():
+            print("♻ Açık tarayıcı kullanılıyor...")
+        driver_manager.get_driver()
         
         print("\n" + "═" * 70)
         print("║                                                                    ║")
@@ -101,73 +182,22 @@ def run_hm():
                 continue
             
             barcode = process_barcode(barcode_input)
-            print(f"Orijinal: {barcode_input}")
-            print(f"İşlenen: {barcode}")
             
-            url = f"https://www2.hm.com/tr_tr/search-results.html?q={barcode}"
-            print(f"URL: {url}")
-            
-            try:
-                print("Sayfa yükleniyor...")
-                driver.get(url)
-                
-                wait = WebDriverWait(driver, 15)
-                
-                try:
-                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".product-item, .item-heading, [class*='product'], h3")))
-                    print("✓ Ürün bilgileri yüklendi!")
-                except:
-                    print("⚠ Ürün bilgileri bulunamadı, devam ediliyor...")
-                
-                time.sleep(3)
-                
-                print("Ürün kontrol ediliyor...")
-                
-                # data-articlecode attribute'u olan article elementlerini bul
-                articles_with_articlecode = driver.find_elements(By.CSS_SELECTOR, "article[data-articlecode]")
-                
-                # Bu barkodla eşleşen article var mı?
-                matching_articles = []
-                for article in articles_with_articlecode:
-                    articlecode = article.get_attribute("data-articlecode")
-                    if articlecode == barcode:
-                        matching_articles.append(article)
-                        print(f"✓ Eşleşen ürün bulundu: {articlecode}")
-                
-                # Sonuçları işle ve kaydet
-                if len(matching_articles) > 0:
-                    # Ürün bulundu - ilk eşleşen articleden ürün adını al
-                    first_article = matching_articles[0]
-                    product_name_element = first_article.find_element(By.CSS_SELECTOR, "h3")
-                    product_name = product_name_element.text.strip()
-                    
-                    # Format: barkod H&M ürün_ismi (baş harfleri büyük)
-                    formatted_product_name = product_name.title()
-                    result_line = f"{barcode} H&M {formatted_product_name}"
-                    found_products.append(result_line)
-                    print(f"✓ {result_line}")
-                else:
-                    # Ürün bulunamadı
-                    result_line = f"{barcode} H&M Ürün Bulunamadı"
-                    not_found_products.append(result_line)
-                    print(f"❌ {result_line}")
-                
-                print("✅ Tamamlandı!\n")
-                
-            except Exception as e:
-                print(f"❌ Hata: {e}")
-                result_line = f"{barcode} H&M Ürün Bulunamadı (Hata)"
-                not_found_products.append(result_line)
-                print("✅ Tamamlandı!\n")
+            # Sayfa arka planda açılır - sıradaki barkod hemen okutulabilir
+            print(f"İşlenen: {barcode} (kuyruğa eklendi)")
+            scan_queue.submit(barcode_input)
     
     except KeyboardInterrupt:
         print("\n\n⚠ Program kullanıcı tarafından durduruldu!")
+        cancelled = True
     finally:
-        try:
-            driver.quit()
-            print("Tarayıcı kapatıldı.")
-        except:
-            pass
+        # Bekleyen sayfaları bitir (durdurulduysa başlamamış olanları atla)
+        found_products, not_found_products = split_results(scan_queue.drain(cancel=cancelled))
+        get_readiness_recorder().print_summary("H&M")
+        get_tab_pool(driver_manager).print_summary()
+        driver_manager.watchdog.print_summary()
+        if owns_driver:
+            driver_manager.quit()
     
     return found_products, not_found_products
 
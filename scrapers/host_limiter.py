@@ -0,0 +1,258 @@
+"""
+Site Bazlı Uyarlanabilir Eşzamanlılık (AIMD)
+Her site için aynı anda açık istek sınırı tutulur: yanıtlar sağlıklıysa sınır yavaşça
+artar (+1), 429/403/503 veya zaman aşımında hızla düşer (x0.5). Retry-After başlığına
+uyulur - süre dolana kadar o siteye yeni istek gönderilmez.
+"""
+import threading
+import time
+from contextlib import contextmanager, asynccontextmanager
+from urllib.parse import urlparse
+
+
+# Site bazlı başlangıç ve en yüksek eşzamanlılık
+HOST_LIMITS = {
+    'www.zara.com': {'initial': 4, 'maximum': 16},
+    'www.bershka.com': {'initial': 2, 'maximum': 8},
+    'shop.mango.com': {'initial': 10, 'maximum': 30},    # Barkod başına 10 aday URL
+    'www.mavi.com': {'initial': 4, 'maximum': 12},
+}
+DEFAULT_LIMITS = {'initial': 4, 'maximum': 16}
+MIN_LIMIT = 1
+DECREASE_FACTOR = 0.5
+DECREASE_COOLDOWN = 2.0         # Aynı anda düşen isteklerin sınırı art arda kesmemesi için (saniye)
+MAX_RETRY_AFTER = 60.0          # Retry-After en fazla bu kadar beklenir (saniye)
+ASYNC_POLL_INTERVAL = 0.05
+
+# Yanıt sonuçları
+OUTCOME_OK = "ok"
+OUTCOME_THROTTLED = "throttled"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_ERROR = "error"
+
+THROTTLE_STATUS = {403, 429, 503}
+
+
+class HostLimiter:
+    """Tek bir site için AIMD eşzamanlılık sınırı"""
+    
+    def __init__(self, host, initial, maximum):
+        self.host = host
+        self.limit = float(initial)
+        self.maximum = maximum
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        
+        # Gösterge sayaçları
+        self.requests = 0
+        self.throttled = 0
+        self.timeouts = 0
+        self.peak_limit = float(initial)
+        
+        self._successes = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+    
+    def _can_start(self):
+        """Yeni istek başlatılabilir mi (kilit altında çağrılır)"""
+        return self.in_flight < int(self.limit) and time.monotonic() >= self.blocked_until
+    
+    def try_acquire(self):
+        """Yer varsa hemen alır, yoksa False döner (async kullanım için)"""
+        with self._condition:
+            if not self._can_start():
+                return False
+            self.in_flight += 1
+            self.requests += 1
+            return True
+    
+    def acquire(self):
+        """Sınır içinde yer açılana (ve Retry-After süresi dolana) kadar bekler"""
+        with self._condition:
+            while not self._can_start():
+                wait_seconds = max(0.0, self.blocked_until - time.monotonic())
+                self._condition.wait(timeout=wait_seconds or None)
+            self.in_flight += 1
+            self.requests += 1
+    
+    def release(self, outcome, retry_after=None):
+        """
+        İsteği bitirir ve sonucuna göre sınırı ayarlar
+        
+        Args:
+            outcome (str): OUTCOME_OK, OUTCOME_THROTTLED, OUTCOME_TIMEOUT veya OUTCOME_ERROR
+            retry_after (float): Sitenin istediği bekleme (saniye)
+        """
+        with self._condition:
+            self.in_flight -= 1
+            now = time.monotonic()
+            
+            if outcome == OUTCOME_OK:
+                # Toplamsal artış: sınır doluyken gelen, sınır kadar başarılı yanıtta bir artır
+                # (sınırı zorlamayan sıralı kullanım sınırı büyütmez)
+                if self.in_flight + 1 >= int(self.limit):
+                    self._successes += 1
+                if self._successes >= int(self.limit):
+                    self._successes = 0
+                    self.limit = min(self.maximum, self.limit + 1)
+                    self.peak_limit = max(self.peak_limit, self.limit)
+            elif outcome in (OUTCOME_THROTTLED, OUTCOME_TIMEOUT):
+                if outcome == OUTCOME_THROTTLED:
+                    self.throttled += 1
+                else:
+                    self.timeouts += 1
+                # Çarpımsal azalış
+                if now - self._last_decrease >= DECREASE_COOLDOWN:
+                    self.limit = max(MIN_LIMIT, self.limit * DECREASE_FACTOR)
+                    self._last_decrease = now
+                    self._successes = 0
+            
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, now + min(retry_after, MAX_RETRY_AFTER))
+            
+            self._condition.notify_all()
+    
+    def snapshot(self):
+        """Anlık durum (gösterge ve benchmark için)"""
+        with self._condition:
+            return {
+                "host": self.host,
+                "limit": int(self.limit),
+                "peak_limit": int(self.peak_limit),
+                "in_flight": self.in_flight,
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "timeouts": self.timeouts,
+                "backoff_seconds": round(max(0.0, self.blocked_until - time.monotonic()), 1),
+            }
+
+
+class RequestSlot:
+    """Tek isteğin sonucunu sınırlayıcıya bildirmek için tutar"""
+    
+    def __init__(self):
+        self.outcome = OUTCOME_ERROR
+        self.retry_after = None
+    
+    def observe(self, status_code, headers=None):
+        """
+        HTTP yanıtına göre sonucu belirler
+        
+        Args:
+            status_code (int): HTTP durum kodu
+            headers (dict): Yanıt başlıkları (Retry-After için)
+        """
+        if status_code in THROTTLE_STATUS:
+            self.outcome = OUTCOME_THROTTLED
+        else:
+            self.outcome = OUTCOME_OK
+        if headers is not None:
+            self.retry_after = parse_retry_after(headers.get('Retry-After'))
+
+
+def parse_retry_after(value):
+    """Retry-After başlığını saniyeye çevirir (sadece saniye biçimi desteklenir)"""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def is_timeout(error):
+    """requests ve curl_cffi zaman aşımı hatalarını tanır"""
+    return "Timeout" in type(error).__name__ or "timed out" in str(error).lower()
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_host_limiter(url):
+    """
+    URL'nin sitesi için paylaşılan sınırlayıcıyı döndürür
+    
+    Args:
+        url (str): İstek URL'si
+    
+    Returns:
+        HostLimiter: Site sınırlayıcısı
+    """
+    host = urlparse(url).hostname or url
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limits = HOST_LIMITS.get(host, DEFAULT_LIMITS)
+            limiter = HostLimiter(host, limits['initial'], limits['maximum'])
+            _limiters[host] = limiter
+        return limiter
+
+
+@contextmanager
+def host_slot(url):
+    """
+    Site sınırı içinde bir istek yeri alır; blok bitince sonucu bildirir
+    
+    Kullanım:
+        with host_slot(url) as slot:
+            response = session.get(url)
+            slot.observe(response.status_code, response.headers)
+    """
+    limiter = get_host_limiter(url)
+    limiter.acquire()
+    slot = RequestSlot()
+    try:
+        yield slot
+    except Exception as e:
+        slot.outcome = OUTCOME_TIMEOUT if is_timeout(e) else OUTCOME_ERROR
+        raise
+    finally:
+        limiter.release(slot.outcome, slot.retry_after)
+
+
+@asynccontextmanager
+async def host_slot_async(url):
+    """host_slot'un asyncio sürümü (event loop'u bloklamadan bekler)"""
+    import asyncio
+    
+    limiter = get_host_limiter(url)
+    while not limiter.try_acquire():
+        await asyncio.sleep(ASYNC_POLL_INTERVAL)
+    slot = RequestSlot()
+    try:
+        yield slot
+    except Exception as e:
+        slot.outcome = OUTCOME_TIMEOUT if is_timeout(e) else OUTCOME_ERROR
+        raise
+    finally:
+        limiter.release(slot.outcome, slot.retry_after)
+
+
+def get_limiter_states():
+    """Kullanılan tüm sitelerin sınırlayıcı durumları"""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return [limiter.snapshot() for limiter in limiters]
+
+
+def format_state(state):
+    """Tek satırlık durum metni"""
+    text = (f"{state['host']}: sınır {state['limit']} (en yüksek {state['peak_limit']}), "
+            f"{state['requests']} istek")
+    if state['throttled'] or state['timeouts']:
+        text += f", {state['throttled']} engel / {state['timeouts']} zaman aşımı"
+    if state['backoff_seconds']:
+        text += f", {state['backoff_seconds']} sn bekleme"
+    return text
+
+
+def print_host_states(urls=None):
+    """
+    Sınırlayıcı durumlarını yazdırır
+    
+    Args:
+        urls (list): Sadece bu URL'lerin siteleri - verilmezse hepsi
+    """
+    hosts = None if urls is None else {urlparse(url).hostname or url for url in urls}
+    for state in get_limiter_states():
+        if hosts is None or state['host'] in hosts:
+            print(f"🚦 {format_state(state)}")
@@ -0,0 +1,153 @@
+"""
+HTML Ayrıştırıcı Katmanı
+Mango ve Mavi sayfalarından sadece gerekli birkaç alanı okur.
+lxml varsa XPath ile, yoksa BeautifulSoup + SoupStrainer ile kısmi ayrıştırma yapar.
+"""
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml.html
+    from lxml import etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+
+# Varsayılan arka uç: 'lxml' (hızlı, C) veya 'soup' (saf Python yedek)
+PARSER_BACKEND = 'lxml' if HAS_LXML else 'soup'
+
+# SoupStrainer yedeğinin ağaca alacağı etiketler
+STRAINED_TAGS = ['h1', 'meta', 'p', 'a']
+
+
+class LxmlDocument:
+    """lxml + XPath ile hedefli sorgu yapan belge"""
+    
+    backend = 'lxml'
+    
+    def __init__(self, html):
+        self.html = html
+        self.root = None
+        
+        if not html or not html.strip():
+            return
+        
+        try:
+            try:
+                self.root = lxml.html.fromstring(html)
+            except ValueError:
+                # XML encoding bildirimi olan str'ler lxml'de bytes olarak verilmeli
+                self.root = lxml.html.fromstring(html.encode('utf-8'))
+        except etree.ParserError:
+            self.root = None
+    
+    def find_text(self, tag, class_contains=None):
+        """
+        Etiketin (isteğe bağlı class parçası içeren) ilk örneğinin metnini döndürür
+        
+        Returns:
+            str or None: Boşlukları temizlenmiş metin
+        """
+        if self.root is None:
+            return None
+        
+        xpath = f"//{tag}"
+        if class_contains:
+            xpath += f"[contains(@class, '{class_contains}')]"
+        
+        for element in self.root.xpath(xpath):
+            return element.text_content().strip()
+        return None
+    
+    def find_attr(self, tag, attr, class_name=None):
+        """
+        Etiketin (isteğe bağlı tam class adına sahip) ilk örneğinin attribute değerini döndürür
+        
+        Returns:
+            str or None: Attribute değeri
+        """
+        if self.root is None:
+            return None
+        
+        xpath = f"//{tag}"
+        if class_name:
+            xpath += f"[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+        xpath += f"/@{attr}"
+        
+        for value in self.root.xpath(xpath):
+            return str(value)
+        return None
+    
+    def meta_content(self, **attrs):
+        """
+        Verilen attribute'lara sahip ilk meta etiketinin content değerini döndürür
+        (örn: meta_content(property='og:title'))
+        """
+        if self.root is None:
+            return None
+        
+        conditions = "".join(f"[@{key}='{value}']" for key, value in attrs.items())
+        for value in self.root.xpath(f"//meta{conditions}/@content"):
+            return str(value)
+        return None
+    
+    def contains_text(self, needle):
+        """Sayfa metninde ifade geçiyor mu"""
+        # Ham HTML'de yoksa metinde de yoktur - ağacı gezmeye gerek kalmaz
+        if self.root is None or needle not in self.html:
+            return False
+        # script/style içeriği görünür metin değildir (JSON verisinde geçen ifade sayılmaz)
+        texts = self.root.xpath("//text()[not(ancestor::script or ancestor::style)]")
+        return needle in "".join(texts)
+
+
+class SoupDocument:
+    """BeautifulSoup + SoupStrainer ile sadece gerekli etiketleri ayrıştıran belge"""
+    
+    backend = 'soup'
+    
+    def __init__(self, html):
+        self.html = html or ""
+        self.soup = BeautifulSoup(self.html, 'html.parser', parse_only=SoupStrainer(STRAINED_TAGS))
+    
+    def find_text(self, tag, class_contains=None):
+        """Etiketin (isteğe bağlı class parçası içeren) ilk örneğinin metnini döndürür"""
+        if class_contains:
+            element = self.soup.find(tag, class_=lambda x: x and class_contains in x)
+        else:
+            element = self.soup.find(tag)
+        return element.get_text().strip() if element else None
+    
+    def find_attr(self, tag, attr, class_name=None):
+        """Etiketin (isteğe bağlı tam class adına sahip) ilk örneğinin attribute değerini döndürür"""
+        if class_name:
+            element = self.soup.find(tag, class_=class_name)
+        else:
+            element = self.soup.find(tag)
+        return element.get(attr) if element else None
+    
+    def meta_content(self, **attrs):
+        """Verilen attribute'lara sahip ilk meta etiketinin content değerini döndürür"""
+        element = self.soup.find('meta', attrs=attrs)
+        return element.get('content') if element else None
+    
+    def contains_text(self, needle):
+        """Sayfa metninde ifade geçiyor mu (ağaç kısmi olduğu için ham HTML'e bakılır)"""
+        return needle in self.html
+
+
+def parse_html(html, backend=None):
+    """
+    HTML'i seçilen arka uçla ayrıştırır
+    
+    Args:
+        html (str): Sayfa içeriği
+        backend (str): 'lxml' veya 'soup' - verilmezse PARSER_BACKEND kullanılır
+    
+    Returns:
+        LxmlDocument or SoupDocument: Sorgulanabilir belge
+    """
+    backend = backend or PARSER_BACKEND
+    if backend == 'lxml' and HAS_LXML:
+        return LxmlDocument(html)
+    return SoupDocument(html)
@@ -2,8 +2,48 @@
 Mango Barkod Scraper
 """
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from lookup_cache import get_lookup_cache
+from lookup_timings import start_lookup, stage, set_strategy, current_timer
+from scrapers.html_parser import parse_html
+from scrapers.scan_queue import ScanQueue, split_results
+from scrapers.host_limiter import host_slot, OUTCOME_OK
+from scrapers.cookie_store import attach_cookie_jar
+
+
+# Bu hata mesajları kesin "ürün yok" anlamına gelir (önbelleğe alınabilir)
+NOT_FOUND_ERRORS = ("Ürün adı bulunamadı", "Ürün hiçbir kategoride bulunamadı")
+
+MANGO_BASE_URL = "https://shop.mango.com/tr/tr"
+
+# Paralel yoklama ayarları
+PRODUCT_CATEGORIES = ['kadin', 'erkek', 'teen', 'cocuk', 'home']
+OTHER_SEARCH_CATEGORIES = ['erkek', 'teen', 'cocuk', 'home']
+MANGO_MAX_WORKERS = 10          # Aday URL sayısı kadar (hepsi aynı anda)
+REQUEST_TIMEOUT = (5, 10)       # (bağlantı, okuma) saniye
+LOOKUP_DEADLINE = 15            # Barkod başına toplam süre sınırı (saniye)
+SCAN_WORKERS = 2                # Okutma sırasında aynı anda çözülen barkod (her biri 10 istek açar)
+
+# Aday türü -> süre ölçümündeki strateji etiketi
+CANDIDATE_STRATEGIES = {
+    'product': 'direct_url',
+    'search_primary': 'search',
+    'search': 'other_categories',
+}
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7',
+}
+
+_session = None
+_executor = None
+_lock = threading.Lock()
 
 
 def extract_barcode_from_qr(qr_string):
@@ -40,182 +80,292 @@ def detect_input_type(user_input):
     return None, "Hata: Geçerli bir barkod veya QR kod giriniz! (8 haneli barkod)"
 
 
-def extract_product_name_from_product_page(soup):
+def extract_product_name_from_product_page(doc):
     """
     Ürün sayfasından ürün adını çıkarır
     
     Args:
-        soup: BeautifulSoup objesi
+        doc: parse_html() ile oluşturulan belge
         
     Returns:
         str or None: Ürün adı
     """
     # Strateji 1: h1 tag (Ana başlık)
-    h1_title = soup.find('h1')
-    if h1_title:
-        title = h1_title.get_text().strip()
-        if title and len(title) > 5:
-            return title
+    title = doc.find_text('h1')
+    if title and len(title) > 5:
+        return title
     
     # Strateji 2: ProductDetail_title class
-    product_title = soup.find('h1', class_=lambda x: x and 'ProductDetail_title' in x)
-    if product_title:
-        title = product_title.get_text().strip()
-        if title and len(title) > 5:
-            return title
+    title = doc.find_text('h1', class_contains='ProductDetail_title')
+    if title and len(title) > 5:
+        return title
     
     # Strateji 3: meta itemprop="name"
-    meta_name = soup.find('meta', attrs={'itemprop': 'name'})
-    if meta_name and meta_name.get('content'):
-        title = meta_name.get('content').strip()
-        if title and len(title) > 5:
-            return title
+    title = (doc.meta_content(itemprop='name') or '').strip()
+    if title and len(title) > 5:
+        return title
     
     # Strateji 4: og:title meta tag
-    og_title = soup.find('meta', property='og:title')
-    if og_title and og_title.get('content'):
-        title = og_title.get('content').strip()
-        if title and len(title) > 5:
-            return title
+    title = (doc.meta_content(property='og:title') or '').strip()
+    if title and len(title) > 5:
+        return title
     
     return None
 
 
-def search_other_categories(barcode, headers):
+def get_session():
+    """Tüm Mango istekleri için paylaşılan keep-alive oturumunu döndürür"""
+    global _session
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MANGO_MAX_WORKERS)
+            session.mount("https://", adapter)
+            attach_cookie_jar(session, "mango", "MANGO")
+            _session = session
+        return _session
+
+
+def get_executor():
+    """Aday URL'leri paralel yoklayan paylaşılan thread havuzunu döndürür"""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MANGO_MAX_WORKERS, thread_name_prefix="mango")
+        return _executor
+
+
+def build_candidate_urls(barcode):
     """
-    Diğer kategorilerde ürün arar
+    Barkod için denenecek URL'leri öncelik sırasıyla oluşturur
     
     Args:
-        barcode (str): Barkod
-        headers (dict): HTTP headers
-        
+        barcode (str): 8 haneli barkod
+    
     Returns:
-        tuple: (product_name, error_message)
+        list: [(tür, url), ...] - tür: 'product', 'search_primary' veya 'search'
+    """
+    candidates = [
+        ('product', f"{MANGO_BASE_URL}/p/{category}/{barcode}")
+        for category in PRODUCT_CATEGORIES
+    ]
+    candidates.append(('search_primary', f"{MANGO_BASE_URL}/search/kadin?q={barcode}"))
+    candidates.extend(
+        ('search', f"{MANGO_BASE_URL}/search/{category}?q={barcode}")
+        for category in OTHER_SEARCH_CATEGORIES
+    )
+    return candidates
+
+
+def extract_product_name_from_search_page(doc, final_url, is_primary):
     """
-    categories = ['erkek', 'teen', 'cocuk', 'home']
+    Arama sayfasından (veya yönlendirilen ürün sayfasından) ürün adını çıkarır
     
-    for category in categories:
-        try:
-            url = f"https://shop.mango.com/tr/tr/search/{category}?q={barcode}"
-            response = requests.get(url, headers=headers, timeout=10, allow_redirects=True)
-            
-            if response.status_code == 200:
-                final_url = response.url
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Ürün sayfasına yönlendirildi mi?
-                if '/p/' in final_url:
-                    product_name = extract_product_name_from_product_page(soup)
-                    if product_name:
-                        return product_name, None
-                
-                # Arama sonuçlarından ürün adını çıkar
-                page_text = soup.get_text()
-                if 'Sonuç bulunamadı' not in page_text:
-                    product_title = soup.find('p', class_=lambda x: x and 'ProductTitle_productTitle' in x)
-                    if product_title:
-                        product_name = product_title.get_text().strip()
-                        if product_name and len(product_name) > 5:
-                            return product_name, None
-        except:
-            continue
+    Args:
+        doc: parse_html() ile oluşturulan belge
+        final_url (str): Yönlendirmelerden sonraki URL
+        is_primary (bool): Ana (kadın) arama sayfası mı - og:title yedeği sadece onda kullanılır
     
-    return None, "Ürün hiçbir kategoride bulunamadı"
+    Returns:
+        str or None: Ürün adı
+    """
+    # Ürün sayfasına yönlendirildi mi?
+    if '/p/' in final_url:
+        product_name = extract_product_name_from_product_page(doc)
+        if product_name:
+            return product_name
+    
+    if doc.contains_text('Sonuç bulunamadı'):
+        return None
+    
+    # ProductTitle class'ını ara (Ana strateji)
+    product_name = doc.find_text('p', class_contains='ProductTitle_productTitle')
+    if product_name and len(product_name) > 5:
+        return product_name
+    
+    # Alternatif: meta tag'leri kontrol et
+    if is_primary:
+        content = doc.meta_content(property='og:title')
+        if content and 'Sonuç bulunamadı' not in content and len(content) > 5:
+            return content
+    
+    return None
 
 
-def get_mango_product_name(barcode):
+def probe_candidate(kind, url, stop_event):
+    """
+    Tek bir aday URL'yi sorgular
+    
+    Args:
+        kind (str): Aday türü ('product', 'search_primary', 'search')
+        url (str): İstek URL'si
+        stop_event (threading.Event): Kazanan bulunduğunda set edilir
+    
+    Returns:
+        tuple: (ürün_adı, hata, ayrıştırma_süresi) - 200 dışındaki yanıtlar (404 hariç) hata sayılır
+    """
+    if stop_event.is_set():
+        return None, None, 0.0
+    
+    try:
+        with host_slot(url) as slot:
+            # Sınırlayıcıda beklerken kazanan bulunduysa isteği hiç gönderme
+            if stop_event.is_set():
+                slot.outcome = OUTCOME_OK
+                return None, None, 0.0
+            # stream=True: kazanan bulunursa gövde indirilmeden bağlantı kapatılır
+            response = get_session().get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT,
+                                         allow_redirects=True, stream=True)
+            slot.observe(response.status_code, response.headers)
+    except requests.exceptions.RequestException as e:
+        return None, e, 0.0
+    
+    try:
+        if stop_event.is_set() or response.status_code == 404:
+            return None, None, 0.0
+        if response.status_code != 200:
+            # 5xx / 403 / 429 "bulunamadı" değildir - sonuç önbelleğe yazılmaz
+            return None, f"HTTP {response.status_code}", 0.0
+        
+        html = response.text
+        parse_start = time.perf_counter()
+        doc = parse_html(html)
+        
+        if kind == 'product':
+            product_name = extract_product_name_from_product_page(doc)
+        else:
+            product_name = extract_product_name_from_search_page(doc, response.url, kind == 'search_primary')
+        return product_name, None, time.perf_counter() - parse_start
+    except requests.exceptions.RequestException as e:
+        return None, e, 0.0
+    finally:
+        response.close()
+
+
+def record_race_timing(kind, parse_seconds, race_seconds):
+    """
+    Aday yarışının sürelerini aktif arama ölçümüne yazar
+    
+    Args:
+        kind (str or None): Kazanan aday türü - bulunamadıysa None
+        parse_seconds (float): Kazanan sayfanın ayrıştırma süresi
+        race_seconds (float): Yarışın toplam süresi
+    """
+    timer = current_timer()
+    if timer is None:
+        return
+    timer.strategy = CANDIDATE_STRATEGIES[kind] if kind else 'none'
+    timer.add('network', max(0.0, race_seconds - parse_seconds))
+    timer.add('parse', parse_seconds)
+
+
+def get_mango_product_name(barcode, deadline=LOOKUP_DEADLINE):
     """
     Mango sitesinden barkod numarasına göre ürün adını çeker
-    Direkt ürün sayfası URL'lerini dener
+    Ürün sayfası ve arama URL'lerini paralel dener, ilk geçerli sonuç kazanır
+    
+    Birden fazla aday aynı anda başarılı olursa strateji önceliği korunur:
+    bir adayın sonucu ancak kendisinden öncelikli tüm adaylar başarısız olduysa kullanılır.
     
     Args:
         barcode (str): Ürün barkod numarası (8 haneli)
+        deadline (float): Barkod başına toplam süre sınırı (saniye)
         
     Returns:
         tuple: (product_name, error_message)
                Başarılıysa: (ürün_adı, None)
                Başarısızsa: (None, hata_mesajı)
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7',
-    }
+    candidates = build_candidate_urls(barcode)
+    stop_event = threading.Event()
+    executor = get_executor()
     
-    # Strateji 1: Direkt ürün sayfası URL'lerini dene
-    product_urls = [
-        f"https://shop.mango.com/tr/tr/p/kadin/{barcode}",
-        f"https://shop.mango.com/tr/tr/p/erkek/{barcode}",
-        f"https://shop.mango.com/tr/tr/p/teen/{barcode}",
-        f"https://shop.mango.com/tr/tr/p/cocuk/{barcode}",
-        f"https://shop.mango.com/tr/tr/p/home/{barcode}",
-    ]
+    futures = {
+        executor.submit(probe_candidate, kind, url, stop_event): index
+        for index, (kind, url) in enumerate(candidates)
+    }
+    results = [None] * len(candidates)
+    pending = set(futures)
+    start = time.monotonic()
+    end_time = start + deadline
     
-    for url in product_urls:
-        try:
-            response = requests.get(url, headers=headers, timeout=10)
+    try:
+        while pending:
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                break
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Ürün sayfasından ürün adını çıkar
-                product_name = extract_product_name_from_product_page(soup)
-                if product_name:
-                    return product_name, None
-                    
-        except:
-            continue
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    # Ayrıştırma vb. beklenmeyen hata - aday başarısız sayılır, yarış sürer
+                    results[futures[future]] = (None, e, 0.0)
+            
+            # Öncelik sırasına göre karar ver: önceki adaylar bitmeden sonrakini kabul etme
+            for index, result in enumerate(results):
+                if result is None:
+                    break
+                if result[0]:
+                    record_race_timing(candidates[index][0], result[2], time.monotonic() - start)
+                    return result[0], None
+    finally:
+        # Kalan istekleri iptal et (başlamamışlar hiç çalışmaz, süren istekler gövdeyi okumaz)
+        stop_event.set()
+        for future in pending:
+            future.cancel()
     
-    # Strateji 2: Arama sayfasından başla (eski yöntem)
-    search_url = f"https://shop.mango.com/tr/tr/search/kadin?q={barcode}"
+    # Süre doldu - biten adaylar arasında en öncelikli başarılı sonucu kullan
+    for index, result in enumerate(results):
+        if result is not None and result[0]:
+            record_race_timing(candidates[index][0], result[2], time.monotonic() - start)
+            return result[0], None
     
-    try:
-        # Redirect'i takip et (allow_redirects=True)
-        response = requests.get(search_url, headers=headers, timeout=10, allow_redirects=True)
-        
-        if response.status_code != 200:
-            return None, f"HTTP Hatası: {response.status_code}"
-        
-        # Final URL'i kontrol et - ürün sayfasına yönlendirildi mi?
-        final_url = response.url
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Eğer ürün sayfasına yönlendirildiyse (/p/ içeriyorsa)
-        if '/p/' in final_url:
-            # Ürün sayfasından ürün adını çıkar
-            product_name = extract_product_name_from_product_page(soup)
-            if product_name:
-                return product_name, None
-        
-        # Arama sayfasındaysa, arama sonuçlarını kontrol et
-        page_text = soup.get_text()
-        if 'Sonuç bulunamadı' in page_text:
-            # Strateji 3: Diğer kategorilerde ara
-            return search_other_categories(barcode, headers)
-        
-        # ProductTitle class'ını ara (Ana strateji)
-        product_title = soup.find('p', class_=lambda x: x and 'ProductTitle_productTitle' in x)
-        if product_title:
-            product_name = product_title.get_text().strip()
-            if product_name and len(product_name) > 5:
-                return product_name, None
-        
-        # Alternatif: meta tag'leri kontrol et
-        og_title = soup.find('meta', property='og:title')
-        if og_title and og_title.get('content'):
-            content = og_title.get('content')
-            if content and 'Sonuç bulunamadı' not in content and len(content) > 5:
-                return content, None
+    record_race_timing(None, 0.0, time.monotonic() - start)
+    
+    if pending:
+        return None, "İstek zaman aşımına uğradı"
+    
+    errors = [result[1] for result in results if result[1] is not None]
+    if errors:
+        return None, f"Bağlantı hatası: {errors[0]}"
+    
+    return None, "Ürün hiçbir kategoride bulunamadı"
+
+
+def resolve_barcode(user_input, driver_manager=None, stop_event=None):
+    """
+    Barkod veya QR kodu önbellek ve site üzerinden çözer (tarama kuyruğu ve karışık mod için)
+    
+    Args:
+        user_input (str): 8 haneli barkod veya QR kod
+        driver_manager (DriverManager): Kullanılmaz - tüm çözücülerle aynı imza için
+        stop_event (threading.Event): Kullanılmaz - tüm çözücülerle aynı imza için
+    
+    Returns:
+        tuple: (barkod, ürün_adı, hata_mesajı) - ürün yoksa (barkod, None, None)
+    """
+    with start_lookup("MANGO", "none"):
+        with stage('validate'):
+            barcode, error = detect_input_type(user_input)
+        if barcode is None:
+            set_strategy("invalid")
+            return None, None, error
         
-        return None, "Ürün adı bulunamadı"
+        cache = get_lookup_cache()
+        with stage('cache'):
+            cached, cached_name = cache.get("MANGO", barcode)
+        if cached:
+            set_strategy("cache")
+            return barcode, cached_name, None
         
-    except requests.exceptions.Timeout:
-        return None, "İstek zaman aşımına uğradı"
-    except requests.exceptions.RequestException as e:
-        return None, f"Bağlantı hatası: {e}"
-    except Exception as e:
-        return None, f"Beklenmeyen hata: {e}"
+        product_name, error = get_mango_product_name(barcode)
+        if product_name or error in NOT_FOUND_ERRORS:
+            with stage('persist'):
+                cache.put("MANGO", barcode, product_name, "html")
+            return barcode, product_name, None
+        return barcode, None, error
 
 
 def run_mango():
@@ -225,8 +375,7 @@ def run_mango():
     Returns:
         tuple: (found_products, not_found_products)
     """
-    found_products = []
-    not_found_products = []
+    scan_queue = ScanQueue(resolve_barcode, brand="MANGO", workers=SCAN_WORKERS)
     
     print("\n" + "═" * 70)
     print("║                                                                    ║")
@@ -269,22 +418,12 @@ def run_mango():
             print(f"\n❌ {error}\n")
             continue
         
-        print(f"\n📋 Barkod: {barcode}")
-        print("🔍 Ürün bilgisi sorgulanıyor...")
-        
-        product_name, error = get_mango_product_name(barcode)
-        
-        if product_name:
-            formatted_product_name = product_name.title()
-            result_line = f"{barcode} MANGO {formatted_product_name}"
-            found_products.append(result_line)
-            print(f"✅ {result_line}")
-        else:
-            result_line = f"{barcode} MANGO Ürün Bulunamadı"
-            not_found_products.append(result_line)
-            print(f"❌ {result_line}")
-        
-        print("✅ Tamamlandı!\n")
+        # Sorgu arka planda yapılır - sıradaki barkod hemen okutulabilir
+        print(f"📋 Barkod: {barcode} (kuyruğa eklendi)")
+        scan_queue.submit(user_input)
+    
+    # Bekleyen sorguları bitir, sonuçları okutma sırasıyla al
+    found_products, not_found_products = split_results(scan_queue.drain())
     
     return found_products, not_found_products
 
@@ -1,8 +1,37 @@
 """
 Mavi Barkod Scraper
 """
+import asyncio
+import threading
+import time
 from curl_cffi import requests
-from bs4 import BeautifulSoup
+from curl_cffi.requests import AsyncSession
+from lookup_cache import get_lookup_cache
+from lookup_timings import start_lookup, stage, set_strategy, get_timing_recorder
+from scrapers.html_parser import parse_html
+from utils import prompt_bulk_input
+from result_journal import reserve_bulk_orders, record_bulk_result
+from scrapers.scan_queue import ScanQueue, split_results, format_result_line
+from scrapers.host_limiter import host_slot, host_slot_async, print_host_states
+from scrapers.cookie_store import attach_cookie_jar
+
+
+MAVI_SEARCH_URL = "https://www.mavi.com/search/?text={search_value}"
+MAVI_MAX_CONCURRENCY = 12       # Toplu aramada en fazla istek - gerçek sınırı site sınırlayıcısı belirler
+REQUEST_TIMEOUT = 15            # saniye
+BULK_PROGRESS_EVERY = 25        # Kaç sonuçta bir ilerleme satırı yazılacak
+SCAN_WORKERS = 3                # Okutma sırasında arka planda çalışan arama sayısı
+
+HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Cache-Control': 'max-age=0',
+    'Upgrade-Insecure-Requests': '1',
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+}
+
+_session = None
+_session_lock = threading.Lock()
 
 
 def detect_input_type(user_input):
@@ -25,41 +54,224 @@ def detect_input_type(user_input):
         return None, f"Hata: Geçersiz uzunluk ({length} hane). En az 10 haneli olmalıdır!"
 
 
+def get_session():
+    """
+    Tüm Mavi istekleri için kalıcı curl_cffi oturumunu döndürür
+    (TLS bağlantısı, Chrome taklidi ve çerezler istekler arasında korunur)
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session(impersonate="chrome", headers=HEADERS)
+            attach_cookie_jar(_session, "mavi", "MAVİ")
+        return _session
+
+
+def build_search_url(search_value):
+    """Arama URL'sini oluşturur"""
+    return MAVI_SEARCH_URL.format(search_value=search_value)
+
+
+def parse_product_name(html):
+    """Arama sonuç sayfasından ilk ürünün adını çıkarır"""
+    doc = parse_html(html)
+    return doc.find_attr('a', 'title', class_name='product-card-info')
+
+
 def get_product_name(search_value):
-    """Mavi sitesinden barkod veya ürün kodu ile ürün adını çeker"""
-    url = f"https://www.mavi.com/search/?text={search_value}"
+    """
+    Mavi sitesinden barkod veya ürün kodu ile ürün adını çeker
     
-    headers = {
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-        'Accept-Language': 'tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7',
-        'Cache-Control': 'max-age=0',
-        'Upgrade-Insecure-Requests': '1',
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
-    }
+    Args:
+        search_value (str): detect_input_type ile biçimlendirilmiş barkod/ürün kodu
     
+    Returns:
+        tuple: (ürün_adı, hata_mesajı)
+               Bulunursa (ad, None), ürün yoksa (None, None),
+               bağlantı/HTTP hatasında (None, hata_mesajı)
+    """
+    url = build_search_url(search_value)
     try:
-        response = requests.get(
-            url, 
-            headers=headers, 
-            impersonate="chrome",
-            timeout=15
-        )
+        with host_slot(url) as slot, stage('network'):
+            response = get_session().get(url, timeout=REQUEST_TIMEOUT)
+            slot.observe(response.status_code, response.headers)
+    except Exception as e:
+        print(f"Hata oluştu: {e}")
+        return None, f"Bağlantı hatası: {e}"
+    
+    if response.status_code != 200:
+        return None, f"HTTP Hatası: {response.status_code}"
+    
+    with stage('parse'):
+        return parse_product_name(response.text), None
+
+
+def resolve_barcode(user_input, driver_manager=None, stop_event=None):
+    """
+    Barkod veya ürün kodunu önbellek ve site üzerinden çözer (tarama kuyruğu ve karışık mod için)
+    
+    Args:
+        user_input (str): Barkod veya ürün kodu
+        driver_manager (DriverManager): Kullanılmaz - tüm çözücülerle aynı imza için
+        stop_event (threading.Event): Kullanılmaz - tüm çözücülerle aynı imza için
+    
+    Returns:
+        tuple: (kod, ürün_adı, hata_mesajı) - ürün yoksa (kod, None, None)
+    """
+    with start_lookup("MAVİ", "html"):
+        with stage('validate'):
+            input_type, formatted_value = detect_input_type(user_input)
+        if input_type is None:
+            set_strategy("invalid")
+            return None, None, formatted_value
         
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            product_link = soup.find('a', class_='product-card-info')
+        cache = get_lookup_cache()
+        with stage('cache'):
+            cached, cached_name = cache.get("MAVİ", formatted_value)
+        if cached:
+            set_strategy("cache")
+            return formatted_value, cached_name, None
+        
+        product_name, error = get_product_name(formatted_value)
+        if error is None:
+            with stage('persist'):
+                cache.put("MAVİ", formatted_value, product_name, "html")
+        return formatted_value, product_name, error
+
+
+async def get_product_names_async(search_values, max_concurrency=MAVI_MAX_CONCURRENCY, on_result=None):
+    """
+    Birden fazla barkod/ürün kodunu AsyncSession ile eşzamanlı sorgular
+    
+    Args:
+        search_values (list): Biçimlendirilmiş barkod/ürün kodları
+        max_concurrency (int): Aynı anda açık en fazla istek
+        on_result (callable): Her sonuç geldiğinde (değer, ad, hata) ile çağrılır
+    
+    Returns:
+        dict: {değer: (ürün_adı, hata_mesajı)}
+    """
+    results = {}
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async with AsyncSession(impersonate="chrome", headers=HEADERS,
+                            cookies=get_session().cookies, max_clients=max_concurrency) as session:
+        
+        async def fetch(search_value):
+            url = build_search_url(search_value)
+            async with semaphore:
+                try:
+                    async with host_slot_async(url) as slot:
+                        # Süre yer alındıktan sonra başlar - sırada bekleme ölçüme girmez
+                        start = time.perf_counter()
+                        response = await session.get(url, timeout=REQUEST_TIMEOUT)
+                        slot.observe(response.status_code, response.headers)
+                except Exception as e:
+                    return search_value, None, f"Bağlantı hatası: {e}"
+            network_seconds = time.perf_counter() - start
             
-            if product_link and product_link.get('title'):
-                product_name = product_link.get('title')
-                return product_name
-            else:
-                return None
-        else:
-            return None
+            if response.status_code != 200:
+                return search_value, None, f"HTTP Hatası: {response.status_code}"
             
-    except Exception as e:
-        print(f"Hata oluştu: {e}")
-        return None
+            parse_start = time.perf_counter()
+            product_name = parse_product_name(response.text)
+            parse_seconds = time.perf_counter() - parse_start
+            
+            # Async görevler thread'e bağlı olmadığından ölçüm doğrudan kaydedilir
+            get_timing_recorder().record(
+                "MAVİ", "async", {'network': network_seconds, 'parse': parse_seconds},
+                network_seconds + parse_seconds
+            )
+            return search_value, product_name, None
+        
+        for task in asyncio.as_completed([fetch(value) for value in search_values]):
+            search_value, product_name, error = await task
+            results[search_value] = (product_name, error)
+            if on_result:
+                on_result(search_value, product_name, error)
+    
+    return results
+
+
+def run_mavi_bulk(raw_inputs, max_concurrency=MAVI_MAX_CONCURRENCY):
+    """
+    Barkod/ürün kodu listesini toplu olarak sorgular
+    
+    Args:
+        raw_inputs (list): Ham girişler
+        max_concurrency (int): Aynı anda açık en fazla istek
+    
+    Returns:
+        tuple: (found_products, not_found_products) - giriş sırasıyla
+    """
+    found_products = []
+    not_found_products = []
+    cache = get_lookup_cache()
+    
+    formatted_list = []
+    for raw_input in raw_inputs:
+        input_type, formatted_value = detect_input_type(raw_input)
+        if input_type is None:
+            print(f"❌ {raw_input}: {formatted_value}")
+            continue
+        formatted_list.append(formatted_value)
+    
+    if not formatted_list:
+        print("❌ Sorgulanacak geçerli kod yok!")
+        return found_products, not_found_products
+    
+    results = {}
+    to_fetch = []
+    for value in dict.fromkeys(formatted_list):
+        cached, cached_name = cache.get("MAVİ", value)
+        if cached:
+            results[value] = (cached_name, None)
+        else:
+            to_fetch.append(value)
+    
+    if results:
+        print(f"💾 {len(results)} kod önbellekten alındı")
+    
+    # Her sonuç bulunduğu anda giriş sırasındaki yerine günlüğe yazılır
+    journal_orders = reserve_bulk_orders(formatted_list)
+    for value, (product_name, error) in results.items():
+        record_bulk_result("MAVİ", format_result_line("MAVİ", value, product_name, error),
+                           bool(product_name), journal_orders.get(value, ()))
+    
+    total = len(to_fetch)
+    if total:
+        print(f"🔍 {total} kod sorgulanıyor... (En fazla {max_concurrency} eşzamanlı istek, site sınırına göre ayarlanır)")
+        progress = {"done": 0}
+        start_time = time.perf_counter()
+        
+        def on_result(search_value, product_name, error):
+            progress["done"] += 1
+            if error is None:
+                cache.put("MAVİ", search_value, product_name, "html")
+            record_bulk_result("MAVİ", format_result_line("MAVİ", search_value, product_name, error),
+                               bool(product_name), journal_orders.get(search_value, ()))
+            if progress["done"] % BULK_PROGRESS_EVERY == 0 or progress["done"] == total:
+                elapsed = time.perf_counter() - start_time
+                rate = progress["done"] / elapsed if elapsed > 0 else 0
+                print(f"   ⏳ {progress['done']}/{total} tamamlandı | {rate:.1f} kod/sn")
+        
+        results.update(asyncio.run(get_product_names_async(to_fetch, max_concurrency, on_result)))
+        elapsed = time.perf_counter() - start_time
+        print(f"⚡ {total} sorgu {elapsed:.1f} sn'de ({total / elapsed if elapsed > 0 else 0:.1f} kod/sn)")
+        print_host_states([MAVI_SEARCH_URL])
+    
+    for value in formatted_list:
+        product_name, error = results[value]
+        result_line = format_result_line("MAVİ", value, product_name, error)
+        if product_name:
+            found_products.append(result_line)
+        else:
+            not_found_products.append(result_line)
+    
+    print(f"✅ Toplu arama tamamlandı: {len(found_products)} bulundu, "
+          f"{len(not_found_products)} bulunamadı\n")
+    
+    return found_products, not_found_products
 
 
 def run_mavi():
@@ -71,6 +283,7 @@ def run_mavi():
     """
     found_products = []
     not_found_products = []
+    scan_queue = ScanQueue(resolve_barcode, brand="MAVİ", workers=SCAN_WORKERS)
     
     print("\n" + "═" * 70)
     print("║                                                                    ║")
@@ -92,6 +305,7 @@ def run_mavi():
     print(f"├{'─' * 68}┤")
     print(f"│  q  →  Ana menüye dön ve sonuçları kaydet{' ' * 24}│")
     print(f"│  s  →  Bulunamayan ürünü atla (düzenleme modunda){' ' * 15}│")
+    print(f"│  b  →  Toplu arama (dosya yolu veya yapıştırılan liste){' ' * 10}│")
     print(f"└{'─' * 68}┘\n")
     
     print("⚡ Sistem hazır! Barkod girmeye başlayabilirsiniz...")
@@ -104,6 +318,18 @@ def run_mavi():
         if user_input.lower() == 'q':
             break
         
+        if user_input.lower() == 'b':
+            # Önce okutulmuş barkodlar - sonuçlar okutma / toplu arama sırasıyla tek listede kalır
+            queued_found, queued_not_found = split_results(scan_queue.flush())
+            found_products.extend(queued_found)
+            not_found_products.extend(queued_not_found)
+            
+            # Toplu sonuçlar bulundukça günlüğe yazılır
+            bulk_found, bulk_not_found = run_mavi_bulk(prompt_bulk_input())
+            found_products.extend(bulk_found)
+            not_found_products.extend(bulk_not_found)
+            continue
+        
         if not user_input:
             print("Lütfen bir değer giriniz!\n")
             continue
@@ -114,21 +340,12 @@ def run_mavi():
             print(f"\n❌ {formatted_value}\n")
             continue
         
-        print(f"\n📋 Kod/Barkod: {formatted_value}")
-        print("🔍 Ürün bilgisi sorgulanıyor...")
-        
-        product_name = get_product_name(formatted_value)
-        
-        if product_name:
-            result_line = f"{formatted_value} MAVİ {product_name}"
-            found_products.append(result_line)
-            print(f"✅ {result_line}")
-        else:
-            result_line = f"{formatted_value} MAVİ Ürün Bulunamadı"
-            not_found_products.append(result_line)
-            print(f"❌ {result_line}")
-        
-        print("✅ Tamamlandı!\n")
+        # Sorgu arka planda yapılır - sıradaki kod hemen okutulabilir
+        print(f"📋 Kod/Barkod: {formatted_value} (kuyruğa eklendi)")
+        scan_queue.submit(user_input)
     
-    return found_products, not_found_products
+    # Bekleyen sorguları bitir, sonuçları okutma sırasıyla al
+    queued_found, queued_not_found = split_results(scan_queue.drain())
+    
+    return found_products + queued_found, not_found_products + queued_not_found
 
@@ -0,0 +1,254 @@
+"""
+Karışık Koli Scraper
+Marka seçmeden okutulan her barkodu formatına göre doğru markaya yönlendirir.
+Birden fazla markaya uyan formatlar aday markalarda aynı anda aranır, ilk bulunan kazanır.
+"""
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+from utils import Colors, print_success, print_error, print_info
+from scrapers import bershka_scraper, hm_scraper, mango_scraper, mavi_scraper, zara_scraper
+from scrapers.driver_manager import DriverManager
+from scrapers.page_readiness import get_readiness_recorder
+from scrapers.scan_queue import ScanQueue
+
+
+# Marka sırası TXT/Excel kaydı ve özet için kullanılır
+BRAND_ORDER = ['BERSHKA', 'H&M', 'ZARA', 'MANGO', 'MAVİ']
+
+# Okutma sırasında aynı anda çözülen barkod sayısı
+SCAN_WORKERS = 3
+# Yarışta aynı anda çalışan en fazla aday (barkod başına en fazla 3 marka adayı olur)
+MIXED_MAX_WORKERS = SCAN_WORKERS * 3
+
+# H&M etiketindeki 29 karakterlik kod (örn: 101188865002009202410877220ID)
+HM_LONG_CODE = re.compile(r'^[0-9A-Za-z]{29}$')
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Aday markaları yarıştıran paylaşılan thread havuzunu döndürür"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MIXED_MAX_WORKERS, thread_name_prefix="mixed")
+        return _executor
+
+
+def classify_input(user_input):
+    """
+    Girişin hangi markalara ait olabileceğini marka kurallarına göre belirler
+    
+    Args:
+        user_input (str): Okutulan barkod / QR kod
+    
+    Returns:
+        tuple: (aday_markalar, hata_mesajı) - Öncelik sırasıyla marka listesi veya (None, hata)
+    """
+    cleaned_input = user_input.strip()
+    digits = cleaned_input.replace(" ", "").replace("-", "")
+    
+    if HM_LONG_CODE.match(cleaned_input) and not cleaned_input.isdigit():
+        return ['H&M'], None
+    
+    if digits.isdigit():
+        length = len(digits)
+        if length == 8:
+            return ['MANGO'], None
+        if length == 13 and digits.startswith('8'):
+            return ['MAVİ'], None
+        if length == 14:
+            # Zara ve Bershka aynı Inditex barkod yapısını kullanır; 14 haneli Mavi ürün kodu
+            # da bu uzunlukta olabilir - en düşük öncelikli aday olarak aranır
+            return ['ZARA', 'BERSHKA', 'MAVİ'], None
+        if length == 10:
+            # H&M ve Bershka işlenmiş barkodu ile Mavi ürün kodu aynı uzunlukta
+            return ['H&M', 'BERSHKA', 'MAVİ'], None
+        if length == 29:
+            return ['H&M'], None
+        if length >= 11:
+            return ['MAVİ'], None
+        return None, f"Hata: Tanınmayan barkod uzunluğu ({length} hane)"
+    
+    # Rakam dışı girişler: Mango QR kodu
+    barcode, _ = mango_scraper.detect_input_type(cleaned_input)
+    if barcode:
+        return ['MANGO'], None
+    
+    return None, "Hata: Barkod hiçbir markanın formatına uymuyor!"
+
+
+# Marka -> çözücü fonksiyon: resolve(giriş, driver_manager, stop_event) -> (anahtar, ürün_adı, hata)
+# Tarayıcı markaları sayfaları tek Chrome'da açar (sekme havuzu, komutlar driver_manager.page_lock ile sırayla)
+BRAND_RESOLVERS = {
+    'BERSHKA': bershka_scraper.resolve_barcode,
+    'H&M': hm_scraper.resolve_barcode,
+    'ZARA': zara_scraper.resolve_barcode,
+    'MANGO': mango_scraper.resolve_barcode,
+    'MAVİ': mavi_scraper.resolve_barcode,
+}
+
+
+def race_brands(user_input, brands, driver_manager):
+    """
+    Aday markaları aynı anda sorgular, ürünü ilk bulan marka kazanır
+    
+    Args:
+        user_input (str): Okutulan barkod
+        brands (list): Aday markalar (öncelik sırasıyla)
+        driver_manager (DriverManager): Paylaşılan tarayıcı yöneticisi
+    
+    Returns:
+        tuple: (marka, anahtar, ürün_adı, hata_mesajı)
+               Hiçbir markada bulunamazsa ilk adayın sonucu döner
+    """
+    executor = get_executor()
+    stop_event = threading.Event()
+    futures = {
+        executor.submit(BRAND_RESOLVERS[brand], user_input, driver_manager, stop_event): brand
+        for brand in brands
+    }
+    results = {}
+    pending = set(futures)
+    
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                brand = futures[future]
+                try:
+                    key, product_name, error = future.result()
+                except Exception as e:
+                    key, product_name, error = None, None, str(e)
+                results[brand] = (key, product_name, error)
+                if product_name:
+                    return brand, key, product_name, None
+    finally:
+        # Başlamamış adayları iptal et, bekleyen tarayıcı yollarını durdur
+        # (süren istekler biter ve sonucu önbelleğe yazılır)
+        stop_event.set()
+        for future in pending:
+            future.cancel()
+    
+    # Kimse bulamadı - öncelikli adayın anahtarıyla "bulunamadı" olarak kaydet
+    for brand in brands:
+        key, _, error = results[brand]
+        if key is not None:
+            return brand, key, None, error
+    brand = brands[0]
+    return brand, None, None, results[brand][2]
+
+
+def resolve_input(user_input, driver_manager):
+    """
+    Girişi sınıflandırır ve doğru marka(lar)da arar
+    
+    Returns:
+        tuple: (marka, anahtar, ürün_adı, hata_mesajı)
+               Giriş tanınmazsa (None, None, None, hata_mesajı)
+    """
+    brands, error = classify_input(user_input)
+    if brands is None:
+        return None, None, None, error
+    
+    if len(brands) == 1:
+        key, product_name, error = BRAND_RESOLVERS[brands[0]](user_input, driver_manager)
+        return brands[0], key, product_name, error
+    
+    return race_brands(user_input, brands, driver_manager)
+
+
+def run_mixed(driver_manager=None):
+    """
+    Karışık koli scraper'ını çalıştırır
+    
+    Args:
+        driver_manager (DriverManager): Paylaşılan tarayıcı yöneticisi.
+            Verilmezse gerekirse bu oturum için tarayıcı açılır ve sonunda kapatılır.
+    
+    Returns:
+        dict: {marka: (found_products, not_found_products)} - sadece sonucu olan markalar
+    """
+    owns_driver = driver_manager is None
+    if owns_driver:
+        driver_manager = DriverManager()
+    
+    scan_queue = ScanQueue(
+        lambda user_input: resolve_input(user_input, driver_manager),
+        workers=SCAN_WORKERS
+    )
+    cancelled = False
+    
+    try:
+        print(f"\n{Colors.HIGHLIGHT}")
+        print("═" * 70)
+        print("║                                                                    ║")
+        print("║             🔀  KARIŞIK KOLİ BARKOD ARAMA SİSTEMİ                ║")
+        print("║                                                                    ║")
+        print("═" * 70)
+        print(f"{Colors.RESET}\n")
+        
+        print(f"{Colors.INFO}┌{'─' * 68}┐{Colors.RESET}")
+        print(f"{Colors.INFO}│{' ' * 23}📋 MARKA ALGILAMA{' ' * 28}│{Colors.RESET}")
+        print(f"{Colors.INFO}├{'─' * 68}┤{Colors.RESET}")
+        print(f"{Colors.INFO}│  • 8 hane / QR            →  Mango{' ' * 31}│{Colors.RESET}")
+        print(f"{Colors.INFO}│  • 13 hane (8 ile başlar) →  Mavi{' ' * 32}│{Colors.RESET}")
+        print(f"{Colors.INFO}│  • 29 karakter            →  H&M{' ' * 33}│{Colors.RESET}")
+        print(f"{Colors.INFO}│  • 14 hane                →  Zara / Bershka / Mavi (aynı anda){' ' * 3}│{Colors.RESET}")
+        print(f"{Colors.INFO}│  • 10 hane                →  H&M / Bershka / Mavi (aynı anda){' ' * 4}│{Colors.RESET}")
+        print(f"{Colors.INFO}│  • 11+ hane               →  Mavi ürün kodu{' ' * 22}│{Colors.RESET}")
+        print(f"{Colors.INFO}└{'─' * 68}┘{Colors.RESET}\n")
+        
+        print(f"{Colors.INFO}┌{'─' * 68}┐{Colors.RESET}")
+        print(f"{Colors.INFO}│{' ' * 27}⌨️  KOMUTLAR{' ' * 29}│{Colors.RESET}")
+        print(f"{Colors.INFO}├{'─' * 68}┤{Colors.RESET}")
+        print(f"{Colors.INFO}│  q  →  Ana menüye dön ve sonuçları marka bazında kaydet{' ' * 10}│{Colors.RESET}")
+        print(f"{Colors.INFO}└{'─' * 68}┘{Colors.RESET}\n")
+        
+        print_success("⚡ Sistem hazır! Herhangi bir markanın barkodunu okutabilirsiniz...")
+        print(f"{Colors.INFO}{'─' * 70}{Colors.RESET}\n")
+        
+        while True:
+            user_input = input("Barkod/QR kod giriniz: ").strip()
+            
+            if user_input.lower() == 'q':
+                break
+            
+            if not user_input:
+                print_error("Barkod boş olamaz!")
+                continue
+            
+            brands, error = classify_input(user_input)
+            if brands is None:
+                print_error(error)
+                continue
+            
+            # Arama arka planda yapılır - sıradaki barkod hemen okutulabilir
+            if len(brands) > 1:
+                print_info(f"Olası markalar: {' / '.join(brands)} (aynı anda aranacak, kuyruğa eklendi)")
+            else:
+                print_info(f"Marka: {brands[0]} (kuyruğa eklendi)")
+            scan_queue.submit(user_input)
+    
+    except KeyboardInterrupt:
+        print(f"\n\n{Colors.WARNING}⚠ Program kullanıcı tarafından durduruldu!{Colors.RESET}")
+        cancelled = True
+    finally:
+        # Bekleyen aramaları bitir (durdurulduysa başlamamış olanları atla)
+        queued_results = scan_queue.drain(cancel=cancelled)
+        for brand in ('BERSHKA', 'H&M'):
+            get_readiness_recorder().print_summary(brand)
+        if owns_driver:
+            driver_manager.quit()
+    
+    # Sonuçları okutma sırasını koruyarak markalara ayır
+    results = {brand: ([], []) for brand in BRAND_ORDER}
+    for brand, result_line, found in queued_results:
+        results[brand][0 if found else 1].append(result_line)
+    
+    return {brand: lists for brand, lists in results.items() if lists[0] or lists[1]}
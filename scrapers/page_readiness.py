@@ -0,0 +1,216 @@
+"""
+Sayfa Hazırlık Motoru (Selenium)
+Sabit sleep yerine karar verdirici DOM durumu oluşur oluşmaz döner
+"""
+import json
+import math
+import os
+import threading
+import time
+from datetime import datetime
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from scrapers.browser_watchdog import is_dead_renderer
+
+
+# Marka bazlı üst sınırlar (saniye) - p95/p99 verisine göre ayarlanır
+READINESS_CAPS = {
+    'BERSHKA': {'first': 60, 'next': 30},
+    'H&M': {'first': 20, 'next': 15},
+}
+POLL_INTERVAL = 0.15
+READINESS_LOG_FILE = os.path.join("outputs", "readiness_times.jsonl")
+
+# Sayfa durumları
+STATE_PRODUCT = "product"
+STATE_NO_RESULTS = "no_results"
+STATE_TIMEOUT = "timeout"
+
+
+class PageNotReadyError(Exception):
+    """Sayfa üst sınır içinde karar verdirici bir duruma gelmedi - sonuç "bulunamadı" sayılmaz, önbelleğe yazılmaz"""
+
+
+# Yoklama betikleri sayfanın kararını tek execute_script çağrısında JSON olarak döndürür:
+# karar yoksa null (yoklama sürer), varsa {state, ...} - ayrıca find_elements / .text
+# çağrısı gerekmez. Son argüman (final) true ise karar olmasa da o anki içerik döndürülür.
+
+# Bershka: "Sonuç yok" veya ürün kartı metinleri görünene kadar bekler. "Sonuç yok" önce
+# kontrol edilir - genel seçiciler (p[class*='typography']) boş sonuç sayfasındaki metinleri
+# de yakalar ve bunlar ürün adı sanılmamalı
+BERSHKA_PROBE_JS = """
+const selectors = arguments[0];
+const final = arguments[1];
+const body = document.body ? document.body.innerText : '';
+if (body.includes('Sonuç yok')) return {state: 'no_results', titles: []};
+for (const selector of selectors) {
+    const titles = [];
+    for (const el of document.querySelectorAll(selector)) {
+        const text = (el.innerText || '').trim();
+        if (text.length > 2 && !titles.includes(text)) titles.push(text);
+    }
+    if (titles.length) return {state: 'product', titles: titles};
+}
+return final ? {state: null, titles: []} : null;
+"""
+
+# H&M: eşleşen article, herhangi bir article listesi veya "Sonuç yok" bekler
+HM_PROBE_JS = """
+const code = arguments[0];
+const final = arguments[1];
+const codes = Array.from(document.querySelectorAll('article[data-articlecode]'),
+                         article => article.getAttribute('data-articlecode'));
+const match = document.querySelector('article[data-articlecode="' + code + '"] h3');
+const name = match ? (match.innerText || '').trim() : '';
+if (name) return {state: 'product', name: name, codes: codes};
+const body = document.body ? document.body.innerText : '';
+if (body.includes('Sonuç yok')) return {state: 'no_results', name: null, codes: codes};
+if (document.querySelector('article[data-articlecode] h3')) return {state: 'no_results', name: null, codes: codes};
+return final ? {state: null, name: null, codes: codes} : null;
+"""
+
+
+class ReadinessRecorder:
+    """Sayfa hazır olma sürelerini kaydeder ve yüzdelik dilimleri hesaplar"""
+    
+    def __init__(self, log_file=READINESS_LOG_FILE):
+        self.log_file = log_file
+        self.samples = {}
+        self._lock = threading.Lock()
+    
+    def record(self, brand, state, seconds, is_first):
+        """
+        Tek bir gözlemi belleğe ve log dosyasına yazar
+        
+        Args:
+            brand (str): Marka adı
+            state (str): Sayfa durumu (product, no_results, timeout)
+            seconds (float): Hazır olana kadar geçen süre
+            is_first (bool): Tarayıcının ilk sayfası mı
+        """
+        with self._lock:
+            self.samples.setdefault(brand, []).append(seconds)
+            
+            entry = {
+                "time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "brand": brand,
+                "state": state,
+                "seconds": round(seconds, 3),
+                "first": is_first,
+            }
+            try:
+                os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
+                with open(self.log_file, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            except OSError:
+                pass
+    
+    def load_history(self, brand):
+        """
+        Log dosyasındaki tüm (ilk sayfa olmayan) gözlemleri okur
+        
+        Returns:
+            list: Süreler (saniye)
+        """
+        if not os.path.exists(self.log_file):
+            return []
+        
+        values = []
+        with open(self.log_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get("brand") == brand and not entry.get("first"):
+                    values.append(entry["seconds"])
+        return values
+    
+    def print_summary(self, brand):
+        """Bu oturum ve geçmiş için p50/p95/p99 hazır olma sürelerini yazdırır"""
+        session = self.samples.get(brand, [])
+        if not session:
+            return
+        
+        history = self.load_history(brand)
+        cap = READINESS_CAPS.get(brand, {}).get('next')
+        
+        print(f"⏱  Sayfa hazır olma ({brand}) - bu oturum: {format_percentiles(session)}")
+        if history:
+            print(f"⏱  Geçmiş ({len(history)} sayfa): {format_percentiles(history)} | Üst sınır: {cap} sn")
+
+
+def percentile(values, pct):
+    """Listeden yüzdelik değeri döndürür (en yakın sıra yöntemi)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def format_percentiles(values):
+    """p50/p95/p99 değerlerini tek satır olarak biçimlendirir"""
+    return (f"p50 {percentile(values, 50):.2f} sn, "
+            f"p95 {percentile(values, 95):.2f} sn, "
+            f"p99 {percentile(values, 99):.2f} sn")
+
+
+_recorder = ReadinessRecorder()
+
+
+def get_readiness_recorder():
+    """Paylaşılan hazır olma kaydedicisini döndürür"""
+    return _recorder
+
+
+def wait_for_ready(driver, brand, probe_script, probe_args=(), is_first=False):
+    """
+    Karar verdirici bir DOM durumu oluşana kadar kısa aralıklarla yoklar
+    
+    Args:
+        driver: Selenium WebDriver
+        brand (str): Marka adı (üst sınır seçimi için)
+        probe_script (str): Karar yoksa null, varsa {state, ...} döndüren JavaScript
+        probe_args (tuple): Script'e verilecek argümanlar (sonuna final bayrağı eklenir)
+        is_first (bool): Tarayıcının ilk sayfası mı (daha uzun üst sınır)
+    
+    Returns:
+        tuple: (durum, geçen_süre, karar) - karar, betiğin döndürdüğü sözlük
+    
+    Raises:
+        WebDriverException: Sekme / tarayıcı çöktüyse (çağıran yeni tarayıcıda tekrar dener)
+    """
+    caps = READINESS_CAPS.get(brand, {'first': 30, 'next': 15})
+    hard_cap = caps['first'] if is_first else caps['next']
+    
+    def probe(d):
+        try:
+            return d.execute_script(probe_script, *probe_args, False)
+        except WebDriverException as e:
+            # Çöken sekme süre dolana kadar beklenmez
+            if is_dead_renderer(e):
+                raise
+            # Sayfa henüz yüklenirken script çalışmayabilir - yoklamaya devam et
+            return None
+    
+    start = time.perf_counter()
+    try:
+        verdict = WebDriverWait(driver, hard_cap, poll_frequency=POLL_INTERVAL).until(probe)
+        state = verdict['state']
+    except TimeoutException:
+        state = STATE_TIMEOUT
+        verdict = None
+    elapsed = time.perf_counter() - start
+    
+    if verdict is None:
+        # Süre doldu - sayfada o an ne varsa tek çağrıda topla
+        try:
+            verdict = driver.execute_script(probe_script, *probe_args, True)
+        except WebDriverException as e:
+            if is_dead_renderer(e):
+                raise
+            verdict = None
+    
+    _recorder.record(brand, state, elapsed, is_first)
+    return state, elapsed, verdict or {}
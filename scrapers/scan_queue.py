@@ -0,0 +1,222 @@
+"""
+Tarama Kuyruğu
+Barkod okutma ile aramayı birbirinden ayırır: okutulan barkodlar kuyruğa eklenir,
+arka plandaki işçiler sorgular, sonuçlar bittikçe barkod etiketiyle yazdırılır.
+"""
+import queue
+import threading
+import time
+from utils import Colors
+from result_journal import record_result, reserve_order
+
+
+# İlk sonuç gelene kadar ETA için kullanılan varsayılan arama süresi (saniye)
+DEFAULT_LOOKUP_SECONDS = 2.0
+# Hareketli ortalama ağırlığı (yeni ölçümün etkisi)
+EWMA_ALPHA = 0.3
+
+# Tüm kuyruklar aynı terminale yazar - satırlar birbirine karışmasın
+_print_lock = threading.Lock()
+
+
+def format_result_line(brand, key, product_name, error=None):
+    """
+    Marka scraper'larıyla aynı formatta sonuç satırı oluşturur
+    
+    Args:
+        brand (str): Marka adı (ZARA, MAVİ, vb.)
+        key (str): İşlenmiş barkod / ürün kodu
+        product_name (str or None): Ürün adı
+        error (str or None): Bağlantı/tarayıcı hatası
+    
+    Returns:
+        str: "barkod MARKA Ürün Adı" formatında satır
+    """
+    if product_name:
+        # Mavi adları siteden geldiği gibi yazılır, diğer markalar baş harfleri büyük
+        if brand == 'MAVİ':
+            return f"{key} {brand} {product_name}"
+        return f"{key} {brand} {product_name.title()}"
+    if error:
+        return f"{key} {brand} Ürün Bulunamadı (Hata)"
+    return f"{key} {brand} Ürün Bulunamadı"
+
+
+def split_results(results):
+    """
+    Kuyruk sonuçlarını bulunan/bulunamayan listelerine ayırır
+    
+    Args:
+        results (list): drain() çıktısı - [(marka, satır, bulundu_mu), ...]
+    
+    Returns:
+        tuple: (found_products, not_found_products)
+    """
+    found_products = [line for _, line, found in results if found]
+    not_found_products = [line for _, line, found in results if not found]
+    return found_products, not_found_products
+
+
+class ScanQueue:
+    """Okutulan barkodları arka plandaki işçilerle sorgulayan iş kuyruğu"""
+    
+    def __init__(self, resolve, brand=None, workers=2):
+        """
+        Kuyruğu ve işçi thread'lerini başlatır
+        
+        Args:
+            resolve (callable): resolve(giriş) -> (anahtar, ürün_adı, hata) veya
+                brand verilmezse (marka, anahtar, ürün_adı, hata)
+            brand (str): Sabit marka adı - karışık modda None
+            workers (int): Aynı anda çalışan arama sayısı
+        """
+        self.resolve = resolve
+        self.brand = brand
+        self.workers = workers
+        
+        self._queue = queue.Queue()
+        self._results = {}
+        self._next_seq = 0
+        self._lock = threading.Lock()
+        self._avg_seconds = None
+        
+        self._threads = []
+        for index in range(workers):
+            thread = threading.Thread(target=self._worker, name=f"scan-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+    
+    def submit(self, user_input):
+        """
+        Barkodu kuyruğa ekler ve hemen döner
+        
+        Args:
+            user_input (str): Okutulan (doğrulanmış) barkod
+        """
+        with self._lock:
+            seq = self._next_seq
+            self._next_seq += 1
+        # Günlükteki sıra okutma anında alınır - araya giren toplu aramalarla tek sıra oluşur
+        self._queue.put((seq, reserve_order(), user_input))
+        
+        pending = self.pending()
+        if pending > 1:
+            self._print(f"{Colors.INFO}📥 Kuyrukta {pending} barkod | Tahmini bitiş ~{self.eta():.0f} sn{Colors.RESET}")
+    
+    def pending(self):
+        """Kuyrukta bekleyen + şu an sorgulanan barkod sayısı"""
+        return self._queue.unfinished_tasks
+    
+    def eta(self):
+        """Kuyruğun boşalması için tahmini süre (saniye)"""
+        average = self._avg_seconds if self._avg_seconds is not None else DEFAULT_LOOKUP_SECONDS
+        return self.pending() * average / self.workers
+    
+    def drain(self, cancel=False):
+        """
+        Bekleyen tüm aramaların bitmesini bekler ve işçileri durdurur
+        
+        Args:
+            cancel (bool): True ise henüz başlamamış barkodlar atlanır
+        
+        Returns:
+            list: Okutma sırasıyla [(marka, satır, bulundu_mu), ...]
+        """
+        if cancel:
+            skipped = 0
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._queue.task_done()
+                skipped += 1
+            if skipped:
+                self._print(f"{Colors.WARNING}⚠ {skipped} barkod sorgulanmadan atlandı{Colors.RESET}")
+        
+        results = self.flush()
+        
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+        
+        return results
+    
+    def flush(self):
+        """
+        Bekleyen aramaların bitmesini bekler, işçiler çalışmaya devam eder
+        
+        Returns:
+            list: Son flush'tan bu yana biten sonuçlar, okutma sırasıyla [(marka, satır, bulundu_mu), ...]
+        """
+        pending = self.pending()
+        if pending:
+            self._print(f"{Colors.INFO}⏳ {pending} barkodun sonucu bekleniyor (~{self.eta():.0f} sn)...{Colors.RESET}")
+        self._queue.join()
+        
+        with self._lock:
+            results = [self._results[seq] for seq in sorted(self._results)]
+            self._results.clear()
+        return results
+    
+    def _worker(self):
+        """Kuyruktan barkod alıp sorgular"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            
+            seq, order, user_input = item
+            start = time.perf_counter()
+            try:
+                if self.brand:
+                    brand = self.brand
+                    key, product_name, error = self.resolve(user_input)
+                else:
+                    brand, key, product_name, error = self.resolve(user_input)
+            except Exception as e:
+                brand, key, product_name, error = self.brand, None, None, str(e)
+            elapsed = time.perf_counter() - start
+            
+            if brand is None:
+                # Karışık modda tanınmayan giriş - kaydedilecek marka yok
+                self._print(f"{Colors.ERROR}❌ [{user_input}] {error}{Colors.RESET}")
+                with self._lock:
+                    self._update_average(elapsed)
+                self._queue.task_done()
+                continue
+            
+            result_line = format_result_line(brand, key or user_input, product_name, error)
+            # Sonuç kuyruk boşaltılmadan önce diske yazılır - program kapanırsa kaybolmaz
+            record_result(brand, result_line, bool(product_name), order)
+            with self._lock:
+                self._results[seq] = (brand, result_line, bool(product_name))
+                self._update_average(elapsed)
+            
+            if product_name:
+                self._print(f"{Colors.SUCCESS}✅ [{user_input}] {result_line} ({elapsed:.1f} sn){Colors.RESET}")
+            else:
+                if error:
+                    self._print(f"{Colors.WARNING}⚠ [{user_input}] {error}{Colors.RESET}")
+                self._print(f"{Colors.ERROR}❌ [{user_input}] {result_line} ({elapsed:.1f} sn){Colors.RESET}")
+            
+            self._queue.task_done()
+            
+            remaining = self.pending()
+            if remaining:
+                self._print(f"{Colors.INFO}   ⏳ Kalan {remaining} | ~{self.eta():.0f} sn{Colors.RESET}")
+    
+    def _update_average(self, seconds):
+        """Arama süresi hareketli ortalamasını günceller (kilit altında çağrılır)"""
+        if self._avg_seconds is None:
+            self._avg_seconds = seconds
+        else:
+            self._avg_seconds = EWMA_ALPHA * seconds + (1 - EWMA_ALPHA) * self._avg_seconds
+    
+    @staticmethod
+    def _print(message):
+        """Thread güvenli yazdırma"""
+        with _print_lock:
+            print(message)
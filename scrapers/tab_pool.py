@@ -0,0 +1,350 @@
+"""
+Sekme Havuzu (Selenium)
+Tek Chrome içinde birden çok sekme açar: sıradaki barkodların sayfaları, önceki sekmeler
+hâlâ yüklenirken başlatılır ve her sekmenin kararı hazır olduğunda okunur. Sayfaların ağ
+ve betik yükü sekmelerde paralel ilerler; WebDriver komutları yine page_lock ile sırayla gider.
+"""
+import threading
+import time
+import weakref
+from collections import deque
+from scrapers.browser_watchdog import is_dead_renderer, CRASH_RETRIES
+from scrapers.driver_manager import apply_resource_blocking
+from scrapers.page_readiness import (
+    wait_for_ready, get_readiness_recorder, READINESS_CAPS, POLL_INTERVAL, STATE_TIMEOUT
+)
+
+
+TAB_COUNT = 3                   # Aynı anda yüklenen arama sayfası (1 = havuz kapalı, sayfalar sırayla)
+MAX_TAB_COUNT = 8               # Chrome belleği ve site sınırları için üst sınır
+
+# Gezinme betik bittikten sonra başlar (setTimeout) - ChromeDriver komutu sayfa yüklenene
+# kadar bekletmez. Eski belgeye konan işaret yeni belgede olmadığı için yoklama, yeni sayfa
+# açılana kadar önceki barkodun kararını okumaz.
+NAVIGATE_JS = """
+const url = arguments[0];
+window.__tabPending = true;
+setTimeout(() => { window.location.href = url; }, 0);
+"""
+PENDING_GUARD_JS = "if (window.__tabPending) return null;\n"
+
+
+class PageRequest:
+    """Sekme havuzunda açılmayı bekleyen tek bir arama sayfası"""
+    
+    def __init__(self, brand, url, probe_script, probe_args, stop_event=None):
+        self.brand = brand
+        self.url = url
+        self.probe_script = PENDING_GUARD_JS + probe_script
+        self.probe_args = probe_args
+        self.stop_event = stop_event
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+    
+    def is_cancelled(self):
+        """Karışık modda yarışı başka marka kazandıysa sayfa hiç açılmaz"""
+        return self.stop_event is not None and self.stop_event.is_set()
+    
+    def finish(self, result=None, error=None):
+        """Sonucu kaydeder ve bekleyen thread'i uyandırır"""
+        self.result = result
+        self.error = error
+        self.done.set()
+
+
+class Tab:
+    """Havuzdaki bir sekme ve içinde yüklenen sayfa"""
+    
+    def __init__(self, handle):
+        self.handle = handle
+        self.request = None
+        self.started = 0.0
+    
+    def start(self, request):
+        """Sekmeye yeni sayfa atar"""
+        self.request = request
+        self.started = time.perf_counter()
+
+
+class TabPool:
+    """
+    Bekleyen sayfaları boş sekmelere dağıtır ve hazır olanları toplar
+    page_lock'u alan thread havuzu kendi sayfası bitene kadar yürütür (diğer thread'lerin
+    sayfalarını da başlatır ve toplar); sonra kilidi sıradaki bekleyene bırakır.
+    """
+    
+    def __init__(self, driver_manager, size=None):
+        """
+        Havuzu hazırlar (sekmeler ilk sayfada açılır)
+        
+        Args:
+            driver_manager (DriverManager): Sekmelerin açılacağı tarayıcı
+            size (int): Sekme sayısı - verilmezse TAB_COUNT (MAX_TAB_COUNT ile sınırlı)
+        """
+        self.driver_manager = driver_manager
+        self.size = max(1, min(size or TAB_COUNT, MAX_TAB_COUNT))
+        
+        # Gösterge sayaçları
+        self.pages = 0
+        self.timeouts = 0
+        self.peak_in_flight = 0
+        
+        self._driver = None                 # Sekmelerin açıldığı sürücü
+        self._main_handle = None            # İlk açılış ve tek sekme sayfaları bu sekmede kalır
+        self._tabs = []
+        self._pending = deque()
+        self._lock = threading.Lock()
+    
+    def load(self, brand, url, probe_script, probe_args=(), stop_event=None):
+        """
+        Sayfayı boş bir sekmede açar ve karar oluşana kadar bekler
+        
+        Args:
+            brand (str): Marka adı (üst sınır seçimi için)
+            url (str): Arama sayfası URL'si
+            probe_script (str): page_readiness yoklama betiği
+            probe_args (tuple): Betiğe verilecek argümanlar (sonuna final bayrağı eklenir)
+            stop_event (threading.Event): İşaretlenmişse sayfa açılmadan vazgeçilir
+        
+        Returns:
+            tuple or None: wait_for_ready ile aynı (durum, geçen_süre, karar) - vazgeçildiyse None
+        
+        Raises:
+            WebDriverException: Tarayıcı hatalarında
+        """
+        request = PageRequest(brand, url, probe_script, probe_args, stop_event)
+        with self._lock:
+            self._pending.append(request)
+        
+        while not request.done.is_set():
+            with self.driver_manager.page_lock:
+                if not request.done.is_set():
+                    self._pump(request)
+        
+        if request.error is not None:
+            raise request.error
+        return request.result
+    
+    def _pump(self, until):
+        """Verilen sayfa bitene kadar sekmelere iş dağıtır ve hazır olanları toplar"""
+        driver = None
+        try:
+            while not until.done.is_set():
+                # Tarayıcının yenilenme zamanı geldiyse yeni sayfa başlatılmaz; açık sayfalar
+                # bitip sekmeler boşalınca (iki sayfa arasında) tarayıcı yenilenir
+                recycle_due = self.driver_manager.watchdog.recycle_reason() is not None
+                if recycle_due and not self._in_flight() and self.driver_manager.recycle_if_due():
+                    driver = None
+                    recycle_due = False
+                
+                if driver is None:
+                    driver = self.driver_manager.get_driver()
+                    if self._driver is not driver:
+                        self._open_tabs(driver)
+                
+                if not recycle_due:
+                    self._assign(driver)
+                if not self._harvest(driver):
+                    time.sleep(POLL_INTERVAL)
+        except Exception as e:
+            if driver is not None and is_dead_renderer(e):
+                self.driver_manager.restart_after_crash(driver)
+            self._fail(e, until)
+        finally:
+            # Kilidi alacak tek sekme yolu ana sekmede çalışır
+            if driver is not None and self._driver is driver:
+                try:
+                    driver.switch_to.window(self._main_handle)
+                except Exception:
+                    pass
+    
+    def _open_tabs(self, driver):
+        """Sürücüde havuz sekmelerini açar (kaynak engelleme sekme başına uygulanır)"""
+        with self._lock:
+            # Önceki tarayıcıda yarım kalan sayfalar yeni sekmelerde baştan açılır
+            for tab in reversed(self._tabs):
+                if tab.request is not None:
+                    self._pending.appendleft(tab.request)
+        self._tabs = []
+        
+        self._main_handle = driver.current_window_handle
+        for _ in range(self.size):
+            driver.switch_to.new_window('tab')
+            # CDP engelleme listesi yalnızca komutun gönderildiği sekmede geçerli
+            if self.driver_manager.lean:
+                apply_resource_blocking(driver)
+            self._tabs.append(Tab(driver.current_window_handle))
+        self._driver = driver
+    
+    def _next_request(self):
+        """Sıradaki açılacak sayfa (vazgeçilenler atlanıp bitirilir)"""
+        with self._lock:
+            while self._pending:
+                request = self._pending.popleft()
+                if not request.is_cancelled():
+                    return request
+                request.finish(None)
+        return None
+    
+    def _assign(self, driver):
+        """Boş sekmelerde bekleyen sayfaların gezinmesini başlatır"""
+        for tab in self._tabs:
+            if tab.request is not None:
+                continue
+            request = self._next_request()
+            if request is None:
+                break
+            driver.switch_to.window(tab.handle)
+            driver.execute_script(NAVIGATE_JS, request.url)
+            tab.start(request)
+        
+        self.peak_in_flight = max(self.peak_in_flight, self._in_flight())
+    
+    def _in_flight(self):
+        """Yüklenmekte olan sayfa sayısı"""
+        return sum(1 for tab in self._tabs if tab.request is not None)
+    
+    def _harvest(self, driver):
+        """
+        Yüklenen sekmeleri en eskiden başlayarak yoklar
+        
+        Returns:
+            bool: En az bir sayfa bittiyse True
+        """
+        progressed = False
+        for tab in sorted((tab for tab in self._tabs if tab.request is not None), key=lambda tab: tab.started):
+            request = tab.request
+            driver.switch_to.window(tab.handle)
+            elapsed = time.perf_counter() - tab.started
+            hard_cap = READINESS_CAPS.get(request.brand, {'next': 15})['next']
+            
+            verdict = self._probe(driver, request, False)
+            if verdict is not None:
+                state = verdict['state']
+            elif elapsed >= hard_cap:
+                # Süre doldu - sekmede o an ne varsa tek çağrıda topla
+                state = STATE_TIMEOUT
+                verdict = self._probe(driver, request, True)
+                self.timeouts += 1
+            else:
+                continue
+            
+            get_readiness_recorder().record(request.brand, state, elapsed, False)
+            self.driver_manager.record_page(elapsed)
+            tab.request = None
+            self.pages += 1
+            request.finish((state, elapsed, verdict or {}))
+            progressed = True
+        return progressed
+    
+    def _probe(self, driver, request, final):
+        """Sekmenin yoklama betiğini çalıştırır (yüklenirken çalışmazsa None, sekme çöktüyse hata)"""
+        try:
+            return driver.execute_script(request.probe_script, *request.probe_args, final)
+        except Exception as e:
+            # Çöken sekme süre dolana kadar beklenmez - sayfa yeni tarayıcıda tekrar açılır
+            if is_dead_renderer(e):
+                raise
+            return None
+    
+    def _fail(self, error, until):
+        """Tarayıcı hatasında sekmelerdeki sayfaları (ve bekleyen thread'in sayfasını) hatayla bitirir"""
+        for tab in self._tabs:
+            if tab.request is not None:
+                tab.request.finish(error=error)
+                tab.request = None
+        if not until.done.is_set():
+            with self._lock:
+                if until in self._pending:
+                    self._pending.remove(until)
+            until.finish(error=error)
+        # Sekmeler bir sonraki sayfada yeniden açılır
+        self._driver = None
+    
+    def print_summary(self):
+        """Sekme havuzu kullanım özetini yazdırır"""
+        if not self.pages:
+            return
+        text = f"🗂  Sekme havuzu: {self.size} sekme, {self.pages} sayfa, en fazla {self.peak_in_flight} sayfa aynı anda"
+        if self.timeouts:
+            text += f", {self.timeouts} zaman aşımı"
+        print(text)
+
+
+_pools = weakref.WeakKeyDictionary()
+_pools_lock = threading.Lock()
+
+
+def get_tab_pool(driver_manager):
+    """
+    Tarayıcı yöneticisine ait sekme havuzunu döndürür (yoksa oluşturur)
+    
+    Args:
+        driver_manager (DriverManager): Sekmelerin açılacağı tarayıcı
+    
+    Returns:
+        TabPool: Paylaşılan sekme havuzu
+    """
+    with _pools_lock:
+        pool = _pools.get(driver_manager)
+        if pool is None:
+            pool = TabPool(driver_manager)
+            _pools[driver_manager] = pool
+        return pool
+
+
+def load_page(driver_manager, brand, url, probe_script, probe_args=(), is_first=False, stop_event=None):
+    """
+    Arama sayfasını açar ve yoklama kararını döndürür
+    Marka ısınmışsa ve TAB_COUNT > 1 ise sekme havuzu, değilse ana sekmede tek sayfa kullanılır
+    (ilk açılışın çerez ve anti-bot kurulumu tek sekmede tamamlanır).
+    
+    Args:
+        driver_manager (DriverManager): Tarayıcı yöneticisi
+        brand (str): Marka adı
+        url (str): Arama sayfası URL'si
+        probe_script (str): page_readiness yoklama betiği
+        probe_args (tuple): Betiğe verilecek argümanlar
+        is_first (bool): Markanın bu tarayıcıdaki ilk sayfası mı
+        stop_event (threading.Event): İşaretlenmişse sayfa açılmadan vazgeçilir
+    
+    Returns:
+        tuple or None: (durum, geçen_süre, karar) - vazgeçildiyse None
+    
+    Raises:
+        WebDriverException: Tarayıcı hatalarında (sekme çökmesi CRASH_RETRIES kez yeni tarayıcıda denenir)
+    """
+    for attempt in range(CRASH_RETRIES + 1):
+        try:
+            return _load_page_once(driver_manager, brand, url, probe_script, probe_args, is_first, stop_event)
+        except Exception as e:
+            if attempt == CRASH_RETRIES or not is_dead_renderer(e):
+                raise
+            # Çöken tarayıcı hatanın alındığı yerde kapatıldı - "Ürün Bulunamadı (Hata)"
+            # yazmak yerine sayfa yeni tarayıcıda tekrar açılır
+            driver_manager.watchdog.retries += 1
+            is_first = not driver_manager.is_warmed(brand)
+            print("↻ Sayfa yeni tarayıcıda tekrar açılıyor...")
+
+
+def _load_page_once(driver_manager, brand, url, probe_script, probe_args, is_first, stop_event):
+    """Sayfayı bir kez açar (sekme havuzu veya ana sekme)"""
+    if TAB_COUNT > 1 and not is_first:
+        return get_tab_pool(driver_manager).load(brand, url, probe_script, probe_args, stop_event)
+    
+    with driver_manager.page_lock:
+        if stop_event is not None and stop_event.is_set():
+            return None
+        # Ana sekmede açık sayfa yok - bekçi isterse tarayıcı burada yenilenir
+        driver_manager.recycle_if_due()
+        driver = driver_manager.get_driver()
+        try:
+            driver.get(url)
+            page = wait_for_ready(driver, brand, probe_script, probe_args, is_first=is_first)
+        except Exception as e:
+            if is_dead_renderer(e):
+                driver_manager.restart_after_crash(driver)
+            raise
+        driver_manager.record_page(page[1])
+        return page
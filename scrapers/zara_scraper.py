@@ -1,8 +1,178 @@
 """
 Zara Barkod Scraper
 """
-import requests
+import random
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+from lookup_cache import get_lookup_cache
+from lookup_timings import start_lookup, stage, set_strategy
+from utils import prompt_bulk_input
+from result_journal import reserve_bulk_orders, record_bulk_result
+from scrapers.scan_queue import ScanQueue, split_results, format_result_line
+from scrapers.host_limiter import host_slot, print_host_states
+from scrapers.cookie_store import attach_cookie_jar
+
+
+ZARA_API_URL = "https://www.zara.com/itxrest/1/search/store/11766/reference"
+
+# Toplu arama ayarları
+BULK_MAX_WORKERS = 16           # En fazla işçi - gerçek eşzamanlılığı site sınırlayıcısı belirler
+REQUEST_TIMEOUT = (5, 10)       # (bağlantı, okuma) zaman aşımı - saniye
+BULK_PROGRESS_EVERY = 25        # Kaç sonuçta bir ilerleme satırı yazılacak
+SCAN_WORKERS = 4                # Okutma sırasında arka planda çalışan arama sayısı
+
+# İstemci ayarları
+RATE_LIMIT_PER_SECOND = 10      # Uç noktaya saniyede en fazla istek (ortalama)
+RATE_LIMIT_BURST = 10           # Boşta birikebilecek en fazla istek hakkı
+MAX_ATTEMPTS = 3                # Geçici hatalarda toplam deneme sayısı
+BACKOFF_BASE = 0.5              # İlk bekleme (saniye) - her denemede iki katına çıkar
+BACKOFF_MAX = 5.0               # En uzun bekleme (saniye)
+TRANSIENT_STATUS = {429, 500, 502, 503, 504}
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Referer': 'https://www.zara.com/tr/',
+    'Origin': 'https://www.zara.com'
+}
+
+
+class RateLimiter:
+    """Token bucket - istekleri saniyede belirli bir ortalamaya yayar"""
+    
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Bir istek hakkı alır, hak yoksa gerektiği kadar bekler"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_seconds = (1 - self.tokens) / self.rate
+            time.sleep(wait_seconds)
+
+
+class ZaraClient:
+    """
+    Zara itxrest arama uç noktası için istemci
+    Keep-alive bağlantı havuzu, oturum boyunca sabit session id, zaman aşımı,
+    geçici hatalarda rastgele gecikmeli yeniden deneme ve istemci tarafı hız sınırı
+    """
+    
+    def __init__(self, rate=RATE_LIMIT_PER_SECOND, burst=RATE_LIMIT_BURST,
+                 max_attempts=MAX_ATTEMPTS, timeout=REQUEST_TIMEOUT):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=BULK_MAX_WORKERS)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(HEADERS)
+        
+        # Site aynı tarayıcı oturumundan gelen aramalar gibi görür
+        self.session_id = str(uuid.uuid4())
+        self.limiter = RateLimiter(rate, burst)
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+        
+        # Bu oturumdaki yeniden deneme / hata sayaçları
+        self.retries = 0
+        self.errors = 0
+    
+    def build_params(self, barcode):
+        """Arama parametreleri"""
+        return {
+            'reference': barcode,
+            'locale': 'tr_TR',
+            'session': self.session_id,
+            'deviceType': 'mobile',
+            'deviceOS': 'Windows',
+            'deviceOSVersion': '10',
+            'scope': 'mobileweb',
+            'origin': 'search',
+            'ajax': 'true'
+        }
+    
+    def search(self, barcode, timeout=None):
+        """
+        Barkodu arar, geçici hatalarda yeniden dener
+        
+        Args:
+            barcode (str): İşlenmiş barkod (10 hane)
+            timeout (tuple): (bağlantı, okuma) zaman aşımı - verilmezse istemci ayarı
+        
+        Returns:
+            dict: API'nin JSON yanıtı
+        
+        Raises:
+            requests.exceptions.RequestException: Tüm denemeler başarısız olursa
+            ValueError: Yanıt JSON değilse
+        """
+        timeout = timeout or self.timeout
+        
+        for attempt in range(1, self.max_attempts + 1):
+            self.limiter.acquire()
+            try:
+                # Site bazlı eşzamanlılık sınırı - 429/403/zaman aşımında tüm Zara istekleri yavaşlar
+                with host_slot(ZARA_API_URL) as slot:
+                    with stage('network'):
+                        response = self.session.get(ZARA_API_URL, params=self.build_params(barcode), timeout=timeout)
+                    slot.observe(response.status_code, response.headers)
+                if response.status_code not in TRANSIENT_STATUS:
+                    response.raise_for_status()
+                    with stage('parse'):
+                        return response.json()
+                error = requests.exceptions.HTTPError(f"HTTP {response.status_code}", response=response)
+                retry_after = slot.retry_after
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error = e
+                retry_after = None
+            
+            if attempt == self.max_attempts:
+                self.errors += 1
+                raise error
+            
+            self.retries += 1
+            # Retry-After süresini site sınırlayıcısı uygular (yeni istekler o süre bekler)
+            if retry_after is None:
+                time.sleep(backoff_delay(attempt))
+
+
+def backoff_delay(attempt):
+    """Üstel bekleme süresi - aynı anda başarısız olan istekler aynı anda tekrar denemesin diye rastgele"""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (attempt - 1)))
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """
+    Tüm Zara istekleri için paylaşılan istemciyi döndürür
+    
+    Returns:
+        ZaraClient: Bağlantı havuzlu, hız sınırlı istemci
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = ZaraClient()
+            attach_cookie_jar(_client.session, "zara", "ZARA")
+        return _client
 
 
 def validate_and_process_barcode(raw_barcode):
@@ -27,53 +197,173 @@ def validate_and_process_barcode(raw_barcode):
     return processed_barcode, None
 
 
-def get_product_name(barcode):
+def get_product_name(barcode, timeout=REQUEST_TIMEOUT):
     """
     Zara API'sinden barkod numarasına göre ürün adını çeker
     
     Args:
         barcode (str): Ürün barkod numarası (örn: "4813858712")
+        timeout (tuple): (bağlantı, okuma) zaman aşımı
     
     Returns:
-        tuple: (ürün_adı, başarılı_mı) - Başarılıysa (ad, True), değilse (None, False)
+        tuple: (ürün_adı, hata_mesajı)
+               Bulunursa (ad, None), ürün yoksa (None, None),
+               bağlantı/HTTP hatasında (None, hata_mesajı)
     """
-    base_url = "https://www.zara.com/itxrest/1/search/store/11766/reference"
-    session_id = str(uuid.uuid4())
-    
-    params = {
-        'reference': barcode,
-        'locale': 'tr_TR',
-        'session': session_id,
-        'deviceType': 'mobile',
-        'deviceOS': 'Windows',
-        'deviceOSVersion': '10',
-        'scope': 'mobileweb',
-        'origin': 'search',
-        'ajax': 'true'
-    }
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-        'Accept': 'application/json, text/plain, */*',
-        'Accept-Language': 'tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7',
-        'Referer': 'https://www.zara.com/tr/',
-        'Origin': 'https://www.zara.com'
-    }
-    
     try:
-        response = requests.get(base_url, params=params, headers=headers)
-        response.raise_for_status()
-        data = response.json()
+        data = get_client().search(barcode, timeout)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"⚠️ API hatası: {e}")
+        return None, f"API hatası: {e}"
+    
+    if data.get('status') == 'SUCCESS' and data.get('results'):
+        try:
+            return data['results'][0]['content']['name'], None
+        except (KeyError, IndexError, TypeError):
+            return None, "API yanıtı beklenen formatta değil"
+    return None, None
+
+
+def resolve_barcode(raw_barcode, driver_manager=None, stop_event=None):
+    """
+    Ham barkodu önbellek ve API üzerinden çözer (tarama kuyruğu ve karışık mod için)
+    
+    Args:
+        raw_barcode (str): Ham barkod (14 haneli)
+        driver_manager (DriverManager): Kullanılmaz - tüm çözücülerle aynı imza için
+        stop_event (threading.Event): Kullanılmaz - tüm çözücülerle aynı imza için
+    
+    Returns:
+        tuple: (işlenmiş_barkod, ürün_adı, hata_mesajı) - ürün yoksa (barkod, None, None)
+    """
+    with start_lookup("ZARA", "api"):
+        with stage('validate'):
+            processed_barcode, error = validate_and_process_barcode(raw_barcode)
+        if error:
+            set_strategy("invalid")
+            return None, None, error
         
-        if data.get('status') == 'SUCCESS' and data.get('results'):
-            product_name = data['results'][0]['content']['name']
-            return product_name, True
+        cache = get_lookup_cache()
+        with stage('cache'):
+            cached, cached_name = cache.get("ZARA", processed_barcode)
+        if cached:
+            set_strategy("cache")
+            return processed_barcode, cached_name, None
+        
+        product_name, error = get_product_name(processed_barcode)
+        if error:
+            # Bağlantı hatası "bulunamadı" olarak önbelleğe yazılmaz
+            return processed_barcode, None, error
+        with stage('persist'):
+            cache.put("ZARA", processed_barcode, product_name, "api")
+        return processed_barcode, product_name, None
+
+
+def get_product_name_timed(barcode, timeout=REQUEST_TIMEOUT):
+    """Toplu aramada tek barkodu süre ölçümüyle sorgular (işçi thread'inde çalışır)"""
+    with start_lookup("ZARA", "api_bulk"):
+        return get_product_name(barcode, timeout)
+
+
+def run_zara_bulk(raw_barcodes, max_workers=BULK_MAX_WORKERS, timeout=REQUEST_TIMEOUT):
+    """
+    Barkod listesini sınırlı sayıda işçi ile paralel olarak sorgular
+    
+    Args:
+        raw_barcodes (list): Ham barkodlar (14 haneli)
+        max_workers (int): Aynı anda çalışan en fazla istek sayısı
+        timeout (tuple): İstek başına (bağlantı, okuma) zaman aşımı
+    
+    Returns:
+        tuple: (found_products, not_found_products) - giriş sırasıyla
+    """
+    found_products = []
+    not_found_products = []
+    
+    # Doğrula ve işle - geçersizleri raporla
+    processed_list = []
+    for raw_barcode in raw_barcodes:
+        processed_barcode, error = validate_and_process_barcode(raw_barcode)
+        if error:
+            print(f"❌ {raw_barcode}: {error}")
+            continue
+        processed_list.append(processed_barcode)
+    
+    # Aynı barkod listede birden fazla geçebilir - her birini bir kez sorgula
+    cache = get_lookup_cache()
+    results = {}
+    unique_barcodes = []
+    for barcode in dict.fromkeys(processed_list):
+        cached, cached_name = cache.get("ZARA", barcode)
+        if cached:
+            results[barcode] = (cached_name, None)
         else:
-            return None, False
+            unique_barcodes.append(barcode)
+    
+    if results:
+        print(f"💾 {len(results)} barkod önbellekten alındı")
+    
+    total = len(unique_barcodes)
+    
+    if not processed_list:
+        print("❌ Sorgulanacak geçerli barkod yok!")
+        return found_products, not_found_products
+    
+    # Her sonuç bulunduğu anda giriş sırasındaki yerine günlüğe yazılır
+    journal_orders = reserve_bulk_orders(processed_list)
+    for barcode, (product_name, error) in results.items():
+        record_bulk_result("ZARA", format_result_line("ZARA", barcode, product_name, error),
+                           bool(product_name), journal_orders.get(barcode, ()))
+    
+    print(f"🔍 {len(processed_list)} geçerli barkod ({total} benzersiz) sorgulanıyor... "
+          f"(En fazla {max_workers} eşzamanlı istek, site sınırına göre ayarlanır)")
+    
+    start_time = time.perf_counter()
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(get_product_name_timed, barcode, timeout): barcode
+            for barcode in unique_barcodes
+        }
+        
+        for done, future in enumerate(as_completed(futures), start=1):
+            barcode = futures[future]
+            product_name, error = future.result()
+            results[barcode] = (product_name, error)
+            if error is None:
+                cache.put("ZARA", barcode, product_name, "api")
+            record_bulk_result("ZARA", format_result_line("ZARA", barcode, product_name, error),
+                               bool(product_name), journal_orders.get(barcode, ()))
             
-    except Exception as e:
-        print(f"⚠️ API hatası: {e}")
-        return None, False
+            if done % BULK_PROGRESS_EVERY == 0 or done == total:
+                elapsed = time.perf_counter() - start_time
+                rate = done / elapsed if elapsed > 0 else 0
+                remaining = (total - done) / rate if rate > 0 else 0
+                print(f"   ⏳ {done}/{total} tamamlandı | {rate:.1f} barkod/sn | "
+                      f"Kalan ~{remaining:.0f} sn")
+    
+    elapsed = time.perf_counter() - start_time
+    
+    error_count = 0
+    for processed_barcode in processed_list:
+        product_name, error = results[processed_barcode]
+        result_line = format_result_line("ZARA", processed_barcode, product_name, error)
+        if product_name:
+            found_products.append(result_line)
+        else:
+            not_found_products.append(result_line)
+            if error:
+                error_count += 1
+    
+    print(f"✅ Toplu arama tamamlandı: {len(found_products)} bulundu, "
+          f"{len(not_found_products)} bulunamadı")
+    if error_count:
+        print(f"⚠️ {error_count} barkod bağlantı hatası nedeniyle sorgulanamadı (önbelleğe yazılmadı)")
+    if total:
+        print_host_states([ZARA_API_URL])
+        print(f"⚡ {total} sorgu {elapsed:.1f} sn'de ({total / elapsed if elapsed > 0 else 0:.1f} barkod/sn)\n")
+    
+    return found_products, not_found_products
 
 
 def run_zara():
@@ -86,6 +376,7 @@ def run_zara():
     """
     found_products = []
     not_found_products = []
+    scan_queue = ScanQueue(resolve_barcode, brand="ZARA", workers=SCAN_WORKERS)
     
     print("\n" + "═" * 70)
     print("║                                                                    ║")
@@ -106,6 +397,7 @@ def run_zara():
     print(f"├{'─' * 68}┤")
     print(f"│  q  →  Ana menüye dön ve sonuçları kaydet{' ' * 24}│")
     print(f"│  s  →  Bulunamayan ürünü atla (düzenleme modunda){' ' * 15}│")
+    print(f"│  b  →  Toplu arama (dosya yolu veya yapıştırılan liste){' ' * 10}│")
     print(f"└{'─' * 68}┘\n")
     
     print("⚡ API hazır! Barkod girmeye başlayabilirsiniz...")
@@ -118,35 +410,34 @@ def run_zara():
         if raw_barcode.lower() == 'q':
             break
         
+        if raw_barcode.lower() == 'b':
+            # Önce okutulmuş barkodlar - sonuçlar okutma / toplu arama sırasıyla tek listede kalır
+            queued_found, queued_not_found = split_results(scan_queue.flush())
+            found_products.extend(queued_found)
+            not_found_products.extend(queued_not_found)
+            
+            # Toplu sonuçlar bulundukça günlüğe yazılır
+            bulk_found, bulk_not_found = run_zara_bulk(prompt_bulk_input())
+            found_products.extend(bulk_found)
+            not_found_products.extend(bulk_not_found)
+            continue
+        
         if not raw_barcode:
             print("❌ Barkod boş olamaz!")
             continue
         
-        print(f"📋 Ham Barkod: {raw_barcode}")
-        
         processed_barcode, error = validate_and_process_barcode(raw_barcode)
         
         if error:
             print(f"❌ {error}")
             continue
         
-        print(f"🔄 İşlenmiş Barkod: {processed_barcode}")
-        print(f"   (Başındaki '0' ve son 3 hane çıkarıldı)")
-        print("🔍 Ürün bilgisi sorgulanıyor...")
-        
-        product_name, success = get_product_name(processed_barcode)
-        
-        if success and product_name:
-            formatted_product_name = product_name.title()
-            result_line = f"{processed_barcode} ZARA {formatted_product_name}"
-            found_products.append(result_line)
-            print(f"✅ {result_line}")
-        else:
-            result_line = f"{processed_barcode} ZARA Ürün Bulunamadı"
-            not_found_products.append(result_line)
-            print(f"❌ {result_line}")
-        
-        print("✅ Tamamlandı!\n")
+        # Sorgu arka planda yapılır - sıradaki barkod hemen okutulabilir
+        print(f"🔄 {raw_barcode} → {processed_barcode} (kuyruğa eklendi)")
+        scan_queue.submit(raw_barcode)
     
-    return found_products, not_found_products
+    # Bekleyen sorguları bitir, sonuçları okutma sırasıyla al
+    queued_found, queued_not_found = split_results(scan_queue.drain())
+    
+    return found_products + queued_found, not_found_products + queued_not_found
 
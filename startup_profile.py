@@ -0,0 +1,83 @@
+"""
+Açılış Profili
+`python main.py --profile-startup` ile çalıştırıldığında her modülün import süresini ölçer,
+giriş ekranına kadar geçen süreyi bütçeyle karşılaştırıp raporlar ve programı kapatır
+(bütçe aşılırsa çıkış kodu 1 - süre takip betiklerinde kullanılabilir)
+"""
+import builtins
+import sys
+import time
+
+
+PROFILE_FLAG = "--profile-startup"
+STARTUP_BUDGET_MS = 150         # Giriş ekranına kadar izin verilen süre (main.py'nin ilk satırından)
+REPORT_TOP = 12                 # Raporda gösterilen en yavaş import sayısı
+
+_started = time.perf_counter()
+_enabled = False
+_original_import = builtins.__import__
+_imports = []                   # (modül, süre_ms, derinlik) - yeni yüklenen modüller
+_depth = 0
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    """İlk kez yüklenen modüllerin import süresini (alt importlarıyla birlikte) kaydeder"""
+    global _depth
+    if level or name in sys.modules:
+        return _original_import(name, globals, locals, fromlist, level)
+    
+    depth = _depth
+    _depth += 1
+    start = time.perf_counter()
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        _depth -= 1
+        _imports.append((name, (time.perf_counter() - start) * 1000, depth))
+
+
+def install():
+    """Komut satırında --profile-startup varsa import ölçümünü başlatır (main.py'nin başında çağrılır)"""
+    global _enabled
+    if PROFILE_FLAG not in sys.argv or _enabled:
+        return
+    _enabled = True
+    builtins.__import__ = _timed_import
+
+
+def is_enabled():
+    """Açılış profili modu açık mı"""
+    return _enabled
+
+
+def report(milestone="Giriş ekranı"):
+    """
+    Ölçümü durdurur ve import sürelerini bütçeyle birlikte yazdırır
+    
+    Args:
+        milestone (str): Sürenin ölçüldüğü nokta
+    
+    Returns:
+        bool: Toplam süre bütçe içindeyse True
+    """
+    elapsed_ms = (time.perf_counter() - _started) * 1000
+    builtins.__import__ = _original_import
+    from utils import Colors, print_success, print_warning
+    
+    # main.py'nin doğrudan ve bir alt seviyedeki importları, en yavaştan başlayarak
+    rows = sorted((row for row in _imports if row[2] <= 1), key=lambda row: row[1], reverse=True)
+    
+    print(f"\n{Colors.INFO}┌{'─' * 68}┐{Colors.RESET}")
+    print(f"{Colors.INFO}│{' ' * 24}⏱  AÇILIŞ PROFİLİ{' ' * 26}│{Colors.RESET}")
+    print(f"{Colors.INFO}├{'─' * 68}┤{Colors.RESET}")
+    for name, ms, depth in rows[:REPORT_TOP]:
+        text = f"{'  ' * depth}{name:<{36 - 2 * depth}}{ms:>9.1f} ms"
+        print(f"{Colors.INFO}│  • {text}{' ' * max(0, 64 - len(text))}│{Colors.RESET}")
+    print(f"{Colors.INFO}└{'─' * 68}┘{Colors.RESET}")
+    
+    summary = f"{milestone}: {elapsed_ms:.0f} ms (bütçe {STARTUP_BUDGET_MS} ms, {len(_imports)} modül yüklendi)"
+    if elapsed_ms <= STARTUP_BUDGET_MS:
+        print_success(summary)
+        return True
+    print_warning(f"{summary} - bütçe aşıldı!")
+    return False
@@ -0,0 +1,22 @@
+"""
+Test ortamı
+Modüller çıktılarını çalışma klasörüne göre (outputs/...) yazar; her test geçici bir
+klasörde çalışır, böylece gerçek önbellek, günlük ve istatistik dosyalarına dokunulmaz.
+"""
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+import result_journal
+
+
+@pytest.fixture(autouse=True)
+def isolated_outputs(tmp_path, monkeypatch):
+    """Testi geçici klasörde, aktif oturum günlüğü olmadan çalıştırır"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(result_journal, "_active", None)
+    return tmp_path
@@ -0,0 +1,133 @@
+"""HostLimiter.release: AIMD sınır ayarı ve Retry-After"""
+import types
+
+import pytest
+
+from scrapers import host_limiter
+from scrapers.host_limiter import (
+    HostLimiter, host_slot, OUTCOME_OK, OUTCOME_THROTTLED, OUTCOME_TIMEOUT, OUTCOME_ERROR
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Sınırlayıcının gördüğü monotonic saati elle ilerletilebilir yapar"""
+    now = types.SimpleNamespace(value=100.0)
+    monkeypatch.setattr(host_limiter, "time", types.SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+def run_requests(limiter, outcomes):
+    """İstekleri aynı anda başlatır ve sırayla bitirir"""
+    for _ in outcomes:
+        assert limiter.try_acquire()
+    for outcome in outcomes:
+        limiter.release(outcome)
+
+
+def run_saturated(limiter, count):
+    """Sınırı dolu tutan yükü taklit eder: her başarılı yanıtın yerine hemen yeni istek başlar"""
+    while limiter.try_acquire():
+        pass
+    for _ in range(count):
+        limiter.release(OUTCOME_OK)
+        limiter.try_acquire()
+
+
+def test_release_frees_the_slot(clock):
+    limiter = HostLimiter("example.com", initial=1, maximum=4)
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+    
+    limiter.release(OUTCOME_ERROR)
+    assert limiter.in_flight == 0
+    assert limiter.try_acquire()
+
+
+def test_full_window_of_successes_raises_limit_by_one(clock):
+    limiter = HostLimiter("example.com", initial=2, maximum=4)
+    run_saturated(limiter, 2)
+    assert int(limiter.limit) == 3
+    assert int(limiter.peak_limit) == 3
+
+
+def test_successes_below_the_limit_do_not_count(clock):
+    limiter = HostLimiter("example.com", initial=2, maximum=4)
+    # İkinci yanıt geldiğinde sınır artık dolu değil - tek başarı sayılır
+    run_requests(limiter, [OUTCOME_OK, OUTCOME_OK])
+    assert int(limiter.limit) == 2
+    run_requests(limiter, [OUTCOME_OK, OUTCOME_OK])
+    assert int(limiter.limit) == 3
+
+
+def test_sequential_use_does_not_raise_limit(clock):
+    limiter = HostLimiter("example.com", initial=2, maximum=4)
+    for _ in range(10):
+        run_requests(limiter, [OUTCOME_OK])
+    assert int(limiter.limit) == 2
+
+
+def test_limit_never_exceeds_maximum(clock):
+    limiter = HostLimiter("example.com", initial=2, maximum=3)
+    run_saturated(limiter, 20)
+    assert int(limiter.limit) == 3
+
+
+def test_throttle_halves_limit_once_per_cooldown(clock):
+    limiter = HostLimiter("example.com", initial=8, maximum=16)
+    run_requests(limiter, [OUTCOME_THROTTLED, OUTCOME_THROTTLED, OUTCOME_TIMEOUT])
+    assert limiter.limit == 4
+    assert (limiter.throttled, limiter.timeouts) == (2, 1)
+    
+    clock.value += host_limiter.DECREASE_COOLDOWN
+    run_requests(limiter, [OUTCOME_THROTTLED])
+    assert limiter.limit == 2
+
+
+def test_limit_does_not_drop_below_minimum(clock):
+    limiter = HostLimiter("example.com", initial=1, maximum=4)
+    run_requests(limiter, [OUTCOME_TIMEOUT])
+    assert limiter.limit == host_limiter.MIN_LIMIT
+
+
+def test_retry_after_blocks_new_requests(clock):
+    limiter = HostLimiter("example.com", initial=2, maximum=4)
+    assert limiter.try_acquire()
+    limiter.release(OUTCOME_THROTTLED, retry_after=5)
+    
+    assert not limiter.try_acquire()
+    clock.value += 5
+    assert limiter.try_acquire()
+
+
+def test_retry_after_is_capped(clock):
+    limiter = HostLimiter("example.com", initial=2, maximum=4)
+    assert limiter.try_acquire()
+    limiter.release(OUTCOME_THROTTLED, retry_after=3600)
+    assert limiter.blocked_until == clock.value + host_limiter.MAX_RETRY_AFTER
+
+
+def test_host_slot_releases_with_observed_outcome(monkeypatch):
+    monkeypatch.setattr(host_limiter, "_limiters", {})
+    url = "https://slot.example.com/search"
+    
+    with host_slot(url) as slot:
+        slot.observe(429, {"Retry-After": "2"})
+    
+    limiter = host_limiter.get_host_limiter(url)
+    assert limiter.in_flight == 0
+    assert limiter.throttled == 1
+    assert limiter.blocked_until > 0
+
+
+def test_host_slot_releases_on_timeout_error(monkeypatch):
+    monkeypatch.setattr(host_limiter, "_limiters", {})
+    url = "https://slot.example.com/search"
+    
+    with pytest.raises(TimeoutError):
+        with host_slot(url):
+            raise TimeoutError("read timed out")
+    
+    limiter = host_limiter.get_host_limiter(url)
+    assert limiter.in_flight == 0
+    assert limiter.timeouts == 1
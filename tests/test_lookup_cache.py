@@ -0,0 +1,92 @@
+"""LookupCache: bulunan / bulunamayan kayıtların süreleri ve boyut sınırı"""
+import types
+
+import pytest
+
+import lookup_cache
+from lookup_cache import LookupCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Önbelleğin gördüğü saati elle ilerletilebilir yapar"""
+    now = types.SimpleNamespace(value=1_000_000.0)
+    monkeypatch.setattr(lookup_cache, "time", types.SimpleNamespace(time=lambda: now.value))
+    return now
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    cache = LookupCache(db_path=str(tmp_path / "cache.sqlite3"), ttl=100, negative_ttl=10, max_entries=3)
+    yield cache
+    cache.close()
+
+
+def count_rows(cache):
+    return cache._conn.execute("SELECT COUNT(*) FROM lookups").fetchone()[0]
+
+
+def test_missing_entry_is_a_miss(cache):
+    assert cache.get("ZARA", "12345678901234") == (False, None)
+    assert cache.misses == 1
+
+
+def test_found_entry_lives_for_ttl(cache, clock):
+    cache.put("ZARA", "12345678901234", "Keten Gömlek", "api")
+    
+    clock.value += 100
+    assert cache.get("ZARA", "12345678901234") == (True, "Keten Gömlek")
+    
+    clock.value += 1
+    assert cache.get("ZARA", "12345678901234") == (False, None)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_not_found_entry_uses_negative_ttl(cache, clock):
+    cache.put("ZARA", "12345678901234", None, "api")
+    
+    clock.value += 10
+    assert cache.get("ZARA", "12345678901234") == (True, None)
+    assert cache.negative_hits == 1
+    
+    # Bulunan ürünlerin süresi dolmamış olsa da "bulunamadı" kaydı tekrar sorgulanır
+    clock.value += 1
+    assert cache.get("ZARA", "12345678901234") == (False, None)
+
+
+def test_brands_do_not_share_entries(cache):
+    cache.put("ZARA", "2104644040", "Zara Ürünü", "api")
+    assert cache.get("BERSHKA", "2104644040") == (False, None)
+
+
+def test_entries_survive_reopen(tmp_path, clock):
+    path = str(tmp_path / "cache.sqlite3")
+    first = LookupCache(db_path=path)
+    first.put("MAVİ", "0010012345", "Jean Pantolon", "html")
+    first.close()
+    
+    second = LookupCache(db_path=path)
+    assert second.get("MAVİ", "0010012345") == (True, "Jean Pantolon")
+    second.close()
+
+
+def test_eviction_drops_oldest_entries_over_limit(cache, clock, monkeypatch):
+    monkeypatch.setattr(lookup_cache, "EVICTION_CHECK_EVERY", 5)
+    for i in range(5):
+        clock.value += 1
+        cache.put("ZARA", f"barcode{i}", f"Ürün {i}", "api")
+    
+    assert count_rows(cache) == 3
+    assert cache.get("ZARA", "barcode0") == (False, None)
+    assert cache.get("ZARA", "barcode1") == (False, None)
+    assert cache.get("ZARA", "barcode4") == (True, "Ürün 4")
+
+
+def test_eviction_drops_expired_entries(cache, clock, monkeypatch):
+    monkeypatch.setattr(lookup_cache, "EVICTION_CHECK_EVERY", 2)
+    cache.put("ZARA", "old-miss", None, "api")
+    clock.value += 11
+    cache.put("ZARA", "fresh", "Ürün", "api")
+    
+    assert count_rows(cache) == 1
+    assert cache.get("ZARA", "fresh") == (True, "Ürün")
@@ -0,0 +1,38 @@
+"""classify_input: karışık kolide girişten aday markaların belirlenmesi"""
+import pytest
+
+from scrapers.mixed_scraper import classify_input
+
+
+@pytest.mark.parametrize("user_input, brands", [
+    ("12345678", ['MANGO']),
+    ("8681234567890", ['MAVİ']),
+    ("12345678901234", ['ZARA', 'BERSHKA', 'MAVİ']),
+    ("1234-5678-9012-34", ['ZARA', 'BERSHKA', 'MAVİ']),
+    ("1234567890", ['H&M', 'BERSHKA', 'MAVİ']),
+    ("  1234567890  ", ['H&M', 'BERSHKA', 'MAVİ']),
+    ("1" * 29, ['H&M']),
+    ("0987654321ABCDEFGHIJ123456789", ['H&M']),
+    ("1234567890123", ['MAVİ']),
+    ("123456789012", ['MAVİ']),
+])
+def test_known_formats(user_input, brands):
+    assert classify_input(user_input) == (brands, None)
+
+
+def test_mango_qr_code():
+    candidates, error = classify_input("https://shop.mango.com/tr/qr?barcode=12345678")
+    assert (candidates, error) == (['MANGO'], None)
+
+
+@pytest.mark.parametrize("user_input", ["123", "123456789"])
+def test_unknown_length_is_rejected(user_input):
+    candidates, error = classify_input(user_input)
+    assert candidates is None
+    assert f"({len(user_input)} hane)" in error
+
+
+def test_text_matching_no_brand_is_rejected():
+    candidates, error = classify_input("merhaba")
+    assert candidates is None
+    assert "hiçbir markanın" in error
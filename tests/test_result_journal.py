@@ -0,0 +1,162 @@
+"""ResultJournal: çökme sonrası kurtarma ve yarıda kalan kaydın tekrarlanmaması"""
+import builtins
+
+import pytest
+
+import main
+import result_journal
+from result_journal import SINK_TXT, SINK_EXCEL, SINK_STATS
+
+
+def recover_single():
+    """Diskte kalan tek oturumu yeniden okur"""
+    journals = result_journal.find_unfinished_sessions()
+    assert len(journals) == 1
+    return journals[0]
+
+
+def test_results_are_recovered_in_scan_order():
+    journal = result_journal.open_session("ZARA")
+    first = result_journal.reserve_order()
+    second = result_journal.reserve_order()
+    # Arka plan aramaları okutma sırasından farklı sırada biter
+    result_journal.record_result("ZARA", "222 ZARA Ürün Bulunamadı", False, second)
+    result_journal.record_result("ZARA", "111 ZARA Gömlek", True, first)
+    result_journal.record_result("ZARA", "333 ZARA Ceket", True)
+    result_journal.end_session()
+    
+    recovered = recover_single()
+    assert recovered.path == journal.path
+    assert recovered.mode == "ZARA"
+    assert recovered.count() == 3
+    assert recovered.results() == {
+        "ZARA": (["111 ZARA Gömlek", "333 ZARA Ceket"], ["222 ZARA Ürün Bulunamadı"])
+    }
+
+
+def test_bulk_orders_keep_duplicates_in_input_order():
+    result_journal.open_session("ZARA")
+    orders = result_journal.reserve_bulk_orders(["b", "a", "b"])
+    result_journal.record_bulk_result("ZARA", "a ZARA A", True, orders["a"])
+    result_journal.record_bulk_result("ZARA", "b ZARA B", True, orders["b"])
+    result_journal.end_session()
+    
+    assert recover_single().results() == {"ZARA": (["b ZARA B", "a ZARA A", "b ZARA B"], [])}
+
+
+def test_truncated_last_line_is_skipped():
+    journal = result_journal.open_session("MANGO")
+    result_journal.record_result("MANGO", "12345678 MANGO Elbise", True)
+    result_journal.end_session()
+    with open(journal.path, 'a', encoding='utf-8') as f:
+        f.write('{"type": "result", "brand": "MAN')
+    
+    assert recover_single().results() == {"MANGO": (["12345678 MANGO Elbise"], [])}
+
+
+def test_no_session_means_nothing_is_recorded():
+    assert result_journal.reserve_order() is None
+    result_journal.record_result("ZARA", "111 ZARA Gömlek", True)
+    assert result_journal.find_unfinished_sessions() == []
+
+
+def test_resumed_session_continues_after_recovered_results():
+    result_journal.open_session("MIXED")
+    result_journal.record_result("ZARA", "111 ZARA Gömlek", True)
+    result_journal.record_result("MANGO", "12345678 MANGO Elbise", True)
+    result_journal.end_session()
+    
+    recovered = recover_single()
+    assert not recovered.save_started()
+    result_journal.resume_session(recovered)
+    result_journal.record_result("ZARA", "222 ZARA Ceket", True)
+    result_journal.end_session()
+    
+    assert recover_single().results()["ZARA"] == (["111 ZARA Gömlek", "222 ZARA Ceket"], [])
+
+
+def test_saved_steps_and_final_lists_survive_reload():
+    result_journal.open_session("ZARA")
+    result_journal.record_result("ZARA", "111 ZARA Ürün Bulunamadı", False)
+    journal = result_journal.end_session()
+    
+    journal.set_final("ZARA", ["111 ZARA Elle Girilen"], [])
+    journal.mark_saved("ZARA", SINK_TXT)
+    
+    recovered = recover_single()
+    assert recovered.save_started()
+    assert recovered.saved_sinks("ZARA") == {SINK_TXT}
+    assert not recovered.is_saved(["ZARA"])
+    assert recovered.results() == {"ZARA": (["111 ZARA Elle Girilen"], [])}
+
+
+class FakeStatistics:
+    def __init__(self):
+        self.searches = []
+    
+    def add_search(self, brand_name, found_count, not_found_count):
+        self.searches.append((brand_name, found_count, not_found_count))
+
+
+@pytest.fixture
+def sinks(monkeypatch):
+    """TXT ve Excel kayıtlarını sayar; Excel'in sonucu testte belirlenir"""
+    calls = []
+    excel_results = []
+    
+    def save_to_txt(found_products, not_found_products, brand_name):
+        calls.append(SINK_TXT)
+        return True
+    
+    def save_to_excel(found_products, not_found_products, brand_name):
+        calls.append(SINK_EXCEL)
+        return excel_results.pop(0)
+    
+    monkeypatch.setattr(main, "save_to_txt", save_to_txt)
+    monkeypatch.setattr(main, "save_to_excel", save_to_excel)
+    monkeypatch.setattr(main, "print_loading", lambda message="": None)
+    return calls, excel_results
+
+
+def test_failed_save_replays_only_missing_steps(sinks, monkeypatch):
+    calls, excel_results = sinks
+    stats = FakeStatistics()
+    
+    result_journal.open_session("ZARA")
+    result_journal.record_result("ZARA", "111 ZARA Gömlek", True)
+    journal = result_journal.end_session()
+    
+    # Excel satırları yazılamadı: TXT ve istatistik tamamlandı olarak işaretlenir
+    excel_results.append(False)
+    found, not_found = journal.results()["ZARA"]
+    assert not main.process_brand_results(found, not_found, "ZARA", stats, journal)
+    assert calls == [SINK_TXT, SINK_EXCEL]
+    
+    # Sonraki açılışta sadece Excel tekrarlanır, manuel düzenleme sorulmaz
+    def no_input(prompt=""):
+        raise AssertionError(f"beklenmeyen soru: {prompt}")
+    monkeypatch.setattr(builtins, "input", no_input)
+    excel_results.append(True)
+    
+    recovered = recover_single()
+    found, not_found = recovered.results()["ZARA"]
+    assert main.process_brand_results(found, not_found, "ZARA", stats, recovered)
+    assert calls == [SINK_TXT, SINK_EXCEL, SINK_EXCEL]
+    assert stats.searches == [("ZARA", 1, 0)]
+    assert recover_single().is_saved(["ZARA"])
+
+
+def test_completed_save_runs_every_step_once(sinks):
+    calls, excel_results = sinks
+    stats = FakeStatistics()
+    
+    result_journal.open_session("MANGO")
+    result_journal.record_result("MANGO", "12345678 MANGO Elbise", True)
+    journal = result_journal.end_session()
+    
+    excel_results.append(True)
+    found, not_found = journal.results()["MANGO"]
+    assert main.process_brand_results(found, not_found, "MANGO", stats, journal)
+    assert calls == [SINK_TXT, SINK_EXCEL]
+    assert stats.searches == [("MANGO", 1, 0)]
+    assert recover_single().saved_sinks("MANGO") == {SINK_TXT, SINK_EXCEL, SINK_STATS}
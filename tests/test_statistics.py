@@ -0,0 +1,94 @@
+"""Statistics: olay günlüğünün özete katlanması ve yeniden yüklenmesi"""
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+import utils
+from utils import Statistics
+
+
+@pytest.fixture
+def compact_every(monkeypatch):
+    monkeypatch.setattr(utils, "STATS_COMPACT_EVERY", 3)
+    return 3
+
+
+def read_events():
+    with open(utils.STATS_EVENTS_FILE, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_searches_are_appended_to_event_log():
+    stats = Statistics()
+    stats.add_search("ZARA", 3, 1)
+    stats.add_search("MANGO", 2, 0)
+    
+    assert [event["brand"] for event in read_events()] == ["ZARA", "MANGO"]
+    assert not os.path.exists(utils.STATS_ROLLUP_FILE)
+    assert stats.get_today_stats()["found"] == 5
+
+
+def test_log_is_compacted_into_rollup(compact_every):
+    stats = Statistics()
+    for _ in range(compact_every):
+        stats.add_search("ZARA", 2, 1)
+    
+    assert read_events() == []
+    assert stats.pending_events == 0
+    with open(utils.STATS_ROLLUP_FILE, 'r', encoding='utf-8') as f:
+        rollup = json.load(f)
+    assert rollup["total"]["searches"] == 3
+    assert rollup["total"]["brands"] == {"ZARA": 3}
+    assert rollup["seq"] == 3
+
+
+def test_reload_combines_rollup_and_log_tail(compact_every):
+    stats = Statistics()
+    for _ in range(compact_every + 1):
+        stats.add_search("H&M", 1, 1)
+    
+    reloaded = Statistics()
+    assert reloaded.stats["total"] == stats.stats["total"]
+    assert reloaded.stats["total"]["searches"] == 4
+    assert reloaded.pending_events == 1
+
+
+def test_events_already_in_rollup_are_not_counted_twice(compact_every):
+    stats = Statistics()
+    for _ in range(compact_every - 1):
+        stats.add_search("ZARA", 1, 0)
+    events = read_events()
+    stats.add_search("ZARA", 1, 0)
+    
+    # Özet yazıldıktan sonra, günlük boşaltılmadan çökme
+    with open(utils.STATS_EVENTS_FILE, 'w', encoding='utf-8') as f:
+        for event in events:
+            f.write(json.dumps(event, ensure_ascii=False) + "\n")
+    
+    assert Statistics().stats["total"]["searches"] == compact_every
+
+
+def test_truncated_last_event_is_skipped():
+    stats = Statistics()
+    stats.add_search("MAVİ", 1, 0)
+    with open(utils.STATS_EVENTS_FILE, 'a', encoding='utf-8') as f:
+        f.write('{"seq": 2, "date"')
+    
+    assert Statistics().stats["total"]["searches"] == 1
+
+
+def test_old_days_are_folded_into_monthly():
+    stats = Statistics()
+    old_day = (datetime.now() - timedelta(days=utils.STATS_DAILY_RETENTION + 40)).strftime("%Y-%m-%d")
+    stats.apply_event(stats.stats, {"seq": 1, "date": old_day, "time": "10:00",
+                                    "brand": "ZARA", "found": 4, "not_found": 1})
+    stats.add_search("ZARA", 1, 0)
+    
+    stats.compact()
+    
+    assert old_day not in stats.stats["daily"]
+    assert stats.stats["monthly"][old_day[:7]]["found"] == 4
+    assert stats.stats["daily"][stats.today]["searches"] == 1
+    assert stats.stats["total"]["searches"] == 2
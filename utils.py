@@ -2,8 +2,9 @@
 Ortak yardımcı fonksiyonlar ve renklendirme sistemi
 """
 import os
+import re
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from colorama import init, Fore, Style, Back
 
 # Colorama'yı başlat
@@ -92,92 +93,185 @@ def print_brand_header(brand_name):
     print(f"{color}{'═' * 65}{Colors.RESET}")
 
 
+# İstatistik dosyaları: küçük bir özet (rollup) + her aramada bir satır eklenen olay günlüğü
+STATS_DIR = os.path.join("outputs", "statistics")
+STATS_ROLLUP_FILE = os.path.join(STATS_DIR, "rollup.json")
+STATS_EVENTS_FILE = os.path.join(STATS_DIR, "events.jsonl")
+LEGACY_STATS_FILE = os.path.join("outputs", "statistics.json")
+STATS_COMPACT_EVERY = 200       # Günlükte bu kadar olay birikince özete katlanır
+STATS_DAILY_RETENTION = 90      # Günlük ayrıntı kaç gün tutulur (eskiler aylık özete katlanır)
+
+
+def empty_counts():
+    """Boş arama sayaçları"""
+    return {
+        "searches": 0,
+        "found": 0,
+        "not_found": 0,
+        "brands": {}
+    }
+
+
+def add_counts(counts, brand_name, found_count, not_found_count, searches=1):
+    """Sayaçlara bir (veya birleştirilmiş birden fazla) aramayı ekler"""
+    counts["searches"] += searches
+    counts["found"] += found_count
+    counts["not_found"] += not_found_count
+    if brand_name is not None:
+        counts["brands"][brand_name] = counts["brands"].get(brand_name, 0) + searches
+
+
+def merge_counts(target, source):
+    """Bir sayaç sözlüğünü diğerine ekler"""
+    add_counts(target, None, source["found"], source["not_found"], source["searches"])
+    for brand_name, count in source["brands"].items():
+        target["brands"][brand_name] = target["brands"].get(brand_name, 0) + count
+
+
 class Statistics:
-    """İstatistik yönetimi"""
+    """
+    İstatistik yönetimi
+    
+    Her arama olay günlüğüne tek satır olarak eklenir; günlük belirli bir boyuta ulaşınca
+    özete (rollup) katlanıp sıfırlanır. Açılışta sadece özet ve günlüğün kuyruğu okunur.
+    """
     
     def __init__(self):
-        self.stats_file = os.path.join("outputs", "statistics.json")
+        self.rollup_file = STATS_ROLLUP_FILE
+        self.events_file = STATS_EVENTS_FILE
         self.today = datetime.now().strftime("%Y-%m-%d")
+        self.pending_events = 0
         self.stats = self.load_stats()
     
-    def load_stats(self):
-        """İstatistikleri yükle"""
-        if os.path.exists(self.stats_file):
-            try:
-                with open(self.stats_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                pass
-        
-        # Varsayılan istatistikler
+    def default_stats(self):
+        """Varsayılan istatistikler"""
         return {
             "daily": {},
-            "total": {
-                "searches": 0,
-                "found": 0,
-                "not_found": 0,
-                "brands": {}
-            },
-            "last_search": None
+            "monthly": {},
+            "total": empty_counts(),
+            "last_search": None,
+            "seq": 0
         }
     
-    def save_stats(self):
-        """İstatistikleri kaydet"""
-        try:
-            os.makedirs(os.path.dirname(self.stats_file), exist_ok=True)
-            with open(self.stats_file, 'w', encoding='utf-8') as f:
-                json.dump(self.stats, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print_warning(f"İstatistik kaydedilemedi: {e}")
-    
-    def add_search(self, brand_name, found_count, not_found_count):
-        """Arama sonucunu ekle"""
-        # Günlük istatistikler
-        if self.today not in self.stats["daily"]:
-            self.stats["daily"][self.today] = {
-                "searches": 0,
-                "found": 0,
-                "not_found": 0,
-                "brands": {}
-            }
+    def load_stats(self):
+        """Özeti yükler ve özetten sonra eklenen olayları üzerine uygular"""
+        stats = self.default_stats()
         
-        # Günlük güncelle
-        self.stats["daily"][self.today]["searches"] += 1
-        self.stats["daily"][self.today]["found"] += found_count
-        self.stats["daily"][self.today]["not_found"] += not_found_count
+        if os.path.exists(self.rollup_file):
+            try:
+                with open(self.rollup_file, 'r', encoding='utf-8') as f:
+                    stats.update(json.load(f))
+            except (OSError, ValueError) as e:
+                print_warning(f"İstatistik özeti okunamadı: {e}")
+        elif os.path.exists(LEGACY_STATS_FILE):
+            stats = self.migrate_legacy(stats)
+        
+        if os.path.exists(self.events_file):
+            with open(self.events_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        # Yarım kalmış son satır (çökme) - atla
+                        continue
+                    # Özete katlanmış ama günlükten silinememiş olaylar iki kez sayılmaz
+                    if event["seq"] <= stats["seq"]:
+                        continue
+                    self.apply_event(stats, event)
+                    self.pending_events += 1
         
-        if brand_name not in self.stats["daily"][self.today]["brands"]:
-            self.stats["daily"][self.today]["brands"][brand_name] = 0
-        self.stats["daily"][self.today]["brands"][brand_name] += 1
+        if self.pending_events >= STATS_COMPACT_EVERY:
+            self.compact(stats)
         
-        # Toplam güncelle
-        self.stats["total"]["searches"] += 1
-        self.stats["total"]["found"] += found_count
-        self.stats["total"]["not_found"] += not_found_count
+        return stats
+    
+    def migrate_legacy(self, stats):
+        """Eski tek dosyalık statistics.json'u özete dönüştürür (bir kez)"""
+        try:
+            with open(LEGACY_STATS_FILE, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+        except (OSError, ValueError):
+            return stats
         
-        if brand_name not in self.stats["total"]["brands"]:
-            self.stats["total"]["brands"][brand_name] = 0
-        self.stats["total"]["brands"][brand_name] += 1
+        stats["daily"] = legacy.get("daily", {})
+        stats["total"] = legacy.get("total", stats["total"])
+        stats["last_search"] = legacy.get("last_search")
         
-        # Son arama
-        self.stats["last_search"] = {
-            "brand": brand_name,
+        self.compact(stats)
+        try:
+            os.replace(LEGACY_STATS_FILE, LEGACY_STATS_FILE + ".migrated")
+        except OSError:
+            pass
+        return stats
+    
+    @staticmethod
+    def apply_event(stats, event):
+        """Tek bir arama olayını bellekteki sayaçlara uygular"""
+        day = stats["daily"].setdefault(event["date"], empty_counts())
+        add_counts(day, event["brand"], event["found"], event["not_found"])
+        add_counts(stats["total"], event["brand"], event["found"], event["not_found"])
+        stats["last_search"] = {
+            "brand": event["brand"],
+            "time": event["time"],
+            "found": event["found"],
+            "not_found": event["not_found"]
+        }
+        stats["seq"] = event["seq"]
+    
+    def compact(self, stats=None):
+        """
+        Bellekteki durumu özet dosyasına yazar ve olay günlüğünü sıfırlar
+        Saklama süresini aşan günler aylık özete katlanır.
+        """
+        stats = stats if stats is not None else self.stats
+        
+        cutoff = (datetime.now() - timedelta(days=STATS_DAILY_RETENTION)).strftime("%Y-%m-%d")
+        for day in sorted(stats["daily"]):
+            if day >= cutoff:
+                break
+            month = stats["monthly"].setdefault(day[:7], empty_counts())
+            merge_counts(month, stats["daily"].pop(day))
+        
+        try:
+            os.makedirs(os.path.dirname(self.rollup_file), exist_ok=True)
+            temp_file = self.rollup_file + ".tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(stats, f, ensure_ascii=False)
+            os.replace(temp_file, self.rollup_file)
+            # Özet yazıldıktan sonra günlük boşaltılır - arada çökerse seq tekrarı önler
+            open(self.events_file, 'w', encoding='utf-8').close()
+            self.pending_events = 0
+        except OSError as e:
+            print_warning(f"İstatistik özeti kaydedilemedi: {e}")
+    
+    def add_search(self, brand_name, found_count, not_found_count):
+        """Arama sonucunu ekle (olay günlüğüne tek satır yazılır)"""
+        event = {
+            "seq": self.stats["seq"] + 1,
+            "date": self.today,
             "time": datetime.now().strftime("%H:%M"),
+            "brand": brand_name,
             "found": found_count,
             "not_found": not_found_count
         }
+        self.apply_event(self.stats, event)
+        
+        try:
+            os.makedirs(os.path.dirname(self.events_file), exist_ok=True)
+            with open(self.events_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+            self.pending_events += 1
+        except OSError as e:
+            print_warning(f"İstatistik kaydedilemedi: {e}")
+            return
         
-        self.save_stats()
+        if self.pending_events >= STATS_COMPACT_EVERY:
+            self.compact()
     
     def get_today_stats(self):
         """Bugünkü istatistikleri getir"""
         if self.today not in self.stats["daily"]:
-            return {
-                "searches": 0,
-                "found": 0,
-                "not_found": 0,
-                "brands": {}
-            }
+            return empty_counts()
         return self.stats["daily"][self.today]
     
     def get_most_searched_brand_today(self):
@@ -259,6 +353,46 @@ def handle_error(error, context=""):
         print_info(f"Konum: {context}")
 
 
+def read_barcode_list(source):
+    """
+    Dosya yolundan veya yapıştırılan metinden barkod listesini okur
+    
+    Args:
+        source (str): Dosya yolu ya da satır/boşluk/virgül ile ayrılmış barkodlar
+    
+    Returns:
+        list: Ham barkodlar (giriş sırasıyla)
+    """
+    source = source.strip().strip('"')
+    
+    if source and "\n" not in source and os.path.isfile(source):
+        with open(source, 'r', encoding='utf-8-sig') as f:
+            source = f.read()
+    
+    return [token for token in re.split(r'[\s,;]+', source) if token]
+
+
+def prompt_bulk_input():
+    """
+    Toplu arama için dosya yolu veya yapıştırılan barkod bloğu ister
+    
+    Returns:
+        list: Ham barkodlar
+    """
+    print("📂 Dosya yolunu girin veya barkodları yapıştırın (bitirmek için boş satır):")
+    
+    lines = []
+    while True:
+        line = input().strip()
+        if not line:
+            break
+        lines.append(line)
+    
+    if len(lines) == 1:
+        return read_barcode_list(lines[0])
+    return read_barcode_list("\n".join(lines))
+
+
 def clear_screen():
     """Ekranı temizle"""
     os.system('cls' if os.name == 'nt' else 'clear')